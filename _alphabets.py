@@ -0,0 +1,1242 @@
+# generated by build_alphabets.py from ICU 72.1, do not edit
+
+alphabets = {
+    "af": (
+        "0041-005A 0061-007A 00C1-00C2 00C8-00CB 00CE-00CF 00D4-00D4 00D6-00D6 "
+        "00DB-00DB 00E1-00E2 00E8-00EB 00EE-00EF 00F4-00F4 00F6-00F6 00FB-00FB "
+        "0130-0131 017F-017F 212A-212A"
+    ),
+    "ar": "0621-063A 0641-0652 0670-0670",
+    "bg": "0410-042A 042C-042C 042E-044A 044C-044C 044E-044F 1C80-1C86",
+    "bn": (
+        "0981-0983 0985-098C 098F-0990 0993-09A8 09AA-09B0 09B2-09B2 09B6-09B9 "
+        "09BC-09C4 09C7-09C8 09CB-09CE 09D7-09D7 09E0-09E3 09FA-09FA"
+    ),
+    "ca": (
+        "0041-005A 0061-007A 00B7-00B7 00C0-00C0 00C7-00C9 00CD-00CD 00CF-00CF "
+        "00D2-00D3 00DA-00DA 00DC-00DC 00E0-00E0 00E7-00E9 00ED-00ED 00EF-00EF "
+        "00F2-00F3 00FA-00FA 00FC-00FC 0130-0131 017F-017F 212A-212A"
+    ),
+    "cs": (
+        "0041-005A 0061-007A 00C1-00C1 00C9-00C9 00CD-00CD 00D3-00D3 00DA-00DA "
+        "00DD-00DD 00E1-00E1 00E9-00E9 00ED-00ED 00F3-00F3 00FA-00FA 00FD-00FD "
+        "010C-010F 011A-011B 0130-0131 0147-0148 0158-0159 0160-0161 0164-0165 "
+        "016E-016F 017D-017F 212A-212A"
+    ),
+    "cy": (
+        "0041-004A 004C-0050 0052-0055 0057-0057 0059-0059 0061-006A 006C-0070 "
+        "0072-0075 0077-0077 0079-0079 00C0-00C2 00C4-00C4 00C8-00CF 00D2-00D4 "
+        "00D6-00D6 00D9-00DD 00E0-00E2 00E4-00E4 00E8-00EF 00F2-00F4 00F6-00F6 "
+        "00F9-00FD 00FF-00FF 0130-0131 0174-0178 017F-017F 1E80-1E85 1EF2-1EF3"
+    ),
+    "da": (
+        "0041-005A 0061-007A 00C5-00C6 00D8-00D8 00E5-00E6 00F8-00F8 0130-0131 "
+        "017F-017F 212A-212B"
+    ),
+    "de": (
+        "0041-005A 0061-007A 00C4-00C4 00D6-00D6 00DC-00DC 00DF-00DF 00E4-00E4 "
+        "00F6-00F6 00FC-00FC 0130-0131 017F-017F 1E9E-1E9E 212A-212A"
+    ),
+    "el": (
+        "00B5-00B5 0345-0345 0386-0386 0388-038A 038C-038C 038E-03A1 03A3-03CE "
+        "03D0-03D1 03D5-03D6 03F0-03F1 03F4-03F5 1FBE-1FBE 1FD3-1FD3 1FE3-1FE3 "
+        "2126-2126"
+    ),
+    "en": "0041-005A 0061-007A 0130-0131 017F-017F 212A-212A",
+    "es": (
+        "0041-005A 0061-007A 00C1-00C1 00C9-00C9 00CD-00CD 00D1-00D1 00D3-00D3 "
+        "00DA-00DA 00DC-00DC 00E1-00E1 00E9-00E9 00ED-00ED 00F1-00F1 00F3-00F3 "
+        "00FA-00FA 00FC-00FC 0130-0131 017F-017F 212A-212A"
+    ),
+    "et": (
+        "0041-005A 0061-007A 00C4-00C4 00D5-00D6 00DC-00DC 00E4-00E4 00F5-00F6 "
+        "00FC-00FC 0130-0131 0160-0161 017D-017F 212A-212A"
+    ),
+    "fa": (
+        "0621-0624 0626-063A 0641-0642 0644-0648 064B-064D 0651-0651 0654-0654 "
+        "067E-067E 0686-0686 0698-0698 06A9-06A9 06AF-06AF 06CC-06CC"
+    ),
+    "fi": (
+        "0041-005A 0061-007A 00C4-00C5 00D6-00D6 00E4-00E5 00F6-00F6 0130-0131 "
+        "0160-0161 017D-017F 212A-212B"
+    ),
+    "fr": (
+        "0041-005A 0061-007A 00C0-00C0 00C2-00C2 00C6-00CB 00CE-00CF 00D4-00D4 "
+        "00D9-00D9 00DB-00DC 00E0-00E0 00E2-00E2 00E6-00EB 00EE-00EF 00F4-00F4 "
+        "00F9-00F9 00FB-00FC 00FF-00FF 0130-0131 0152-0153 0178-0178 017F-017F "
+        "212A-212A"
+    ),
+    "gu": (
+        "0A81-0A83 0A85-0A8B 0A8D-0A8D 0A8F-0A91 0A93-0AA8 0AAA-0AB0 0AB2-0AB3 "
+        "0AB5-0AB9 0ABC-0AC5 0AC7-0AC9 0ACB-0ACD 0AD0-0AD0 0AE0-0AE0"
+    ),
+    "he": "05D0-05EA",
+    "hi": (
+        "0901-0903 0905-090D 090F-0911 0913-0928 092A-0930 0932-0933 0935-0939 "
+        "093C-0943 0945-0945 0947-0949 094B-094D 0950-0950"
+    ),
+    "hr": (
+        "0041-0050 0052-0056 005A-005A 0061-0070 0072-0076 007A-007A 0106-0107 "
+        "010C-010D 0110-0111 0130-0131 0160-0161 017D-017F 212A-212A"
+    ),
+    "hu": (
+        "0041-0050 0052-0056 0059-005A 0061-0070 0072-0076 0079-007A 00C1-00C1 "
+        "00C9-00C9 00CD-00CD 00D3-00D3 00D6-00D6 00DA-00DA 00DC-00DC 00E1-00E1 "
+        "00E9-00E9 00ED-00ED 00F3-00F3 00F6-00F6 00FA-00FA 00FC-00FC 0130-0131 "
+        "0150-0151 0170-0171 017F-017F 212A-212A"
+    ),
+    "id": "0041-005A 0061-007A 0130-0131 017F-017F 212A-212A",
+    "it": (
+        "0041-005A 0061-007A 00C0-00C0 00C8-00C9 00CC-00CC 00D2-00D3 00D9-00D9 "
+        "00E0-00E0 00E8-00E9 00EC-00EC 00F2-00F3 00F9-00F9 0130-0131 017F-017F "
+        "212A-212A"
+    ),
+    "ja": (
+        "3005-3005 3041-3093 309D-309E 30A1-30F6 30FC-30FE 4E00-4E01 4E03-4E03 "
+        "4E07-4E0B 4E0D-4E0E 4E14-4E14 4E16-4E16 4E18-4E19 4E21-4E21 4E26-4E26 "
+        "4E2D-4E2D 4E32-4E32 4E38-4E39 4E3B-4E3C 4E45-4E45 4E4F-4E4F 4E57-4E57 "
+        "4E59-4E59 4E5D-4E5E 4E71-4E71 4E73-4E73 4E7E-4E7E 4E80-4E80 4E86-4E86 "
+        "4E88-4E89 4E8B-4E8C 4E92-4E92 4E94-4E95 4E9C-4E9C 4EA1-4EA1 4EA4-4EA4 "
+        "4EAB-4EAD 4EBA-4EBA 4EC1-4EC1 4ECA-4ECB 4ECF-4ECF 4ED5-4ED6 4ED8-4ED9 "
+        "4EE3-4EE5 4EEE-4EEE 4EF0-4EF0 4EF2-4EF2 4EF6-4EF6 4EFB-4EFB 4F01-4F01 "
+        "4F0E-4F11 4F1A-4F1A 4F1D-4F1D 4F2F-4F2F 4F34-4F34 4F38-4F38 4F3A-4F3A "
+        "4F3C-4F3C 4F46-4F46 4F4D-4F50 4F53-4F53 4F55-4F55 4F59-4F59 4F5C-4F5C "
+        "4F73-4F73 4F75-4F75 4F7F-4F7F 4F8B-4F8B 4F8D-4F8D 4F9B-4F9B 4F9D-4F9D "
+        "4FA1-4FA1 4FAE-4FAF 4FB5-4FB6 4FBF-4FBF 4FC2-4FC3 4FCA-4FCA 4FD7-4FD7 "
+        "4FDD-4FDD 4FE1-4FE1 4FEE-4FEE 4FF3-4FF3 4FF5-4FF5 4FF8-4FF8 4FFA-4FFA "
+        "5009-5009 500B-500B 500D-500D 5012-5012 5019-5019 501F-501F 5023-5024 "
+        "502B-502B 5039-5039 5049-5049 504F-504F 505C-505C 5065-5065 5074-5076 "
+        "507D-507D 508D-508D 5091-5091 5098-5099 50AC-50AC 50B2-50B2 50B5-50B5 "
+        "50B7-50B7 50BE-50BE 50C5-50C5 50CD-50CD 50CF-50CF 50D5-50D5 50DA-50DA "
+        "50E7-50E7 5100-5100 5104-5104 5112-5112 511F-511F 512A-512A 5143-5146 "
+        "5148-5149 514B-514B 514D-514D 5150-5150 515A-515A 5165-5165 5168-5168 "
+        "516B-516D 5171-5171 5175-5175 5177-5178 517C-517C 5185-5186 518A-518A "
+        "518D-518D 5192-5192 5197-5197 5199-5199 51A0-51A0 51A5-51A5 51AC-51AC "
+        "51B6-51B7 51C4-51C4 51C6-51C6 51CD-51CD 51DD-51DD 51E1-51E1 51E6-51E6 "
+        "51F6-51F6 51F8-51FA 5200-5200 5203-5203 5206-5208 520A-520A 5211-5211 "
+        "5217-5217 521D-521D 5224-5225 5229-5229 5230-5230 5236-523B 5247-5247 "
+        "524A-524A 524D-524D 5256-5256 525B-525B 5263-5265 526F-5270 5272-5272 "
+        "5275-5275 5287-5287 529B-529B 529F-52A0 52A3-52A3 52A9-52AA 52B1-52B1 "
+        "52B4-52B4 52B9-52B9 52BE-52BE 52C3-52C3 52C5-52C5 52C7-52C7 52C9-52C9 "
+        "52D5-52D5 52D8-52D9 52DD-52DD 52DF-52DF 52E2-52E2 52E4-52E4 52E7-52E7 "
+        "52F2-52F2 52FE-52FE 5302-5302 5305-5305 5316-5317 5320-5320 5339-533B "
+        "533F-533F 5341-5341 5343-5343 5347-5348 534A-534A 5351-5354 5357-5358 "
+        "535A-535A 5360-5360 5370-5371 5373-5375 5378-5378 5384-5384 5398-5398 "
+        "539A-539A 539F-539F 53B3-53B3 53BB-53BB 53C2-53C2 53C8-53C8 53CA-53CE "
+        "53D4-53D4 53D6-53D7 53D9-53D9 53E3-53E5 53EB-53EC 53EF-53F3 53F7-53F8 "
+        "5404-5404 5408-5409 540C-5411 541B-541B 541F-541F 5426-5426 542B-542B "
+        "5438-5439 5442-5442 5448-544A 5468-5468 546A-546A 5473-5473 547C-547D "
+        "548C-548C 54B2-54B2 54BD-54BD 54C0-54C1 54E1-54E1 54F2-54F2 54FA-54FA "
+        "5504-5504 5506-5507 5510-5510 552F-552F 5531-5531 553E-553E 5546-5546 "
+        "554F-554F 5553-5553 5584-5584 5589-5589 559A-559A 559C-559D 55A9-55AB "
+        "55B6-55B6 55C5-55C5 55E3-55E3 5606-5606 5631-5632 5668-5668 5674-5674 "
+        "5687-5687 56DA-56DB 56DE-56DE 56E0-56E0 56E3-56E3 56F0-56F0 56F2-56F3 "
+        "56FA-56FA 56FD-56FD 570F-570F 5712-5712 571F-571F 5727-5728 5730-5730 "
+        "5742-5742 5747-5747 574A-574A 5751-5751 576A-576A 5782-5782 578B-578B "
+        "57A3-57A3 57CB-57CB 57CE-57CE 57DF-57DF 57F7-57F7 57F9-57FA 57FC-57FC "
+        "5800-5800 5802-5802 5805-5806 5815-5815 5824-5824 582A-582A 5831-5831 "
+        "5834-5834 5840-5841 584A-584A 5851-5851 5854-5854 5857-5857 585A-585A "
+        "585E-585E 5869-5869 586B-586B 587E-587E 5883-5883 5893-5893 5897-5897 "
+        "589C-589C 58A8-58A8 58B3-58B3 58BE-58BE 58C1-58C1 58C7-58C7 58CA-58CA "
+        "58CC-58CC 58EB-58EB 58EE-58EE 58F0-58F2 5909-5909 590F-590F 5915-5916 "
+        "591A-591A 591C-591C 5922-5922 5927-5927 5929-592B 592E-592E 5931-5931 "
+        "5947-5949 594F-594F 5951-5951 5954-5954 5965-5965 5968-5968 596A-596A "
+        "596E-596E 5973-5974 597D-597D 5982-5984 598A-598A 5996-5996 5999-5999 "
+        "59A5-59A5 59A8-59A8 59AC-59AC 59B9-59B9 59BB-59BB 59C9-59C9 59CB-59CB "
+        "59D3-59D4 59EB-59EB 59FB-59FB 59FF-59FF 5A01-5A01 5A18-5A18 5A20-5A20 "
+        "5A2F-5A2F 5A46-5A46 5A5A-5A5A 5A66-5A66 5A7F-5A7F 5A92-5A92 5A9B-5A9B "
+        "5AC1-5AC1 5AC9-5AC9 5ACC-5ACC 5AE1-5AE1 5B22-5B22 5B50-5B50 5B54-5B54 "
+        "5B57-5B58 5B5D-5B5D 5B63-5B64 5B66-5B66 5B6B-5B6B 5B85-5B85 5B87-5B89 "
+        "5B8C-5B8C 5B97-5B9D 5B9F-5B9F 5BA2-5BA4 5BAE-5BAE 5BB0-5BB0 5BB3-5BB6 "
+        "5BB9-5BB9 5BBF-5BBF 5BC2-5BC2 5BC4-5BC4 5BC6-5BC6 5BCC-5BCC 5BD2-5BD2 "
+        "5BDB-5BDB 5BDD-5BDD 5BDF-5BDF 5BE1-5BE1 5BE7-5BE7 5BE9-5BE9 5BEE-5BEE "
+        "5BF8-5BF8 5BFA-5BFA 5BFE-5BFF 5C01-5C02 5C04-5C04 5C06-5C06 5C09-5C0B "
+        "5C0E-5C0F 5C11-5C11 5C1A-5C1A 5C31-5C31 5C3A-5C40 5C45-5C45 5C48-5C48 "
+        "5C4A-5C4B 5C55-5C55 5C5E-5C5E 5C64-5C65 5C6F-5C6F 5C71-5C71 5C90-5C90 "
+        "5CA1-5CA1 5CA9-5CA9 5CAC-5CAC 5CB3-5CB3 5CB8-5CB8 5CE0-5CE1 5CF0-5CF0 "
+        "5CF6-5CF6 5D07-5D07 5D0E-5D0E 5D16-5D16 5D29-5D29 5D50-5D50 5DDD-5DDE "
+        "5DE1-5DE1 5DE3-5DE3 5DE5-5DE8 5DEE-5DEE 5DF1-5DF1 5DFB-5DFB 5DFE-5DFE "
+        "5E02-5E03 5E06-5E06 5E0C-5E0C 5E1D-5E1D 5E25-5E25 5E2B-5E2B 5E2D-5E2D "
+        "5E2F-5E30 5E33-5E33 5E38-5E38 5E3D-5E3D 5E45-5E45 5E55-5E55 5E63-5E63 "
+        "5E72-5E74 5E78-5E79 5E7B-5E7E 5E81-5E81 5E83-5E83 5E8A-5E8A 5E8F-5E8F "
+        "5E95-5E95 5E97-5E97 5E9C-5E9C 5EA6-5EA7 5EAB-5EAB 5EAD-5EAD 5EB6-5EB8 "
+        "5EC3-5EC3 5EC9-5ECA 5EF6-5EF7 5EFA-5EFA 5F01-5F01 5F04-5F04 5F0A-5F0A "
+        "5F0F-5F10 5F13-5F15 5F1F-5F1F 5F25-5F27 5F31-5F31 5F35-5F35 5F37-5F37 "
+        "5F3E-5F3E 5F53-5F53 5F59-5F59 5F62-5F62 5F69-5F69 5F6B-5F6B 5F70-5F71 "
+        "5F79-5F79 5F7C-5F7C 5F80-5F81 5F84-5F85 5F8B-5F8C 5F90-5F90 5F92-5F93 "
+        "5F97-5F97 5FA1-5FA1 5FA9-5FAA 5FAE-5FAE 5FB3-5FB4 5FB9-5FB9 5FC3-5FC3 "
+        "5FC5-5FC5 5FCC-5FCD 5FD7-5FD9 5FDC-5FDC 5FE0-5FE0 5FEB-5FEB 5FF5-5FF5 "
+        "6012-6012 6016-6016 601D-601D 6020-6020 6025-6025 6027-6028 602A-602A "
+        "604B-604B 6050-6050 6052-6052 6063-6063 6065-6065 6068-6069 606D-606D "
+        "606F-606F 6075-6075 6094-6094 609F-60A0 60A3-60A3 60A6-60A6 60A9-60AA "
+        "60B2-60B2 60BC-60BC 60C5-60C5 60D1-60D1 60DC-60DC 60E7-60E8 60F0-60F0 "
+        "60F3-60F3 6101-6101 6109-6109 610F-610F 611A-611B 611F-611F 6144-6144 "
+        "6148-6148 614B-614C 614E-614E 6155-6155 6162-6163 6168-6168 616E-616E "
+        "6170-6170 6176-6176 6182-6182 618E-618E 61A4-61A4 61A7-61A7 61A9-61A9 "
+        "61AC-61AC 61B2-61B2 61B6-61B6 61BE-61BE 61C7-61C7 61D0-61D0 61F2-61F2 "
+        "61F8-61F8 6210-6212 621A-621A 6226-6226 622F-622F 6234-6234 6238-6238 "
+        "623B-623B 623F-6240 6247-6247 6249-6249 624B-624B 624D-624D 6253-6253 "
+        "6255-6255 6271-6271 6276-6276 6279-6279 627F-6280 6284-6284 628A-628A "
+        "6291-6291 6295-6295 6297-6298 629C-629C 629E-629E 62AB-62AB 62B1-62B1 "
+        "62B5-62B5 62B9-62B9 62BC-62BD 62C5-62C5 62C9-62C9 62CD-62CD 62D0-62D0 "
+        "62D2-62D3 62D8-62D9 62DB-62DB 62DD-62DD 62E0-62E1 62EC-62ED 62F3-62F3 "
+        "62F6-62F7 62FE-62FE 6301-6301 6307-6307 6311-6311 6319-6319 631F-631F "
+        "6328-6328 632B-632B 632F-632F 633F-633F 6349-6349 6355-6355 6357-6357 "
+        "635C-635C 6368-6368 636E-636E 637B-637B 6383-6383 6388-6388 638C-638C "
+        "6392-6392 6398-6398 639B-639B 63A1-63A2 63A5-63A5 63A7-63A8 63AA-63AA "
+        "63B2-63B2 63CF-63D0 63DA-63DB 63E1-63E1 63EE-63EE 63F4-63F4 63FA-63FA "
+        "640D-640D 642C-642D 643A-643A 643E-643E 6442-6442 6458-6458 6469-6469 "
+        "646F-646F 6483-6483 64A4-64A4 64AE-64AE 64B2-64B2 64C1-64C1 64CD-64CD "
+        "64E6-64E6 64EC-64EC 652F-652F 6539-6539 653B-653B 653E-653F 6545-6545 "
+        "654F-654F 6551-6551 6557-6557 6559-6559 6562-6563 656C-656C 6570-6570 "
+        "6574-6575 6577-6577 6587-6587 6589-6589 658E-658E 6591-6591 6597-6597 "
+        "6599-6599 659C-659C 65A4-65A5 65AC-65AD 65B0-65B0 65B9-65B9 65BD-65BD "
+        "65C5-65C5 65CB-65CB 65CF-65CF 65D7-65D7 65E2-65E2 65E5-65E9 65EC-65EC "
+        "65FA-65FA 6606-6607 660E-660E 6613-6614 661F-6620 6625-6625 6627-6628 "
+        "662D-662D 662F-662F 663C-663C 6642-6642 6669-6669 666E-666F 6674-6674 "
+        "6676-6676 6681-6681 6687-6687 6691-6691 6696-6697 66A6-66A6 66AB-66AB "
+        "66AE-66AE 66B4-66B4 66C7-66C7 66D6-66D6 66DC-66DC 66F2-66F2 66F4-66F4 "
+        "66F8-66F9 66FD-66FD 66FF-6700 6708-6709 670D-670D 6715-6715 6717-6717 "
+        "671B-671B 671D-671D 671F-671F 6728-6728 672A-672D 6731-6731 6734-6734 "
+        "673A-673A 673D-673D 6749-6749 6750-6751 675F-675F 6761-6761 6765-6765 "
+        "676F-676F 6771-6771 677E-677F 6790-6790 6795-6795 6797-6797 679A-679A "
+        "679C-679D 67A0-67A0 67A2-67A2 67AF-67AF 67B6-67B6 67C4-67C4 67D0-67D0 "
+        "67D3-67D4 67F1-67F1 67F3-67F3 67F5-67F5 67FB-67FB 67FF-67FF 6803-6804 "
+        "6813-6813 6821-6821 682A-682A 6838-6839 683C-683D 6841-6841 6843-6843 "
+        "6848-6848 6851-6851 685C-685C 685F-685F 6885-6885 6897-6897 68A8-68A8 "
+        "68B0-68B0 68C4-68C4 68CB-68CB 68D2-68D2 68DA-68DA 68DF-68DF 68EE-68EE "
+        "68FA-68FA 6905-6905 690D-690E 691C-691C 696D-696D 6975-6975 6977-6977 "
+        "697C-697D 6982-6982 69CB-69CB 69D8-69D8 69FD-69FD 6A19-6A19 6A21-6A21 "
+        "6A29-6A2A 6A39-6A39 6A4B-6A4B 6A5F-6A5F 6B04-6B04 6B20-6B21 6B27-6B27 "
+        "6B32-6B32 6B3A-6B3A 6B3E-6B3E 6B4C-6B4C 6B53-6B53 6B62-6B63 6B66-6B66 "
+        "6B69-6B69 6B6F-6B6F 6B73-6B74 6B7B-6B7B 6B89-6B8B 6B96-6B96 6BB4-6BB5 "
+        "6BBA-6BBB 6BBF-6BC0 6BCD-6BCE 6BD2-6BD2 6BD4-6BD4 6BDB-6BDB 6C0F-6C0F "
+        "6C11-6C11 6C17-6C17 6C34-6C34 6C37-6C38 6C3E-6C3E 6C41-6C42 6C4E-6C4E "
+        "6C57-6C57 6C5A-6C5A 6C5F-6C60 6C70-6C70 6C7A-6C7A 6C7D-6C7D 6C83-6C83 "
+        "6C88-6C88 6C96-6C96 6C99-6C99 6CA1-6CA2 6CB3-6CB3 6CB8-6CB9 6CBB-6CBC "
+        "6CBF-6CBF 6CC1-6CC1 6CC9-6CCA 6CCC-6CCC 6CD5-6CD5 6CE1-6CE3 6CE5-6CE5 "
+        "6CE8-6CE8 6CF0-6CF0 6CF3-6CF3 6D0B-6D0B 6D17-6D17 6D1E-6D1E 6D25-6D25 "
+        "6D2A-6D2A 6D3B-6D3B 6D3E-6D3E 6D41-6D41 6D44-6D45 6D5C-6D5C 6D66-6D66 "
+        "6D6A-6D6A 6D6E-6D6E 6D74-6D74 6D77-6D78 6D88-6D88 6D99-6D99 6DAF-6DAF "
+        "6DB2-6DB2 6DBC-6DBC 6DD1-6DD1 6DE1-6DE1 6DEB-6DEB 6DF1-6DF1 6DF7-6DF7 "
+        "6DFB-6DFB 6E05-6E05 6E07-6E09 6E0B-6E0B 6E13-6E13 6E1B-6E1B 6E21-6E21 "
+        "6E26-6E26 6E29-6E29 6E2C-6E2C 6E2F-6E2F 6E56-6E56 6E67-6E67 6E6F-6E6F "
+        "6E7E-6E80 6E90-6E90 6E96-6E96 6E9D-6E9D 6EB6-6EB6 6EBA-6EBA 6EC5-6EC5 "
+        "6ECB-6ECB 6ED1-6ED1 6EDD-6EDE 6EF4-6EF4 6F01-6F02 6F06-6F06 6F0F-6F0F "
+        "6F14-6F14 6F20-6F20 6F22-6F22 6F2B-6F2C 6F38-6F38 6F54-6F54 6F5C-6F5C "
+        "6F5F-6F5F 6F64-6F64 6F6E-6F6E 6F70-6F70 6F84-6F84 6FC0-6FC1 6FC3-6FC3 "
+        "6FEB-6FEB 6FEF-6FEF 702C-702C 706B-706B 706F-7070 707D-707D 7089-708A "
+        "708E-708E 70AD-70AD 70B9-70BA 70C8-70C8 7121-7121 7126-7126 7136-7136 "
+        "713C-713C 714E-714E 7159-7159 7167-7167 7169-7169 716E-716E 718A-718A "
+        "719F-719F 71B1-71B1 71C3-71C3 71E5-71E5 7206-7206 722A-722A 7235-7236 "
+        "723D-723D 7247-7248 7259-7259 725B-725B 7267-7267 7269-7269 7272-7272 "
+        "7279-7279 72A0-72A0 72AC-72AC 72AF-72AF 72B6-72B6 72C2-72C2 72D9-72D9 "
+        "72E9-72E9 72EC-72ED 731B-731B 731F-731F 732B-732B 732E-732E 7336-7336 "
+        "733F-733F 7344-7344 7363-7363 7372-7372 7384-7384 7387-7387 7389-7389 "
+        "738B-738B 73A9-73A9 73CD-73CD 73E0-73E0 73ED-73ED 73FE-73FE 7403-7403 "
+        "7406-7406 7434-7434 7460-7460 7483-7483 74A7-74A7 74B0-74B0 74BD-74BD "
+        "74E6-74E6 74F6-74F6 7518-7518 751A-751A 751F-751F 7523-7523 7528-7528 "
+        "7530-7533 7537-7537 753A-753B 754C-754C 754F-754F 7551-7551 7554-7554 "
+        "7559-7559 755C-755D 7565-7565 756A-756A 7570-7570 7573-7573 757F-757F "
+        "758E-758E 7591-7591 75AB-75AB 75B2-75B2 75BE-75BE 75C5-75C5 75C7-75C7 "
+        "75D5-75D5 75D8-75D8 75DB-75DB 75E2-75E2 75E9-75E9 75F4-75F4 760D-760D "
+        "7642-7642 7652-7652 7656-7656 767A-767B 767D-767E 7684-7684 7686-7687 "
+        "76AE-76AE 76BF-76BF 76C6-76C6 76CA-76CA 76D7-76D7 76DB-76DB 76DF-76DF "
+        "76E3-76E4 76EE-76EE 76F2-76F2 76F4-76F4 76F8-76F8 76FE-76FE 7701-7701 "
+        "7709-7709 770B-770C 771F-7720 773A-773A 773C-773C 7740-7740 7761-7761 "
+        "7763-7763 7766-7766 77AC-77AD 77B3-77B3 77DB-77DB 77E2-77E2 77E5-77E5 "
+        "77ED-77ED 77EF-77EF 77F3-77F3 7802-7802 7814-7815 7832-7832 7834-7834 "
+        "785D-785D 786B-786C 7881-7881 7891-7891 78BA-78BA 78C1-78C1 78E8-78E8 "
+        "7901-7901 790E-790E 793A-793A 793C-793C 793E-793E 7948-7949 7956-7956 "
+        "795D-795E 7965-7965 7968-7968 796D-796D 7981-7981 7985-7985 798D-798D "
+        "798F-798F 79C0-79C1 79CB-79CB 79D1-79D2 79D8-79D8 79DF-79DF 79E9-79E9 "
+        "79F0-79F0 79FB-79FB 7A0B-7A0B 7A0E-7A0E 7A1A-7A1A 7A2E-7A2E 7A32-7A32 "
+        "7A3C-7A3D 7A3F-7A40 7A42-7A42 7A4D-7A4D 7A4F-7A4F 7A6B-7A6B 7A74-7A74 "
+        "7A76-7A76 7A7A-7A7A 7A81-7A81 7A83-7A83 7A92-7A93 7A9F-7A9F 7AAE-7AAF "
+        "7ACB-7ACB 7ADC-7ADC 7AE0-7AE0 7AE5-7AE5 7AEF-7AEF 7AF6-7AF6 7AF9-7AF9 "
+        "7B11-7B11 7B1B-7B1B 7B26-7B26 7B2C-7B2C 7B46-7B46 7B49-7B49 7B4B-7B4B "
+        "7B52-7B52 7B54-7B54 7B56-7B56 7B87-7B87 7B8B-7B8B 7B97-7B97 7BA1-7BA1 "
+        "7BB1-7BB1 7BB8-7BB8 7BC0-7BC0 7BC4-7BC4 7BC9-7BC9 7BE4-7BE4 7C21-7C21 "
+        "7C3F-7C3F 7C4D-7C4D 7C60-7C60 7C73-7C73 7C89-7C89 7C8B-7C8B 7C92-7C92 "
+        "7C97-7C98 7C9B-7C9B 7CA7-7CA7 7CBE-7CBE 7CD6-7CD6 7CE7-7CE7 7CF8-7CF8 "
+        "7CFB-7CFB 7CFE-7CFE 7D00-7D00 7D04-7D05 7D0B-7D0B 7D0D-7D0D 7D14-7D14 "
+        "7D19-7D1B 7D20-7D22 7D2B-7D2B 7D2F-7D30 7D33-7D33 7D39-7D3A 7D42-7D42 "
+        "7D44-7D44 7D4C-7D4C 7D50-7D50 7D5E-7D5E 7D61-7D61 7D66-7D66 7D71-7D71 "
+        "7D75-7D76 7D79-7D79 7D99-7D9A 7DAD-7DAD 7DB1-7DB2 7DBB-7DBB 7DBF-7DBF "
+        "7DCA-7DCA 7DCF-7DCF 7DD1-7DD2 7DDA-7DDA 7DE0-7DE0 7DE8-7DE9 7DEF-7DEF "
+        "7DF4-7DF4 7DFB-7DFB 7E01-7E01 7E04-7E04 7E1B-7E1B 7E26-7E26 7E2B-7E2B "
+        "7E2E-7E2E 7E3E-7E3E 7E41-7E41 7E4A-7E4A 7E54-7E55 7E6D-7E6D 7E70-7E70 "
+        "7F36-7F36 7F6A-7F6A 7F6E-7F6E 7F70-7F70 7F72-7F72 7F75-7F75 7F77-7F77 "
+        "7F85-7F85 7F8A-7F8A 7F8E-7F8E 7F9E-7F9E 7FA4-7FA4 7FA8-7FA9 7FBD-7FBD "
+        "7FC1-7FC1 7FCC-7FCC 7FD2-7FD2 7FFB-7FFC 8001-8001 8003-8003 8005-8005 "
+        "8010-8010 8015-8015 8017-8017 8033-8033 8056-8056 805E-805E 8074-8074 "
+        "8077-8077 8089-8089 808C-808C 8096-8096 8098-8098 809D-809D 80A1-80A2 "
+        "80A5-80A5 80A9-80AA 80AF-80AF 80B2-80B2 80BA-80BA 80C3-80C3 80C6-80C6 "
+        "80CC-80CC 80CE-80CE 80DE-80DE 80F4-80F4 80F8-80F8 80FD-80FD 8102-8102 "
+        "8105-8105 8107-8108 810A-810A 811A-811A 8131-8131 8133-8133 814E-814E "
+        "8150-8150 8155-8155 816B-816B 8170-8170 8178-817A 819A-819A 819C-819D "
+        "81A8-81A8 81B3-81B3 81C6-81C6 81D3-81D3 81E3-81E3 81E8-81E8 81EA-81EA "
+        "81ED-81ED 81F3-81F4 81FC-81FC 8208-8208 820C-820C 820E-820E 8217-8217 "
+        "821E-821F 822A-822A 822C-822C 8236-8237 8239-8239 8247-8247 8266-8266 "
+        "826F-826F 8272-8272 8276-8276 828B-828B 829D-829D 82AF-82AF 82B1-82B1 "
+        "82B3-82B3 82B8-82B8 82BD-82BD 82D7-82D7 82DB-82DB 82E5-82E6 82F1-82F1 "
+        "8302-8302 830E-830E 8328-8328 8336-8336 8349-8349 8352-8352 8358-8358 "
+        "8377-8377 83CA-83CA 83CC-83CC 83D3-83D3 83DC-83DC 83EF-83EF 840E-840E "
+        "843D-843D 8449-8449 8457-8457 845B-845B 846C-846C 84B8-84B8 84C4-84C4 "
+        "84CB-84CB 8511-8511 8535-8535 853D-853D 8584-8584 85A6-85A6 85AA-85AC "
+        "85CD-85CD 85E4-85E4 85E9-85E9 85FB-85FB 864E-864E 8650-8650 865A-865A "
+        "865C-865C 865E-865E 866B-866B 8679-8679 868A-868A 8695-8695 86C7-86C7 "
+        "86CD-86CD 86EE-86EE 8702-8702 871C-871C 878D-878D 8840-8840 8846-8846 "
+        "884C-884C 8853-8853 8857-8857 885B-885B 885D-885D 8861-8861 8863-8863 "
+        "8868-8868 8870-8870 8877-8877 888B-888B 8896-8896 88AB-88AB 88C1-88C2 "
+        "88C5-88C5 88CF-88CF 88D5-88D5 88DC-88DC 88F8-88F8 88FD-88FE 8907-8907 "
+        "8910-8910 8912-8912 895F-895F 8972-8972 897F-897F 8981-8981 8986-8987 "
+        "898B-898B 898F-898F 8996-8996 899A-899A 89A7-89A7 89AA-89AA 89B3-89B3 "
+        "89D2-89D2 89E3-89E3 89E6-89E6 8A00-8A00 8A02-8A03 8A08-8A08 8A0E-8A0E "
+        "8A13-8A13 8A17-8A18 8A1F-8A1F 8A2A-8A2A 8A2D-8A2D 8A31-8A31 8A33-8A34 "
+        "8A3A-8A3A 8A3C-8A3C 8A50-8A50 8A54-8A55 8A5E-8A5E 8A60-8A60 8A63-8A63 "
+        "8A66-8A66 8A69-8A69 8A6E-8A6E 8A70-8A73 8A87-8A87 8A89-8A89 8A8C-8A8D "
+        "8A93-8A93 8A95-8A95 8A98-8A98 8A9E-8A9E 8AA0-8AA0 8AA4-8AA4 8AAC-8AAD "
+        "8AB0-8AB0 8AB2-8AB2 8ABF-8ABF 8AC7-8AC7 8ACB-8ACB 8AD6-8AD6 8AE6-8AE7 "
+        "8AED-8AEE 8AF8-8AF8 8AFE-8AFE 8B00-8B01 8B04-8B04 8B0E-8B0E 8B19-8B19 "
+        "8B1B-8B1B 8B1D-8B1D 8B21-8B21 8B39-8B39 8B58-8B58 8B5C-8B5C 8B66-8B66 "
+        "8B70-8B70 8B72-8B72 8B77-8B77 8C37-8C37 8C46-8C46 8C4A-8C4A 8C5A-8C5A "
+        "8C61-8C61 8C6A-8C6A 8C8C-8C8C 8C9D-8C9E 8CA0-8CA2 8CA7-8CAC 8CAF-8CAF "
+        "8CB4-8CB4 8CB7-8CB8 8CBB-8CBC 8CBF-8CC0 8CC2-8CC4 8CC7-8CC7 8CCA-8CCA "
+        "8CD3-8CD3 8CDB-8CDC 8CDE-8CDE 8CE0-8CE0 8CE2-8CE2 8CE6-8CE6 8CEA-8CEA "
+        "8CED-8CED 8CFC-8CFC 8D08-8D08 8D64-8D64 8D66-8D66 8D70-8D70 8D74-8D74 "
+        "8D77-8D77 8D85-8D85 8D8A-8D8A 8DA3-8DA3 8DB3-8DB3 8DDD-8DDD 8DE1-8DE1 "
+        "8DEF-8DEF 8DF3-8DF3 8DF5-8DF5 8E0A-8E0A 8E0F-8E0F 8E2A-8E2A 8E74-8E74 "
+        "8E8D-8E8D 8EAB-8EAB 8ECA-8ECA 8ECC-8ECD 8ED2-8ED2 8EDF-8EDF 8EE2-8EE2 "
+        "8EF8-8EF8 8EFD-8EFD 8F03-8F03 8F09-8F09 8F1D-8F1D 8F29-8F2A 8F38-8F38 "
+        "8F44-8F44 8F9B-8F9B 8F9E-8F9E 8FA3-8FA3 8FB1-8FB2 8FBA-8FBA 8FBC-8FBC "
+        "8FC5-8FC5 8FCE-8FCE 8FD1-8FD1 8FD4-8FD4 8FEB-8FEB 8FED-8FED 8FF0-8FF0 "
+        "8FF7-8FF7 8FFD-8FFD 9000-9001 9003-9003 9006-9006 900F-9010 9013-9014 "
+        "901A-901A 901D-901D 901F-9020 9023-9023 902E-902E 9031-9032 9038-9038 "
+        "9042-9042 9045-9045 9047-9047 904A-904B 904D-904E 9053-9055 905C-905C "
+        "9060-9061 9063-9063 9069-9069 906D-906E 9075-9075 9077-9078 907A-907A "
+        "907F-907F 9084-9084 90A3-90A3 90A6-90A6 90AA-90AA 90B8-90B8 90CA-90CA "
+        "90CE-90CE 90E1-90E1 90E8-90E8 90ED-90ED 90F5-90F5 90F7-90F7 90FD-90FD "
+        "914C-914E 9152-9152 9154-9154 9162-9162 916A-916A 916C-916C 9175-9175 "
+        "9177-9178 9192-9192 919C-919C 91B8-91B8 91C7-91C8 91CC-91CF 91D1-91D1 "
+        "91DC-91DD 91E3-91E3 920D-920D 9234-9234 9244-9244 925B-925B 9262-9262 "
+        "9271-9271 9280-9280 9283-9283 9285-9285 9298-9298 92AD-92AD 92ED-92ED "
+        "92F3-92F3 92FC-92FC 9320-9320 9326-9326 932C-932C 932E-932F 9332-9332 "
+        "934B-934B 935B-935B 9375-9375 938C-938C 9396-9396 93AE-93AE 93E1-93E1 "
+        "9418-9418 9451-9451 9577-9577 9580-9580 9589-9589 958B-958B 9591-9591 "
+        "9593-9593 95A2-95A3 95A5-95A5 95B2-95B2 95C7-95C7 95D8-95D8 961C-961C "
+        "962A-962A 9632-9632 963B-963B 9644-9644 964D-964D 9650-9650 965B-965B "
+        "9662-9665 966A-966A 9670-9670 9673-9673 9675-9676 9678-9678 967A-967A "
+        "967D-967D 9685-9686 968A-968A 968E-968F 9694-9694 9699-9699 969B-969C "
+        "96A0-96A0 96A3-96A3 96B7-96B7 96BB-96BB 96C4-96C7 96CC-96CC 96D1-96D1 "
+        "96E2-96E3 96E8-96E8 96EA-96EA 96F0-96F0 96F2-96F2 96F6-96F7 96FB-96FB "
+        "9700-9700 9707-9707 970A-970A 971C-971C 9727-9727 9732-9732 9752-9752 "
+        "9759-9759 975E-975E 9762-9762 9769-9769 9774-9774 97D3-97D3 97F3-97F3 "
+        "97FB-97FB 97FF-97FF 9802-9803 9805-9806 9808-9808 9810-9813 9818-9818 "
+        "982C-982D 983B-983C 984C-984E 9854-9855 9858-9858 985E-985E 9867-9867 "
+        "98A8-98A8 98DB-98DB 98DF-98DF 98E2-98E2 98EF-98EF 98F2-98F2 98FC-98FE "
+        "9905-9905 990A-990A 990C-990C 9913-9913 9928-9928 9996-9996 9999-9999 "
+        "99AC-99AC 99C4-99C6 99D0-99D0 99D2-99D2 9A0E-9A0E 9A12-9A13 9A30-9A30 "
+        "9A5A-9A5A 9AA8-9AA8 9AB8-9AB8 9AC4-9AC4 9AD8-9AD8 9AEA-9AEA 9B31-9B31 "
+        "9B3C-9B3C 9B42-9B42 9B45-9B45 9B54-9B54 9B5A-9B5A 9BAE-9BAE 9BE8-9BE8 "
+        "9CE5-9CE5 9CF4-9CF4 9D8F-9D8F 9DB4-9DB4 9E7F-9E7F 9E93-9E93 9E97-9E97 "
+        "9EA6-9EA6 9EBA-9EBB 9EC4-9EC4 9ED2-9ED2 9ED9-9ED9 9F13-9F13 9F3B-9F3B "
+        "9F62-9F62"
+    ),
+    "kn": (
+        "0C82-0C83 0C85-0C8C 0C8E-0C90 0C92-0CA8 0CAA-0CB3 0CB5-0CB9 0CBC-0CC4 "
+        "0CC6-0CC8 0CCA-0CCD 0CD5-0CD6 0CE0-0CE1 0CE6-0CEF"
+    ),
+    "ko": "AC00-D7A3",
+    "lt": (
+        "0041-0050 0052-0056 0059-005A 0061-0070 0072-0076 0079-007A 0104-0105 "
+        "010C-010D 0116-0119 012E-0131 0160-0161 016A-016B 0172-0173 017D-017F "
+        "212A-212A"
+    ),
+    "lv": (
+        "0041-0050 0052-0056 005A-005A 0061-0070 0072-0076 007A-007A 0100-0101 "
+        "010C-010D 0112-0113 0122-0123 012A-012B 0130-0131 0136-0137 013B-013C "
+        "0145-0146 0160-0161 016A-016B 017D-017F 212A-212A"
+    ),
+    "mk": (
+        "0403-0403 0405-0405 0408-040A 040C-040C 040F-0418 041A-0428 0430-0438 "
+        "043A-0448 0453-0453 0455-0455 0458-045A 045C-045C 045F-045F 1C80-1C85"
+    ),
+    "ml": (
+        "0D02-0D03 0D05-0D0C 0D0E-0D10 0D12-0D28 0D2A-0D39 0D3E-0D43 0D46-0D48 "
+        "0D4A-0D4D 0D57-0D57 0D60-0D61 0D7A-0D7F 200C-200D"
+    ),
+    "mr": (
+        "0901-0903 0905-090D 090F-0911 0913-0928 092A-0933 0935-0939 093C-0943 "
+        "0945-0945 0947-0949 094B-094D 0950-0950"
+    ),
+    "ne": (
+        "0901-0903 0905-090D 090F-0911 0913-0928 092A-0930 0932-0933 0935-0939 "
+        "093C-0943 0945-0945 0947-0949 094B-094D 0950-0950"
+    ),
+    "nl": (
+        "0041-005A 0061-007A 00C1-00C1 00C4-00C4 00C9-00C9 00CB-00CB 00CD-00CD "
+        "00CF-00CF 00D3-00D3 00D6-00D6 00DA-00DA 00DC-00DC 00E1-00E1 00E4-00E4 "
+        "00E9-00E9 00EB-00EB 00ED-00ED 00EF-00EF 00F3-00F3 00F6-00F6 00FA-00FA "
+        "00FC-00FC 0130-0131 017F-017F 0301-0301 212A-212A"
+    ),
+    "no": (
+        "0041-005A 0061-007A 00C0-00C0 00C5-00C6 00C9-00C9 00D2-00D4 00D8-00D8 "
+        "00E0-00E0 00E5-00E6 00E9-00E9 00F2-00F4 00F8-00F8 0130-0131 017F-017F "
+        "212A-212B"
+    ),
+    "pa": (
+        "0A05-0A0A 0A0F-0A10 0A13-0A28 0A2A-0A30 0A32-0A32 0A35-0A35 0A38-0A39 "
+        "0A3C-0A3C 0A3E-0A42 0A47-0A48 0A4B-0A4D 0A5C-0A5C 0A66-0A74"
+    ),
+    "pl": (
+        "0041-0050 0052-0055 0057-0057 0059-005A 0061-0070 0072-0075 0077-0077 "
+        "0079-007A 00D3-00D3 00F3-00F3 0104-0107 0118-0119 0130-0131 0141-0144 "
+        "015A-015B 0179-017C 017F-017F 212A-212A"
+    ),
+    "pt": (
+        "0041-005A 0061-007A 00C0-00C3 00C7-00C7 00C9-00CA 00CD-00CD 00D2-00D5 "
+        "00DA-00DA 00E0-00E3 00E7-00E7 00E9-00EA 00ED-00ED 00F2-00F5 00FA-00FA "
+        "0130-0131 017F-017F 212A-212A"
+    ),
+    "ro": (
+        "0041-005A 0061-007A 00C2-00C2 00CE-00CE 00E2-00E2 00EE-00EE 0102-0103 "
+        "0130-0131 017F-017F 0218-021B 212A-212A"
+    ),
+    "ru": "0401-0401 0410-044F 0451-0451 1C80-1C86",
+    "sk": (
+        "0041-005A 0061-007A 00C1-00C1 00C4-00C4 00C9-00C9 00CD-00CD 00D3-00D4 "
+        "00DA-00DA 00DD-00DD 00E1-00E1 00E4-00E4 00E9-00E9 00ED-00ED 00F3-00F4 "
+        "00FA-00FA 00FD-00FD 010C-010F 0130-0131 0139-013A 013D-013E 0147-0148 "
+        "0154-0155 0160-0161 0164-0165 017D-017F 212A-212A"
+    ),
+    "sl": (
+        "0041-0050 0052-0056 005A-005A 0061-0070 0072-0076 007A-007A 010C-010D "
+        "0130-0131 0160-0161 017D-017F 212A-212A"
+    ),
+    "so": (
+        "0042-0044 0046-0048 004A-004E 0051-0054 0057-0059 0062-0064 0066-0068 "
+        "006A-006E 0071-0074 0077-0079 017F-017F 212A-212A"
+    ),
+    "sq": (
+        "0041-0056 0058-005A 0061-0076 0078-007A 00C7-00C7 00CB-00CB 00E7-00E7 "
+        "00EB-00EB 0130-0131 017F-017F 212A-212A"
+    ),
+    "sv": (
+        "0041-005A 0061-007A 00C0-00C0 00C4-00C5 00C9-00C9 00D6-00D6 00E0-00E0 "
+        "00E4-00E5 00E9-00E9 00F6-00F6 0130-0131 017F-017F 212A-212B"
+    ),
+    "sw": (
+        "0041-0050 0052-0057 0059-005A 0061-0070 0072-0077 0079-007A 0130-0131 "
+        "017F-017F 212A-212A"
+    ),
+    "ta": (
+        "0B83-0B83 0B85-0B8A 0B8E-0B90 0B92-0B95 0B99-0B9A 0B9C-0B9C 0B9E-0B9F "
+        "0BA3-0BA4 0BA8-0BAA 0BAE-0BB5 0BB7-0BB9 0BBE-0BC2 0BC6-0BC8 0BCA-0BCD"
+    ),
+    "te": (
+        "0C01-0C03 0C05-0C0C 0C0E-0C10 0C12-0C28 0C2A-0C33 0C35-0C39 0C3E-0C44 "
+        "0C46-0C48 0C4A-0C4D 0C55-0C56 0C60-0C61"
+    ),
+    "th": "0E01-0E3A 0E40-0E4E",
+    "tl": "0041-005A 0061-007A 00D1-00D1 00F1-00F1 0130-0131 017F-017F 212A-212A",
+    "tr": (
+        "0041-0050 0052-0056 0059-005A 0061-0070 0072-0076 0079-007A 00C7-00C7 "
+        "00D6-00D6 00DC-00DC 00E7-00E7 00F6-00F6 00FC-00FC 011E-011F 0130-0131 "
+        "015E-015F 017F-017F 212A-212A"
+    ),
+    "uk": (
+        "02BC-02BC 0404-0404 0406-0407 0410-0429 042C-042C 042E-0449 044C-044C "
+        "044E-044F 0454-0454 0456-0457 0490-0491 1C80-1C85"
+    ),
+    "ur": (
+        "0621-0621 0627-0628 062A-063A 0641-0642 0644-0646 0648-0648 0679-0679 "
+        "067E-067E 0686-0686 0688-0688 0691-0691 0698-0698 06A9-06A9 06AF-06AF "
+        "06BE-06BE 06C1-06C1 06CC-06CC 06D2-06D2"
+    ),
+    "vi": (
+        "0041-0045 0047-0049 004B-0056 0058-0059 0061-0065 0067-0069 006B-0076 "
+        "0078-0079 00C0-00C3 00C8-00CA 00CC-00CD 00D2-00D5 00D9-00DA 00DD-00DD "
+        "00E0-00E3 00E8-00EA 00EC-00ED 00F2-00F5 00F9-00FA 00FD-00FD 0102-0103 "
+        "0110-0111 0128-0129 0130-0131 0168-0169 017F-017F 01A0-01A1 01AF-01B0 "
+        "1EA0-1EF9 212A-212A"
+    ),
+    "zh-cn": (
+        "4E00-4E01 4E03-4E03 4E07-4E0E 4E11-4E11 4E13-4E14 4E16-4E16 4E18-4E1A "
+        "4E1C-4E1D 4E22-4E22 4E24-4E25 4E27-4E27 4E2A-4E2A 4E2D-4E2D 4E30-4E30 "
+        "4E32-4E32 4E34-4E34 4E38-4E3B 4E3D-4E3E 4E43-4E43 4E45-4E45 4E48-4E49 "
+        "4E4B-4E50 4E54-4E54 4E56-4E56 4E58-4E59 4E5D-4E5D 4E5F-4E61 4E66-4E66 "
+        "4E70-4E71 4E7E-4E7E 4E86-4E86 4E88-4E89 4E8B-4E8C 4E8E-4E8F 4E91-4E92 "
+        "4E94-4E95 4E9A-4E9B 4EA1-4EA1 4EA4-4EA8 4EAB-4EAC 4EAE-4EAE 4EB2-4EB2 "
+        "4EBA-4EBA 4EBF-4EC1 4EC5-4EC5 4EC7-4EC7 4ECA-4ECB 4ECD-4ECE 4ED4-4ED4 "
+        "4ED6-4ED6 4ED8-4ED9 4EE3-4EE5 4EEA-4EEA 4EEC-4EEC 4EF0-4EF0 4EF2-4EF2 "
+        "4EF6-4EF7 4EFB-4EFB 4EFD-4EFD 4EFF-4EFF 4F01-4F01 4F0A-4F0A 4F0D-4F0D "
+        "4F0F-4F11 4F17-4F1A 4F1F-4F20 4F24-4F24 4F26-4F26 4F2F-4F30 4F34-4F34 "
+        "4F38-4F38 4F3C-4F3D 4F46-4F46 4F4D-4F51 4F53-4F53 4F55-4F55 4F59-4F59 "
+        "4F5B-4F5C 4F60-4F60 4F64-4F64 4F69-4F69 4F73-4F73 4F7F-4F7F 4F8B-4F8B "
+        "4F9B-4F9B 4F9D-4F9D 4FA0-4FA0 4FA6-4FA8 4FAC-4FAC 4FAF-4FAF 4FB5-4FB5 "
+        "4FBF-4FBF 4FC3-4FC4 4FCA-4FCA 4FD7-4FD7 4FDD-4FDD 4FE1-4FE1 4FE9-4FE9 "
+        "4FEE-4FEE 4FF1-4FF1 4FFE-4FFE 500D-500D 5012-5012 5019-501A 501F-501F "
+        "5026-5026 503C-503C 503E-503E 5047-5047 504C-504C 504F-504F 505A-505A "
+        "505C-505C 5065-5065 5076-5077 50A8-50A8 50AC-50AC 50B2-50B2 50BB-50BB "
+        "50CF-50CF 50E7-50E7 5112-5112 513F-513F 5141-5141 5143-5146 5148-5149 "
+        "514B-514B 514D-514D 5151-5151 5154-5154 515A-515A 5165-5165 5168-5168 "
+        "516B-516E 5170-5171 5173-5179 517B-517D 5185-5185 5188-5188 518C-518D "
+        "5192-5192 5199-5199 519B-519C 51A0-51A0 51AC-51AC 51B0-51B0 51B2-51B3 "
+        "51B5-51B5 51B7-51B7 51C6-51C6 51CC-51CC 51CF-51CF 51DD-51DD 51E0-51E1 "
+        "51E4-51E4 51ED-51ED 51EF-51F0 51FA-51FB 51FD-51FD 5200-5200 5206-5207 "
+        "520A-520A 5211-5212 5217-521B 521D-521D 5224-5224 5229-5229 522B-522B "
+        "5230-5230 5236-5238 523A-523B 5242-5242 524D-524D 5251-5251 5267-5267 "
+        "5269-526A 526F-526F 5272-5272 529B-529B 529D-52A1 52A3-52A3 52A8-52AB "
+        "52B1-52B3 52BF-52BF 52C7-52C7 52C9-52C9 52CB-52CB 52D2-52D2 52E4-52E4 "
+        "52FE-52FF 5305-5306 5308-5308 5316-5317 5319-5319 5339-533B 5341-5341 "
+        "5343-5343 5347-5348 534A-534A 534E-534F 5352-5353 5355-5357 535A-535A "
+        "5360-5362 536B-536B 536F-5371 5373-5374 5377-5377 5382-5382 5384-5386 "
+        "5389-5389 538B-538D 539A-539A 539F-539F 53BB-53BB 53BF-53BF 53C2-53C2 "
+        "53C8-53CD 53D1-53D1 53D4-53D4 53D6-53D9 53E3-53E6 53EA-53ED 53EF-53F0 "
+        "53F2-53F3 53F6-53F9 5403-5404 5408-540A 540C-540E 5410-5411 5413-5413 "
+        "5417-5417 541B-541B 541D-541D 541F-541F 5426-5427 542B-542C 542F-542F "
+        "5435-5435 5438-5439 543B-543B 543E-543E 5440-5440 5446-5446 5448-5448 "
+        "544A-544A 5450-5450 5458-5458 545C-545C 5462-5462 5466-5466 5468-5468 "
+        "5473-5473 5475-5475 547C-547D 548C-548C 5496-5496 54A6-54A8 54AA-54AA "
+        "54AC-54AC 54AF-54AF 54B1-54B1 54C0-54C1 54C7-54C9 54CD-54CE 54DF-54DF "
+        "54E5-54E6 54E9-54EA 54ED-54ED 54F2-54F2 5509-5509 5510-5510 5524-5524 "
+        "552C-552C 552E-552F 5531-5531 5537-5537 5546-5546 554A-554A 5561-5561 "
+        "5565-5566 556A-556A 5580-5580 5582-5582 5584-5584 5587-5587 558A-558A "
+        "558F-558F 5594-5594 559C-559D 55B5-55B5 55B7-55B7 55BB-55BB 55D2-55D2 "
+        "55E8-55E8 55EF-55EF 5609-5609 561B-561B 5634-5634 563B-563B 563F-563F "
+        "5668-5668 56DB-56DB 56DE-56DE 56E0-56E0 56E2-56E2 56ED-56ED 56F0-56F0 "
+        "56F4-56F4 56FA-56FA 56FD-56FE 5706-5706 5708-5708 571F-571F 5723-5723 "
+        "5728-5728 572D-572D 5730-5730 5733-5733 573A-573A 573E-573E 5740-5740 "
+        "5747-5747 574E-574E 5750-5751 5757-5757 575A-575C 5761-5761 5764-5764 "
+        "5766-5766 576A-576A 5782-5783 578B-578B 5792-5792 57C3-57C3 57CB-57CB "
+        "57CE-57CE 57D4-57D4 57DF-57DF 57F9-57FA 5802-5802 5806-5806 5815-5815 "
+        "5821-5821 582A-582A 5851-5851 5854-5854 585E-585E 586B-586B 5883-5883 "
+        "589E-589E 58A8-58A8 58C1-58C1 58E4-58E4 58EB-58EC 58EE-58EE 58F0-58F0 "
+        "5904-5904 5907-5907 590D-590D 590F-590F 5915-5916 591A-591A 591C-591C "
+        "591F-591F 5925-5925 5927-5927 5929-592B 592E-592E 5931-5931 5934-5934 "
+        "5937-593A 5947-5949 594B-594B 594F-594F 5951-5951 5954-5954 5956-5957 "
+        "5965-5965 5973-5974 5976-5976 5979-5979 597D-597D 5982-5982 5987-5988 "
+        "5996-5996 5999-5999 59A5-59A5 59A8-59A8 59AE-59AE 59B9-59B9 59BB-59BB "
+        "59C6-59C6 59CA-59CB 59D0-59D1 59D3-59D4 59FF-59FF 5A01-5A01 5A03-5A04 "
+        "5A18-5A18 5A1C-5A1C 5A1F-5A1F 5A31-5A31 5A46-5A46 5A5A-5A5A 5A92-5A92 "
+        "5AC1-5AC1 5ACC-5ACC 5AE9-5AE9 5B50-5B50 5B54-5B55 5B57-5B59 5B5C-5B5D "
+        "5B5F-5B5F 5B63-5B64 5B66-5B66 5B69-5B69 5B81-5B81 5B83-5B83 5B87-5B89 "
+        "5B8B-5B8C 5B8F-5B8F 5B97-5B9E 5BA1-5BA4 5BAA-5BAA 5BB3-5BB4 5BB6-5BB6 "
+        "5BB9-5BB9 5BBD-5BBF 5BC2-5BC2 5BC4-5BC7 5BCC-5BCC 5BD2-5BD2 5BDD-5BDF "
+        "5BE1-5BE1 5BE8-5BE8 5BF8-5BF9 5BFB-5BFC 5BFF-5BFF 5C01-5C01 5C04-5C04 "
+        "5C06-5C06 5C0A-5C0A 5C0F-5C0F 5C11-5C11 5C14-5C14 5C16-5C16 5C18-5C18 "
+        "5C1A-5C1A 5C1D-5C1D 5C24-5C24 5C31-5C31 5C3A-5C3A 5C3C-5C3E 5C40-5C42 "
+        "5C45-5C45 5C4B-5C4B 5C4F-5C4F 5C55-5C55 5C5E-5C5E 5C60-5C60 5C71-5C71 "
+        "5C81-5C82 5C97-5C98 5C9A-5C9B 5CB3-5CB3 5CB8-5CB8 5CE1-5CE1 5CF0-5CF0 "
+        "5D07-5D07 5D29-5D29 5D34-5D34 5DDD-5DDE 5DE1-5DE1 5DE5-5DE8 5DEB-5DEB "
+        "5DEE-5DEE 5DF1-5DF4 5DF7-5DF7 5E01-5E03 5E05-5E05 5E08-5E08 5E0C-5E0C "
+        "5E10-5E10 5E15-5E16 5E1D-5E1D 5E26-5E26 5E2D-5E2E 5E38-5E38 5E3D-5E3D "
+        "5E45-5E45 5E55-5E55 5E72-5E74 5E76-5E76 5E78-5E78 5E7B-5E7D 5E7F-5E7F "
+        "5E86-5E86 5E8A-5E8A 5E8F-5E8F 5E93-5E95 5E97-5E97 5E99-5E9A 5E9C-5E9C "
+        "5E9E-5E9F 5EA6-5EA7 5EAD-5EAD 5EB7-5EB8 5EC9-5EC9 5ED6-5ED6 5EF6-5EF7 "
+        "5EFA-5EFA 5F00-5F00 5F02-5F04 5F0A-5F0A 5F0F-5F0F 5F15-5F15 5F17-5F18 "
+        "5F1F-5F20 5F25-5F26 5F2F-5F2F 5F31-5F31 5F39-5F3A 5F52-5F53 5F55-5F55 "
+        "5F5D-5F5D 5F62-5F62 5F69-5F69 5F6C-5F6D 5F70-5F71 5F77-5F77 5F79-5F79 "
+        "5F7B-5F7C 5F80-5F81 5F84-5F85 5F88-5F88 5F8B-5F8C 5F90-5F90 5F92-5F92 "
+        "5F97-5F97 5FAA-5FAA 5FAE-5FAE 5FB5-5FB5 5FB7-5FB7 5FC3-5FC3 5FC5-5FC6 "
+        "5FCC-5FCD 5FD7-5FD9 5FE0-5FE0 5FE7-5FE7 5FEB-5FEB 5FF5-5FF5 5FFD-5FFD "
+        "6000-6001 600E-600E 6012-6012 6015-6016 601D-601D 6021-6021 6025-6025 "
+        "6027-6028 602A-602A 603B-603B 604B-604B 6050-6050 6062-6062 6068-6069 "
+        "606D-606D 606F-6070 6076-6076 607C-607C 6084-6084 6089-6089 6094-6094 "
+        "609F-60A0 60A3-60A3 60A8-60A8 60B2-60B2 60C5-60C5 60D1-60D1 60DC-60DC "
+        "60E0-60E0 60E7-60E8 60EF-60EF 60F3-60F3 60F9-60F9 6101-6101 6108-6109 "
+        "610F-610F 611A-611A 611F-611F 6127-6127 6148-6148 614E-614E 6155-6155 "
+        "6162-6162 6167-6167 6170-6170 61BE-61BE 61C2-61C2 61D2-61D2 6208-6208 "
+        "620A-620A 620C-620C 620F-6212 6216-6216 6218-6218 622A-622A 6234-6234 "
+        "6237-6237 623F-6241 6247-6247 624B-624B 624D-624E 6251-6251 6253-6253 "
+        "6258-6258 6263-6263 6267-6267 6269-6269 626B-626F 6279-6279 627E-6280 "
+        "6284-6284 628A-628A 6291-6291 6293-6293 6295-6295 6297-6298 62A2-62A2 "
+        "62A4-62A5 62AB-62AC 62B1-62B1 62B5-62B5 62B9-62B9 62BD-62BD 62C5-62C6 "
+        "62C9-62C9 62CD-62CD 62D2-62D2 62D4-62D4 62D6-62D6 62D8-62D8 62DB-62DC "
+        "62DF-62DF 62E5-62E6 62E8-62E9 62EC-62EC 62F3-62F3 62F7-62F7 62FC-62FC "
+        "62FE-62FF 6301-6301 6307-6307 6309-6309 6311-6311 6316-6316 631D-631D "
+        "6321-6321 6324-6325 632A-632A 632F-632F 633A-633A 6349-6349 6350-6350 "
+        "6355-6355 635F-635F 6361-6362 636E-636E 6377-6377 6388-6389 638C-638C "
+        "6392-6392 63A2-63A2 63A5-63A5 63A7-63AA 63B8-63B8 63CF-63D0 63D2-63D2 "
+        "63E1-63E1 63F4-63F4 641C-641C 641E-641E 642C-642D 6444-6444 6446-6446 "
+        "644A-644A 6454-6454 6458-6458 6469-6469 6478-6478 6492-6492 649E-649E "
+        "64AD-64AD 64CD-64CE 64E6-64E6 652F-652F 6536-6536 6539-6539 653B-653B "
+        "653E-653F 6545-6545 6548-6548 654C-654C 654F-654F 6551-6551 6559-6559 "
+        "655D-655D 6562-6563 6566-6566 656C-656C 6570-6570 6572-6572 6574-6574 "
+        "6587-6587 658B-658B 6590-6590 6597-6597 6599-6599 659C-659C 65A5-65A5 "
+        "65AD-65AD 65AF-65B0 65B9-65B9 65BC-65BD 65C1-65C1 65C5-65C5 65CB-65CB "
+        "65CF-65CF 65D7-65D7 65E0-65E0 65E2-65E2 65E5-65E9 65ED-65ED 65F6-65F6 "
+        "65FA-65FA 6602-6602 6606-6606 660C-660C 660E-660F 6613-6613 661F-6620 "
+        "6625-6625 6628-6628 662D-662D 662F-662F 663E-663E 6643-6643 664B-664B "
+        "6652-6653 665A-665A 6668-6668 666E-666F 6674-6674 6676-6676 667A-667A "
+        "6682-6682 6691-6691 6696-6697 66AE-66AE 66B4-66B4 66F0-66F0 66F2-66F2 "
+        "66F4-66F4 66F9-66F9 66FC-66FC 66FE-6700 6708-6709 670B-670B 670D-670D "
+        "6717-6717 671B-671B 671D-671D 671F-671F 6728-6728 672A-672D 672F-672F "
+        "6731-6731 6735-6735 673A-673A 6740-6740 6742-6743 6749-6749 674E-674E "
+        "6750-6751 675C-675C 675F-675F 6761-6761 6765-6765 6768-6768 676F-6770 "
+        "677E-677F 6781-6781 6784-6784 6790-6790 6797-6797 679C-679D 67A2-67A2 "
+        "67AA-67AB 67B6-67B6 67CF-67D0 67D3-67D4 67E5-67E5 67EC-67EC 67EF-67EF "
+        "67F3-67F4 6807-6807 680B-680B 680F-680F 6811-6811 6821-6821 6837-6839 "
+        "683C-683C 6843-6843 6846-6846 6848-6848 684C-684C 6851-6851 6863-6863 "
+        "6865-6865 6881-6881 6885-6885 68A6-68A6 68AF-68B0 68B5-68B5 68C0-68C0 "
+        "68C9-68C9 68CB-68CB 68D2-68D2 68DA-68DA 68EE-68EE 6905-6905 690D-690D "
+        "6930-6930 695A-695A 697C-697C 6982-6982 699C-699C 6A21-6A21 6A31-6A31 "
+        "6A80-6A80 6B20-6B23 6B27-6B27 6B32-6B32 6B3A-6B3A 6B3E-6B3E 6B49-6B49 "
+        "6B4C-6B4C 6B62-6B66 6B6A-6B6A 6B7B-6B7B 6B8A-6B8B 6BB5-6BB5 6BC5-6BC5 "
+        "6BCD-6BCD 6BCF-6BCF 6BD2-6BD2 6BD4-6BD5 6BDB-6BDB 6BEB-6BEB 6C0F-6C0F "
+        "6C11-6C11 6C14-6C14 6C1B-6C1B 6C34-6C34 6C38-6C38 6C42-6C42 6C47-6C47 "
+        "6C49-6C49 6C57-6C57 6C5D-6C5D 6C5F-6C61 6C64-6C64 6C6A-6C6A 6C76-6C76 "
+        "6C7D-6C7D 6C83-6C83 6C88-6C89 6C99-6C99 6C9F-6C9F 6CA1-6CA1 6CA7-6CA7 "
+        "6CB3-6CB3 6CB9-6CB9 6CBB-6CBB 6CBF-6CBF 6CC9-6CCA 6CD5-6CD5 6CDB-6CDB "
+        "6CE1-6CE3 6CE5-6CE5 6CE8-6CE8 6CF0-6CF0 6CF3-6CF3 6CFD-6CFD 6D0B-6D0B "
+        "6D17-6D17 6D1B-6D1B 6D1E-6D1E 6D25-6D25 6D2A-6D2A 6D32-6D32 6D3B-6D3B "
+        "6D3D-6D3E 6D41-6D41 6D45-6D45 6D4B-6D4B 6D4E-6D4F 6D51-6D51 6D53-6D53 "
+        "6D59-6D59 6D66-6D66 6D69-6D6A 6D6E-6D6E 6D74-6D74 6D77-6D77 6D85-6D85 "
+        "6D88-6D89 6D9B-6D9B 6DA8-6DA8 6DAF-6DAF 6DB2-6DB2 6DB5-6DB5 6DCB-6DCB "
+        "6DD1-6DD1 6DD8-6DD8 6DE1-6DE1 6DF1-6DF1 6DF7-6DF7 6DFB-6DFB 6E05-6E05 "
+        "6E10-6E10 6E21-6E21 6E23-6E23 6E29-6E29 6E2F-6E2F 6E34-6E34 6E38-6E38 "
+        "6E56-6E56 6E7E-6E7E 6E90-6E90 6E9C-6E9C 6EAA-6EAA 6ECB-6ECB 6ED1-6ED1 "
+        "6EE1-6EE1 6EE5-6EE5 6EE8-6EE8 6EF4-6EF4 6F02-6F02 6F0F-6F0F 6F14-6F14 "
+        "6F20-6F20 6F2B-6F2B 6F58-6F58 6F5C-6F5C 6F6E-6F6E 6F8E-6F8E 6FB3-6FB3 "
+        "6FC0-6FC0 704C-704C 706B-706B 706D-706D 706F-7070 7075-7075 707F-707F "
+        "7089-7089 708E-708E 70AE-70AE 70B8-70B9 70C2-70C2 70C8-70C8 70E4-70E4 "
+        "70E6-70E7 70ED-70ED 7126-7126 7136-7136 714C-714C 715E-715E 7167-7167 "
+        "716E-716E 718A-718A 719F-719F 71C3-71C3 71D5-71D5 7206-7206 722A-722A "
+        "722C-722C 7231-7231 7235-7238 723D-723D 7247-7248 724C-724C 7259-7259 "
+        "725B-725B 7261-7262 7267-7267 7269-7269 7272-7272 7275-7275 7279-727A "
+        "72AF-72AF 72B6-72B6 72B9-72B9 72C2-72C2 72D0-72D0 72D7-72D7 72E0-72E0 "
+        "72EC-72EC 72EE-72EE 72F1-72F1 72FC-72FC 731B-731C 732A-732A 732E-732E "
+        "7334-7334 7384-7384 7387-7387 7389-7389 738B-738B 739B-739B 73A9-73A9 "
+        "73AB-73AB 73AF-73B0 73B2-73B2 73BB-73BB 73C0-73C0 73CA-73CA 73CD-73CD "
+        "73E0-73E0 73ED-73ED 7403-7403 7406-7406 740A-740A 742A-742A 7433-7434 "
+        "743C-743C 7459-7459 745C-745C 745E-745F 7470-7470 7476-7476 7483-7483 "
+        "74DC-74DC 74E6-74E6 74F6-74F6 7518-7518 751A-751A 751C-751C 751F-751F "
+        "7528-7528 7530-7533 7535-7535 7537-7538 753B-753B 7545-7545 754C-754C "
+        "7559-7559 7565-7565 756A-756A 7586-7586 758F-758F 7591-7591 7597-7597 "
+        "75AF-75AF 75B2-75B2 75BC-75BC 75BE-75BE 75C5-75C5 75D5-75D5 75DB-75DB "
+        "75F4-75F4 7678-7678 767B-767B 767D-767E 7684-7684 7686-7687 76AE-76AE "
+        "76C8-76C8 76CA-76CA 76D1-76D2 76D6-76D6 76D8-76D8 76DB-76DB 76DF-76DF "
+        "76EE-76EE 76F4-76F4 76F8-76F8 76FC-76FC 76FE-76FE 7701-7701 7709-7709 "
+        "770B-770B 771F-7720 773C-773C 7740-7740 775B-775B 7761-7761 7763-7763 "
+        "77A7-77A7 77DB-77DB 77E3-77E3 77E5-77E5 77ED-77ED 77F3-77F3 77F6-77F6 "
+        "7801-7802 780D-780D 7814-7814 7834-7834 7840-7840 7855-7855 786C-786C "
+        "786E-786E 788D-788E 7897-7897 789F-789F 78A7-78A7 78B0-78B0 78C1-78C1 "
+        "78C5-78C5 78E8-78E8 793A-793A 793C-793C 793E-793E 7956-7956 795A-795A "
+        "795D-795E 7965-7965 7968-7968 796F-796F 7978-7978 7981-7981 7985-7985 "
+        "798F-798F 79BB-79BB 79C0-79C1 79CB-79CB 79CD-79CD 79D1-79D2 79D8-79D8 "
+        "79DF-79DF 79E4-79E4 79E6-79E6 79E9-79E9 79EF-79F0 79FB-79FB 7A00-7A00 "
+        "7A0B-7A0B 7A0D-7A0E 7A23-7A23 7A33-7A33 7A3F-7A3F 7A46-7A46 7A76-7A77 "
+        "7A79-7A7A 7A7F-7A7F 7A81-7A81 7A97-7A97 7A9D-7A9D 7ACB-7ACB 7AD9-7AD9 "
+        "7ADE-7AE0 7AE5-7AE5 7AEF-7AEF 7AF9-7AF9 7B11-7B11 7B14-7B14 7B1B-7B1B "
+        "7B26-7B26 7B28-7B28 7B2C-7B2C 7B49-7B49 7B4B-7B4B 7B51-7B51 7B54-7B54 "
+        "7B56-7B56 7B79-7B79 7B7E-7B7E 7B80-7B80 7B97-7B97 7BA1-7BA1 7BAD-7BAD "
+        "7BB1-7BB1 7BC7-7BC7 7BEE-7BEE 7C3F-7C3F 7C4D-7C4D 7C73-7C73 7C7B-7C7B "
+        "7C89-7C89 7C92-7C92 7C97-7C97 7CA4-7CA4 7CB9-7CB9 7CBE-7CBE 7CCA-7CCA "
+        "7CD5-7CD6 7CDF-7CDF 7CFB-7CFB 7D20-7D20 7D22-7D22 7D27-7D27 7D2B-7D2B "
+        "7D2F-7D2F 7E41-7E41 7EA2-7EA2 7EA6-7EA7 7EAA-7EAA 7EAF-7EAF 7EB2-7EB3 "
+        "7EB5-7EB5 7EB7-7EB8 7EBD-7EBD 7EBF-7EBF 7EC3-7EC4 7EC6-7EC8 7ECD-7ECD "
+        "7ECF-7ECF 7ED3-7ED3 7ED5-7ED5 7ED8-7ED9 7EDC-7EDD 7EDF-7EDF 7EE7-7EE7 "
+        "7EE9-7EEA 7EED-7EED 7EF4-7EF5 7EFC-7EFC 7EFF-7EFF 7F05-7F05 7F13-7F13 "
+        "7F16-7F16 7F18-7F18 7F20-7F20 7F29-7F29 7F34-7F34 7F36-7F36 7F38-7F38 "
+        "7F3A-7F3A 7F50-7F51 7F55-7F55 7F57-7F57 7F5A-7F5A 7F62-7F62 7F6A-7F6A "
+        "7F6E-7F6E 7F72-7F72 7F8A-7F8A 7F8E-7F8E 7F9E-7F9E 7FA4-7FA4 7FAF-7FAF "
+        "7FBD-7FBD 7FC1-7FC1 7FC5-7FC5 7FD4-7FD4 7FD8-7FD8 7FE0-7FE0 7FF0-7FF0 "
+        "7FFB-7FFC 8000-8001 8003-8003 8005-8005 800C-800D 8010-8010 8017-8017 "
+        "8033-8033 8036-8036 804A-804A 804C-804C 8054-8054 8058-8058 805A-805A "
+        "806A-806A 8089-8089 8096-8096 809A-809A 80A1-80A1 80A4-80A5 80A9-80A9 "
+        "80AF-80AF 80B2-80B2 80C1-80C1 80C6-80C6 80CC-80CC 80CE-80CE 80D6-80D6 "
+        "80DC-80DC 80DE-80DE 80E1-80E1 80F6-80F6 80F8-80F8 80FD-80FD 8106-8106 "
+        "8111-8111 8131-8131 8138-8138 814A-814A 8150-8150 8153-8153 8170-8170 "
+        "8179-8179 817E-817F 81C2-81C2 81E3-81E3 81EA-81EA 81ED-81ED 81F3-81F4 "
+        "820C-820D 8212-8212 821E-821F 822A-822A 822C-822C 8230-8230 8239-8239 "
+        "826F-826F 8272-8272 827A-827A 827E-827E 8282-8282 8292-8292 829D-829D "
+        "82A6-82A6 82AC-82AD 82B1-82B1 82B3-82B3 82CD-82CD 82CF-82CF 82D7-82D7 "
+        "82E5-82E6 82F1-82F1 8302-8303 8328-8328 832B-832B 8336-8336 8349-8349 "
+        "8350-8350 8352-8352 8363-8363 836F-836F 8377-8377 8389-8389 838E-838E "
+        "83AA-83AB 83B1-83B2 83B7-83B7 83DC-83DC 83E9-83E9 83F2-83F2 8404-8404 "
+        "840D-840D 8424-8425 8427-8428 843D-843D 8457-8457 845B-845B 8461-8461 "
+        "8482-8482 848B-848B 8499-8499 84C9-84C9 84DD-84DD 84EC-84EC 8511-8511 "
+        "8521-8521 8584-8584 85AA-85AA 85C9-85C9 85CF-85CF 85E4-85E4 864E-864E "
+        "8651-8651 866B-866B 8679-8679 867D-867E 8681-8681 86C7-86C7 86CB-86CB "
+        "86D9-86D9 86EE-86EE 8702-8702 871C-871C 8776-8776 878D-878D 87F9-87F9 "
+        "8822-8822 8840-8840 884C-884C 8857-8857 8861-8861 8863-8863 8865-8865 "
+        "8868-8868 888B-888B 88AB-88AB 88AD-88AD 88C1-88C2 88C5-88C5 88D5-88D5 "
+        "88E4-88E4 897F-897F 8981-8981 8986-8986 89C1-89C2 89C4-89C4 89C6-89C6 "
+        "89C8-89C9 89D2-89D2 89E3-89E3 8A00-8A00 8A89-8A89 8A93-8A93 8B66-8B66 "
+        "8BA1-8BA2 8BA4-8BA4 8BA8-8BA9 8BAD-8BB0 8BB2-8BB2 8BB7-8BB8 8BBA-8BBA "
+        "8BBE-8BBF 8BC1-8BC1 8BC4-8BC4 8BC6-8BC6 8BC9-8BC9 8BCD-8BCD 8BD1-8BD1 "
+        "8BD5-8BD5 8BD7-8BD7 8BDA-8BDA 8BDD-8BDE 8BE2-8BE2 8BE5-8BE6 8BED-8BED "
+        "8BEF-8BEF 8BF4-8BF4 8BF7-8BF8 8BFA-8BFB 8BFE-8BFE 8C01-8C01 8C03-8C03 "
+        "8C05-8C05 8C08-8C08 8C0A-8C0B 8C13-8C13 8C1C-8C1C 8C22-8C22 8C28-8C28 "
+        "8C31-8C31 8C37-8C37 8C46-8C46 8C61-8C61 8C6A-8C6A 8C8C-8C8C 8D1D-8D1F "
+        "8D21-8D25 8D27-8D2A 8D2D-8D2D 8D2F-8D2F 8D31-8D31 8D34-8D35 8D38-8D3A "
+        "8D3C-8D3C 8D3E-8D3E 8D44-8D44 8D4B-8D4C 8D4F-8D50 8D54-8D54 8D56-8D56 "
+        "8D5A-8D5B 8D5E-8D5E 8D60-8D60 8D62-8D62 8D64-8D64 8D6B-8D6B 8D70-8D70 "
+        "8D75-8D75 8D77-8D77 8D81-8D81 8D85-8D85 8D8A-8D8B 8DA3-8DA3 8DB3-8DB3 "
+        "8DC3-8DC3 8DCC-8DCC 8DD1-8DD1 8DDD-8DDD 8DDF-8DDF 8DEF-8DEF 8DF3-8DF3 "
+        "8E0F-8E0F 8E22-8E22 8E29-8E29 8EAB-8EAB 8EB2-8EB2 8F66-8F66 8F68-8F69 "
+        "8F6C-8F6C 8F6E-8F70 8F7B-8F7B 8F7D-8F7D 8F83-8F83 8F85-8F86 8F88-8F89 "
+        "8F91-8F91 8F93-8F93 8F9B-8F9B 8F9E-8F9E 8FA8-8FA9 8FB0-8FB1 8FB9-8FB9 "
+        "8FBE-8FBE 8FC1-8FC1 8FC5-8FC5 8FC7-8FC8 8FCE-8FCE 8FD0-8FD1 8FD4-8FD4 "
+        "8FD8-8FD9 8FDB-8FDF 8FE6-8FE6 8FEA-8FEB 8FF0-8FF0 8FF7-8FF7 8FFD-8FFD "
+        "9000-9003 9006-9006 9009-900A 900F-9010 9012-9012 9014-9014 901A-901B "
+        "901D-901D 901F-9020 9022-9022 9038-9038 903B-903C 9047-9047 904D-904D "
+        "9053-9053 9057-9057 906D-906E 9075-9075 907F-9080 9093-9093 90A3-90A3 "
+        "90A6-90A6 90AA-90AA 90AE-90AE 90B1-90B1 90BB-90BB 90CE-90CE 90D1-90D1 "
+        "90E8-90E8 90ED-90ED 90FD-90FD 9102-9102 9149-9149 914B-914B 914D-914D "
+        "9152-9152 9177-9178 9189-9189 9192-9192 91C7-91C7 91CA-91CA 91CC-91CF "
+        "91D1-91D1 9488-9488 9493-9493 949F-949F 94A2-94A2 94A6-94A6 94B1-94B1 "
+        "94BB-94BB 94C1-94C1 94C3-94C3 94DC-94DC 94E2-94E2 94ED-94ED 94F6-94F6 "
+        "94FA-94FA 94FE-94FE 9500-9501 9505-9505 950B-950B 9519-9519 9521-9521 "
+        "9526-9526 952E-952E 953A-953A 9547-9547 955C-955C 956D-956D 957F-957F "
+        "95E8-95E8 95EA-95EA 95ED-95EE 95F0-95F0 95F2-95F2 95F4-95F4 95F7-95F7 "
+        "95F9-95F9 95FB-95FB 9601-9601 9605-9605 9610-9610 9614-9614 961F-961F "
+        "962E-962E 9632-9636 963B-963B 963F-9640 9644-9646 9648-9648 964D-964D "
+        "9650-9650 9662-9662 9664-9664 9669-966A 9675-9677 9686-9686 968F-9690 "
+        "9694-9694 969C-969C 96BE-96BE 96C4-96C6 96C9-96C9 96E8-96E8 96EA-96EA "
+        "96EF-96EF 96F3-96F3 96F6-96F7 96FE-96FE 9700-9700 9707-9707 970D-970D "
+        "9716-9716 9732-9732 9738-9739 9752-9752 9756-9756 9759-9759 975E-975E "
+        "9760-9760 9762-9762 9769-9769 977C-977C 978B-978B 9791-9791 97E6-97E6 "
+        "97E9-97E9 97F3-97F3 9875-9876 9879-987B 987D-987F 9884-9884 9886-9887 "
+        "9891-9891 9897-9898 989D-989D 98CE-98CE 98D8-98D9 98DE-98DF 9910-9910 "
+        "996D-996E 9970-9971 997C-997C 9986-9986 9996-9996 9999-9999 99A8-99A8 "
+        "9A6C-9A6C 9A71-9A71 9A76-9A76 9A7B-9A7B 9A7E-9A7E 9A8C-9A8C 9A91-9A91 "
+        "9A97-9A97 9A9A-9A9A 9AA4-9AA4 9AA8-9AA8 9AD8-9AD8 9B3C-9B3C 9B42-9B42 "
+        "9B45-9B45 9B54-9B54 9C7C-9C7C 9C81-9C81 9C9C-9C9C 9E1F-9E1F 9E21-9E21 "
+        "9E23-9E23 9E2D-9E2D 9E3F-9E3F 9E45-9E45 9E64-9E64 9E70-9E70 9E7F-9E7F "
+        "9EA6-9EA6 9EBB-9EBB 9EC4-9EC4 9ECE-9ECE 9ED1-9ED1 9ED8-9ED8 9F13-9F13 "
+        "9F20-9F20 9F3B-9F3B 9F50-9F50 9F7F-9F7F 9F84-9F84 9F99-9F99 9F9F-9F9F"
+    ),
+    "zh-tw": (
+        "4E00-4E01 4E03-4E03 4E08-4E0D 4E11-4E11 4E14-4E14 4E16-4E16 4E18-4E19 "
+        "4E1F-4E1F 4E26-4E26 4E2D-4E2D 4E32-4E32 4E38-4E39 4E3B-4E3B 4E43-4E43 "
+        "4E45-4E45 4E48-4E48 4E4B-4E4B 4E4E-4E4F 4E56-4E56 4E58-4E59 4E5D-4E5D "
+        "4E5F-4E5F 4E7E-4E7E 4E82-4E82 4E86-4E86 4E88-4E88 4E8B-4E8C 4E8E-4E8E "
+        "4E91-4E92 4E94-4E95 4E9B-4E9B 4E9E-4E9E 4EA1-4EA1 4EA4-4EA6 4EA8-4EA8 "
+        "4EAB-4EAC 4EAE-4EAE 4EBA-4EBA 4EC0-4EC1 4EC7-4EC7 4ECA-4ECB 4ECD-4ECD "
+        "4ED4-4ED4 4ED6-4ED6 4ED8-4ED9 4EE3-4EE5 4EF0-4EF0 4EF2-4EF2 4EF6-4EF6 "
+        "4EFB-4EFB 4EFD-4EFD 4F01-4F01 4F0A-4F0A 4F0D-4F0D 4F10-4F11 4F19-4F19 "
+        "4F2F-4F30 4F34-4F34 4F38-4F38 4F3C-4F3D 4F46-4F46 4F48-4F49 4F4D-4F4F "
+        "4F54-4F55 4F59-4F59 4F5B-4F5C 4F60-4F60 4F69-4F69 4F73-4F73 4F7F-4F7F "
+        "4F86-4F86 4F8B-4F8B 4F9B-4F9B 4F9D-4F9D 4FAF-4FAF 4FB5-4FB5 4FBF-4FBF "
+        "4FC2-4FC4 4FCA-4FCA 4FD7-4FD7 4FDD-4FDD 4FE0-4FE1 4FEE-4FEE 4FF1-4FF1 "
+        "4FFE-4FFE 500B-500B 500D-500D 5011-5012 5019-501A 501F-501F 502B-502B "
+        "503C-503C 5047-5047 5049-5049 504F-504F 505A-505A 505C-505C 5065-5065 "
+        "5074-5077 5091-5091 5099-5099 50A2-50A3 50B2-50B3 50B7-50B7 50BB-50BB "
+        "50BE-50BE 50C5-50C5 50CF-50CF 50D1-50D1 50E7-50E7 50F9-50F9 5100-5100 "
+        "5104-5104 5112-5112 5118-5118 512A-512A 5141-5141 5143-5145 5147-5149 "
+        "514B-514B 514D-514D 5152-5152 5154-5154 5165-5165 5167-5169 516B-516E "
+        "5171-5171 5175-5178 517C-517C 518A-518A 518D-518D 5192-5192 51A0-51A0 "
+        "51AC-51AC 51B0-51B0 51B7-51B7 51C6-51C6 51CC-51CC 51DD-51DD 51E1-51E1 "
+        "51F0-51F1 51FA-51FA 51FD-51FD 5200-5200 5206-5207 520A-520A 5217-5217 "
+        "521D-521D 5224-5225 5229-522A 5230-5230 5236-5237 523A-523B 5247-5247 "
+        "524C-524D 525B-525B 5269-526A 526F-526F 5272-5272 5275-5275 5283-5283 "
+        "5287-5287 5289-5289 528D-528D 529B-529B 529F-52A0 52A9-52AB 52C1-52C1 "
+        "52C7-52C7 52C9-52C9 52D2-52D2 52D5-52D5 52D9-52D9 52DD-52DE 52E2-52E2 "
+        "52E4-52E4 52F5-52F5 52F8-52F8 52FF-52FF 5305-5305 5308-5308 5316-5317 "
+        "5339-5339 5340-5341 5343-5343 5347-5348 534A-534A 5352-5354 5357-5357 "
+        "535A-535A 535C-535C 5361-5361 536F-5371 5373-5373 5377-5377 537B-537B "
+        "5384-5384 5398-5398 539A-539A 539F-539F 53AD-53AD 53B2-53B2 53BB-53BB "
+        "53C3-53C3 53C8-53C8 53CA-53CB 53CD-53CD 53D4-53D4 53D6-53D7 53E3-53E6 "
+        "53EA-53ED 53EF-53F0 53F2-53F3 53F8-53F8 5403-5404 5408-540A 540C-540E "
+        "5410-5412 541B-541B 541D-5420 5426-5427 542B-542B 5433-5433 5435-5435 "
+        "5438-5439 543E-543E 5440-5440 5442-5442 5446-5446 544A-544A 5462-5462 "
+        "5468-5468 5473-5473 5475-5475 547C-547D 548C-548C 5496-5496 54A6-54A7 "
+        "54AA-54AA 54AC-54AC 54B1-54B1 54C0-54C1 54C7-54C9 54CE-54CE 54E1-54E1 "
+        "54E5-54E6 54E9-54EA 54ED-54ED 54F2-54F2 5509-5509 5510-5510 5514-5514 "
+        "552C-552C 552E-552F 5531-5531 5537-5538 5546-5546 554A-554A 554F-554F "
+        "555F-555F 5561-5561 5565-5566 556A-556A 5580-5580 5582-5582 5584-5584 "
+        "5587-5587 558A-558A 5594-5594 559C-559D 55AC-55AC 55AE-55AE 55B5-55B5 "
+        "55CE-55CE 55DA-55DA 55E8-55E8 55EF-55EF 5606-5606 5609-5609 5617-5617 "
+        "561B-561B 5634-5634 563B-563B 563F-563F 5668-5668 5674-5674 5687-5687 "
+        "56B4-56B4 56C9-56C9 56DB-56DB 56DE-56DE 56E0-56E0 56F0-56F0 56FA-56FA "
+        "5708-5708 570B-570B 570D-570D 5712-5713 5716-5716 5718-5718 571C-571C "
+        "571F-571F 5728-5728 572D-572D 5730-5730 573E-573E 5740-5740 5747-5747 "
+        "574E-574E 5750-5750 5761-5761 5764-5764 5766-5766 576A-576A 5782-5783 "
+        "578B-578B 57C3-57C3 57CE-57CE 57D4-57D4 57DF-57DF 57F7-57F7 57F9-57FA "
+        "5802-5802 5805-5806 5821-5821 582A-582A 5831-5831 5834-5834 584A-584A "
+        "5854-5854 5857-5857 585E-585E 586B-586B 5875-5875 5883-5883 589E-589E "
+        "58A8-58A8 58AE-58AE 58C1-58C1 58C7-58C7 58D3-58D3 58D8-58D8 58DE-58DE "
+        "58E2-58E2 58EB-58EC 58EF-58EF 58FD-58FD 590F-590F 5915-5916 591A-591A "
+        "591C-591C 5920-5920 5922-5922 5925-5925 5927-5927 5929-592B 592E-592E "
+        "5931-5931 5937-5938 593E-593E 5947-5949 594E-594F 5951-5951 5954-5954 "
+        "5957-5957 5967-5967 596A-596A 596E-596E 5973-5974 5976-5976 5979-5979 "
+        "597D-597D 5982-5982 5999-5999 599D-599D 59A5-59A5 59A8-59A8 59AE-59AE "
+        "59B3-59B3 59B9-59B9 59BB-59BB 59C6-59C6 59CA-59CB 59D0-59D1 59D3-59D4 "
+        "59FF-59FF 5A01-5A01 5A03-5A03 5A18-5A18 5A1B-5A1B 5A41-5A41 5A46-5A46 "
+        "5A5A-5A5A 5A66-5A66 5A92-5A92 5ABD-5ABD 5ACC-5ACC 5AE9-5AE9 5B50-5B50 "
+        "5B54-5B54 5B57-5B58 5B5D-5B5D 5B5F-5B5F 5B63-5B64 5B69-5B69 5B6B-5B6B "
+        "5B78-5B78 5B83-5B83 5B85-5B85 5B87-5B89 5B8B-5B8C 5B8F-5B8F 5B97-5B9C "
+        "5BA2-5BA4 5BAE-5BAE 5BB3-5BB3 5BB6-5BB6 5BB9-5BB9 5BBF-5BBF 5BC2-5BC2 "
+        "5BC4-5BC6 5BCC-5BCC 5BD2-5BD2 5BDE-5BDF 5BE2-5BE2 5BE6-5BE9 5BEB-5BEC "
+        "5BEE-5BEE 5BF5-5BF6 5C01-5C01 5C04-5C04 5C07-5C08 5C0A-5C0B 5C0D-5C0F "
+        "5C11-5C11 5C16-5C16 5C1A-5C1A 5C24-5C24 5C31-5C31 5C3A-5C3A 5C3C-5C3C "
+        "5C3E-5C3E 5C40-5C41 5C45-5C46 5C4B-5C4B 5C4F-5C4F 5C55-5C55 5C60-5C60 "
+        "5C64-5C64 5C6C-5C6C 5C71-5C71 5CA1-5CA1 5CA9-5CA9 5CB8-5CB8 5CF0-5CF0 "
+        "5CF6-5CF6 5CFD-5CFD 5D07-5D07 5D19-5D19 5D34-5D34 5D50-5D50 5DBA-5DBA "
+        "5DDD-5DDE 5DE1-5DE1 5DE5-5DE8 5DEB-5DEB 5DEE-5DEE 5DF1-5DF4 5DF7-5DF7 "
+        "5E02-5E03 5E0C-5E0C 5E15-5E16 5E1B-5E1B 5E1D-5E1D 5E25-5E25 5E2B-5E2B "
+        "5E2D-5E2D 5E33-5E33 5E36-5E36 5E38-5E38 5E3D-5E3D 5E45-5E45 5E55-5E55 "
+        "5E63-5E63 5E6B-5E6B 5E72-5E74 5E78-5E79 5E7B-5E7E 5E87-5E87 5E8A-5E8A "
+        "5E8F-5E8F 5E95-5E95 5E97-5E97 5E9A-5E9A 5E9C-5E9C 5EA6-5EA7 5EAB-5EAB "
+        "5EAD-5EAD 5EB7-5EB8 5EC9-5EC9 5ED6-5ED6 5EE0-5EE0 5EE2-5EE3 5EF3-5EF3 "
+        "5EF6-5EF7 5EFA-5EFA 5F04-5F04 5F0F-5F0F 5F15-5F15 5F17-5F18 5F1F-5F1F "
+        "5F26-5F26 5F31-5F31 5F35-5F35 5F37-5F37 5F48-5F48 5F4A-5F4A 5F4C-5F4C "
+        "5F4E-5F4E 5F5D-5F5E 5F62-5F62 5F65-5F65 5F69-5F69 5F6C-5F6D 5F70-5F71 "
+        "5F79-5F79 5F7C-5F7C 5F80-5F81 5F85-5F85 5F88-5F88 5F8B-5F8C 5F90-5F92 "
+        "5F97-5F97 5F9E-5F9E 5FA9-5FA9 5FAE-5FAE 5FB5-5FB5 5FB7-5FB7 5FB9-5FB9 "
+        "5FC3-5FC3 5FC5-5FC5 5FCC-5FCD 5FD7-5FD9 5FE0-5FE0 5FEB-5FEB 5FF5-5FF5 "
+        "5FFD-5FFD 600E-600E 6012-6012 6015-6016 601D-601D 6021-6021 6025-6025 "
+        "6027-6028 602A-602A 6046-6046 6050-6050 6062-6062 6065-6065 6068-6069 "
+        "606D-606D 606F-6070 6085-6085 6089-6089 6094-6094 609F-60A0 60A8-60A8 "
+        "60B2-60B2 60B6-60B6 60C5-60C5 60D1-60D1 60DC-60DC 60E0-60E1 60F1-60F1 "
+        "60F3-60F3 60F9-60F9 6101-6101 6108-6109 610F-610F 611A-611B 611F-611F "
+        "6148-6148 614B-614B 6155-6155 6158-6158 6162-6163 6167-6167 616E-616E "
+        "6170-6170 6176-6176 617E-617E 6182-6182 6190-6191 61B2-61B2 61B6-61B6 "
+        "61BE-61BE 61C2-61C2 61C9-61C9 61F6-61F7 61FC-61FC 6200-6200 6208-6208 "
+        "620A-620A 620C-620C 6210-6212 6216-6216 622A-622A 6230-6230 6232-6232 "
+        "6234-6234 6236-6236 623F-6241 6247-6247 624B-624B 624D-624E 6253-6253 "
+        "6258-6258 6263-6263 6265-6265 626D-626D 626F-626F 6279-6279 627E-6280 "
+        "6284-6284 628A-628A 6293-6293 6295-6295 6297-6298 62AB-62AC 62B1-62B1 "
+        "62B5-62B5 62B9-62B9 62BD-62BD 62C6-62C6 62C9-62C9 62CB-62CB 62CD-62CD "
+        "62CF-62CF 62D2-62D2 62D4-62D4 62D6-62D6 62DB-62DC 62EC-62EC 62F3-62F3 "
+        "62FC-62FC 62FE-62FF 6301-6301 6307-6307 6309-6309 6311-6311 6316-6316 "
+        "632A-632A 632F-632F 633A-633A 6350-6350 6355-6355 6368-6368 6372-6372 "
+        "6377-6377 6383-6383 6388-6389 638C-638C 6392-6392 639B-639B 63A1-63A2 "
+        "63A5-63A5 63A7-63A8 63AA-63AA 63CF-63D0 63D2-63D2 63DA-63DB 63E1-63E1 "
+        "63EE-63EE 63F4-63F4 640D-640D 6416-6416 641C-641C 641E-641E 642C-642D "
+        "6436-6436 6458-6458 6469-6469 6478-6478 6490-6490 6492-6492 649E-649E "
+        "64A3-64A3 64A5-64A5 64AD-64AD 64BE-64BF 64C1-64C1 64C7-64C7 64CA-64CB "
+        "64CD-64CE 64D4-64D4 64DA-64DA 64E0-64E0 64E6-64E6 64EC-64EC 64F4-64F4 "
+        "64FA-64FA 64FE-64FE 651D-651D 652F-652F 6536-6536 6539-6539 653B-653B "
+        "653E-653F 6545-6545 6548-6548 654D-654D 654F-654F 6551-6551 6557-6559 "
+        "655D-655D 6562-6563 6566-6566 656C-656C 6574-6575 6578-6578 6587-6587 "
+        "6590-6590 6597-6597 6599-6599 65AF-65B0 65B7-65B7 65B9-65B9 65BC-65BD "
+        "65C1-65C1 65C5-65C5 65CB-65CB 65CF-65CF 65D7-65D7 65E2-65E2 65E5-65E6 "
+        "65E9-65E9 65ED-65ED 65FA-65FA 6602-6602 6606-6607 660C-660C 660E-660F "
+        "6613-6613 661F-6620 6625-6625 6628-6628 662D-662D 662F-662F 6642-6642 "
+        "6649-6649 6652-6652 665A-665A 6668-6668 666E-666F 6674-6674 6676-6676 "
+        "667A-667A 6691-6691 6696-6697 66AB-66AB 66B4-66B4 66C6-66C6 66C9-66C9 "
+        "66F0-66F0 66F2-66F2 66F4-66F4 66F8-66F8 66FC-66FC 66FE-6700 6703-6703 "
+        "6708-6709 670B-670B 670D-670D 6717-6717 671B-671B 671D-671D 671F-671F "
+        "6728-6728 672A-672D 6731-6731 6735-6735 6749-6749 674E-674E 6750-6751 "
+        "675C-675C 675F-675F 676F-6771 677E-677F 6790-6790 6797-6797 679C-679D "
+        "67B6-67B6 67CF-67D0 67D3-67D4 67E5-67E5 67EC-67EC 67EF-67EF 67F3-67F4 "
+        "6821-6821 6838-6839 683C-683C 6843-6843 6848-6848 684C-684C 6851-6851 "
+        "6881-6881 6885-6885 689D-689D 68A8-68A8 68AF-68B0 68B5-68B5 68C4-68C4 "
+        "68C9-68C9 68CB-68CB 68D2-68D2 68DA-68DA 68EE-68EE 6905-6905 690D-690D "
+        "6930-6930 694A-694A 6953-6953 695A-695A 696D-696D 6975-6975 6982-6982 "
+        "699C-699C 69AE-69AE 69CB-69CB 69CD-69CD 6A02-6A02 6A13-6A13 6A19-6A19 "
+        "6A1E-6A1E 6A21-6A21 6A23-6A23 6A39-6A39 6A4B-6A4B 6A5F-6A5F 6A6B-6A6B "
+        "6A80-6A80 6A94-6A94 6AA2-6AA2 6B04-6B04 6B0A-6B0A 6B21-6B21 6B23-6B23 "
+        "6B32-6B32 6B3A-6B3A 6B3D-6B3E 6B49-6B49 6B4C-6B4C 6B50-6B50 6B61-6B66 "
+        "6B72-6B72 6B77-6B78 6B7B-6B7B 6B8A-6B8A 6B98-6B98 6BB5-6BB5 6BBA-6BBA "
+        "6BBC-6BBC 6BC0-6BC0 6BC5-6BC5 6BCD-6BCD 6BCF-6BCF 6BD2-6BD2 6BD4-6BD4 "
+        "6BDB-6BDB 6BEB-6BEB 6C0F-6C0F 6C11-6C11 6C23-6C23 6C34-6C34 6C38-6C38 "
+        "6C42-6C42 6C57-6C57 6C5D-6C5D 6C5F-6C61 6C6A-6C6A 6C76-6C76 6C7A-6C7A "
+        "6C7D-6C7D 6C83-6C83 6C88-6C89 6C92-6C92 6C96-6C96 6C99-6C99 6CB3-6CB3 "
+        "6CB9-6CB9 6CBB-6CBB 6CBF-6CBF 6CC1-6CC1 6CC9-6CCA 6CD5-6CD5 6CE1-6CE2 "
+        "6CE5-6CE5 6CE8-6CE8 6CF0-6CF0 6CF3-6CF3 6D0B-6D0B 6D17-6D17 6D1B-6D1B "
+        "6D1E-6D1E 6D29-6D2A 6D32-6D32 6D3B-6D3B 6D3D-6D3E 6D41-6D41 6D66-6D66 "
+        "6D69-6D6A 6D6E-6D6E 6D77-6D77 6D87-6D89 6DAF-6DAF 6DB2-6DB2 6DB5-6DB5 "
+        "6DBC-6DBC 6DD1-6DD1 6DDA-6DDA 6DE1-6DE1 6DE8-6DE8 6DF1-6DF1 6DF7-6DF7 "
+        "6DFA-6DFA 6E05-6E05 6E1B-6E1B 6E21-6E21 6E2C-6E2C 6E2F-6E2F 6E38-6E38 "
+        "6E56-6E56 6E6F-6E6F 6E90-6E90 6E96-6E96 6E9D-6E9D 6EAA-6EAB 6EC4-6EC5 "
+        "6ECB-6ECB 6ED1-6ED1 6EF4-6EF4 6EFE-6EFF 6F02-6F02 6F0F-6F0F 6F14-6F14 "
+        "6F20-6F20 6F22-6F22 6F2B-6F2B 6F32-6F32 6F38-6F38 6F54-6F54 6F58-6F58 "
+        "6F5B-6F5B 6F6E-6F6E 6FA4-6FA4 6FB3-6FB3 6FC0-6FC0 6FC3-6FC3 6FDF-6FDF "
+        "6FE4-6FE4 6FEB-6FEB 6FF1-6FF1 700F-700F 704C-704C 7063-7063 706B-706B "
+        "7070-7070 707D-707D 708E-708E 70AE-70AE 70B8-70B8 70BA-70BA 70C8-70C8 "
+        "70CF-70CF 70E4-70E4 7121-7121 7126-7126 7136-7136 7159-7159 715E-715E "
+        "7167-7167 7169-7169 718A-718A 719F-719F 71B1-71B1 71C3-71C3 71C8-71C8 "
+        "71D2-71D2 71DF-71DF 7206-7206 7210-7210 721B-721B 722A-722A 722C-722D "
+        "7235-7236 7238-7238 723A-723A 723D-723E 7246-7248 724C-724C 7259-7259 "
+        "725B-725B 7260-7260 7267-7267 7269-7269 7272-7272 7279-7279 727D-727D "
+        "72A7-72A7 72AF-72AF 72C0-72C0 72C2-72C2 72D0-72D0 72D7-72D7 72E0-72E0 "
+        "72FC-72FC 731B-731C 7334-7334 7336-7336 7344-7345 734E-734E 7368-7368 "
+        "7372-7372 7378-7378 737B-737B 7384-7384 7387-7387 7389-7389 738B-738B "
+        "73A9-73A9 73AB-73AB 73B2-73B2 73BB-73BB 73CA-73CA 73CD-73CD 73E0-73E0 "
+        "73E5-73E5 73ED-73ED 73FE-73FE 7403-7403 7406-7406 7409-7409 742A-742A "
+        "7434-7434 7459-7459 745C-745C 745E-745F 7464-7464 746A-746A 7470-7470 "
+        "74B0-74B0 74DC-74DC 74E6-74E6 74F6-74F6 7518-7518 751A-751A 751C-751C "
+        "751F-751F 7522-7522 7528-7528 7530-7533 7537-7538 754C-754C 7559-7559 "
+        "7562-7562 7565-7565 756A-756B 7570-7570 7576-7576 7586-7586 758F-758F "
+        "7591-7591 75BC-75BC 75C5-75C5 75D5-75D5 75DB-75DB 75F4-75F4 760B-760B "
+        "7642-7642 7661-7661 7678-7678 767B-767E 7684-7684 7686-7687 76AE-76AE "
+        "76C3-76C3 76CA-76CA 76DB-76DC 76DF-76DF 76E1-76E1 76E3-76E4 76E7-76E7 "
+        "76EE-76EE 76F2-76F2 76F4-76F4 76F8-76F8 76FC-76FC 76FE-76FE 7701-7701 "
+        "7709-7709 770B-770B 771F-7720 773C-773C 773E-773E 775B-775B 7761-7761 "
+        "7763-7763 77A7-77A7 77AD-77AD 77DB-77DB 77E3-77E3 77E5-77E5 77ED-77ED "
+        "77F3-77F3 7802-7802 780D-780D 7814-7814 7832-7832 7834-7834 786C-786C "
+        "788E-788E 7897-7897 789F-789F 78A7-78A7 78A9-78A9 78B0-78B0 78BA-78BA "
+        "78BC-78BC 78C1-78C1 78E8-78E8 78EF-78EF 790E-790E 7919-7919 793A-793A "
+        "793E-793E 7955-7956 795A-795B 795D-795E 7965-7965 7968-7968 797F-797F "
+        "7981-7981 798D-798F 79AA-79AA 79AE-79AE 79C0-79C1 79CB-79CB 79D1-79D2 "
+        "79D8-79D8 79DF-79DF 79E4-79E4 79E6-79E6 79FB-79FB 7A05-7A05 7A0B-7A0B "
+        "7A0D-7A0D 7A2E-7A2E 7A31-7A31 7A3F-7A3F 7A46-7A46 7A4C-7A4D 7A69-7A69 "
+        "7A76-7A76 7A79-7A7A 7A7F-7A7F 7A81-7A81 7A97-7A97 7AA9-7AA9 7AAE-7AAE "
+        "7AB6-7AB6 7ACB-7ACB 7AD9-7AD9 7ADF-7AE0 7AE5-7AE5 7AEF-7AEF 7AF6-7AF6 "
+        "7AF9-7AF9 7B11-7B11 7B1B-7B1B 7B26-7B26 7B28-7B28 7B2C-7B2C 7B46-7B46 "
+        "7B49-7B49 7B4B-7B4B 7B54-7B54 7B56-7B56 7B97-7B97 7BA1-7BA1 7BAD-7BAD "
+        "7BB1-7BB1 7BC0-7BC0 7BC4-7BC4 7BC7-7BC7 7BC9-7BC9 7C21-7C21 7C2B-7C2B "
+        "7C3D-7C3D 7C3F-7C3F 7C43-7C43 7C4C-7C4D 7C64-7C64 7C73-7C73 7C89-7C89 "
+        "7C97-7C97 7CB5-7CB5 7CBE-7CBE 7CCA-7CCA 7CD5-7CD5 7CDF-7CDF 7CFB-7CFB "
+        "7CFE-7CFE 7D00-7D00 7D04-7D05 7D0D-7D0D 7D10-7D10 7D14-7D14 7D19-7D1B "
+        "7D20-7D20 7D22-7D22 7D2B-7D2B 7D2F-7D30 7D39-7D39 7D42-7D42 7D44-7D44 "
+        "7D50-7D50 7D55-7D55 7D61-7D61 7D66-7D66 7D71-7D72 7D93-7D93 7D9C-7D9C "
+        "7DA0-7DA0 7DAD-7DAD 7DB1-7DB2 7DCA-7DCA 7DD2-7DD2 7DDA-7DDA 7DE3-7DE3 "
+        "7DE8-7DE9 7DEC-7DEC 7DEF-7DEF 7DF4-7DF4 7E1B-7E1B 7E23-7E23 7E2E-7E2E "
+        "7E31-7E31 7E3D-7E3E 7E41-7E41 7E46-7E46 7E54-7E54 7E5E-7E5E 7E6A-7E6A "
+        "7E73-7E73 7E7C-7E7C 7E8C-7E8C 7F38-7F38 7F3A-7F3A 7F55-7F55 7F6A-7F6A "
+        "7F6E-7F6E 7F70-7F70 7F72-7F72 7F75-7F75 7F77-7F77 7F85-7F85 7F8A-7F8A "
+        "7F8E-7F8E 7F9E-7F9E 7FA4-7FA4 7FA9-7FA9 7FBD-7FBD 7FC1-7FC1 7FD2-7FD2 "
+        "7FD4-7FD4 7FF0-7FF0 7FF9-7FF9 7FFB-7FFC 8000-8001 8003-8003 8005-8005 "
+        "800C-800D 8010-8010 8017-8017 8033-8033 8036-8036 804A-804A 8056-8056 "
+        "805A-805A 805E-805E 806F-8070 8072-8072 8077-8077 807D-807D 8089-8089 "
+        "809A-809A 80A1-80A1 80A5-80A5 80A9-80A9 80AF-80AF 80B2-80B2 80CC-80CC "
+        "80CE-80CE 80D6-80D6 80DE-80DE 80E1-80E1 80F8-80F8 80FD-80FD 8106-8106 "
+        "812B-812B 8153-8154 8166-8166 8170-8170 8173-8173 817F-817F 81BD-81BD "
+        "81C9-81C9 81D8-81D8 81E3-81E3 81E5-81E5 81E8-81E8 81EA-81EA 81ED-81ED "
+        "81F3-81F4 81FA-81FA 8207-820A 820C-820D 8212-8212 821E-821F 822A-822A "
+        "822C-822C 8239-8239 8266-8266 826F-826F 8272-8272 827E-827E 829D-829D "
+        "82AC-82AC 82B1-82B1 82B3-82B3 82E5-82E6 82F1-82F1 8305-8305 832B-832B "
+        "8332-8332 8336-8336 8349-8349 8352-8352 8377-8377 837C-837C 8389-838A "
+        "838E-838E 83AB-83AB 83DC-83DC 83E9-83E9 83EF-83EF 83F2-83F2 8404-8404 "
+        "840A-840A 842C-842C 843D-843D 8449-8449 8457-8457 845B-845B 8461-8461 "
+        "8482-8482 8499-8499 84B2-84B2 84BC-84BC 84CB-84CB 84EE-84EE 8515-8515 "
+        "8521-8521 8523-8523 856D-856D 8584-8584 85A6-85A6 85A9-85AA 85C9-85C9 "
+        "85CD-85CD 85CF-85CF 85DD-85DD 85E4-85E5 8606-8607 862D-862D 864E-864E "
+        "8655-8655 865B-865B 865F-865F 8667-8667 86C7-86C7 86CB-86CB 86D9-86D9 "
+        "8702-8702 871C-871C 8776-8776 878D-878D 87A2-87A2 87F2-87F2 87F9-87F9 "
+        "880D-880D 883B-883B 8840-8840 884C-884C 8853-8853 8857-8857 885B-885B "
+        "885D-885D 8861-8861 8863-8863 8868-8868 888B-888B 88AB-88AB 88C1-88C2 "
+        "88D5-88D5 88DC-88DD 88E1-88E1 88FD-88FD 8907-8907 8932-8932 897F-897F "
+        "8981-8981 8986-8986 898B-898B 898F-898F 8996-8996 89AA-89AA 89BA-89BA "
+        "89BD-89BD 89C0-89C0 89D2-89D2 89E3-89E3 89F8-89F8 8A00-8A00 8A02-8A02 "
+        "8A08-8A08 8A0A-8A0A 8A0E-8A0E 8A13-8A13 8A17-8A18 8A25-8A25 8A2A-8A2A "
+        "8A2D-8A2D 8A31-8A31 8A34-8A34 8A3B-8A3C 8A55-8A55 8A5E-8A5E 8A62-8A62 "
+        "8A66-8A66 8A69-8A69 8A71-8A73 8A87-8A87 8A8C-8A8D 8A93-8A93 8A95-8A95 "
+        "8A9E-8A9E 8AA0-8AA0 8AA4-8AA4 8AAA-8AAA 8AB0-8AB0 8AB2-8AB2 8ABC-8ABC "
+        "8ABF-8ABF 8AC7-8AC7 8ACB-8ACB 8AD2-8AD2 8AD6-8AD6 8AF8-8AF8 8AFA-8AFA "
+        "8AFE-8AFE 8B00-8B00 8B02-8B02 8B1B-8B1B 8B1D-8B1D 8B49-8B49 8B58-8B58 "
+        "8B5C-8B5C 8B66-8B66 8B6F-8B70 8B77-8B77 8B7D-8B7D 8B80-8B80 8B8A-8B8A "
+        "8B93-8B93 8B9A-8B9A 8C37-8C37 8C46-8C46 8C48-8C48 8C50-8C50 8C61-8C61 "
+        "8C6A-8C6A 8C6C-8C6C 8C8C-8C8C 8C93-8C93 8C9D-8C9E 8CA0-8CA2 8CA8-8CA8 "
+        "8CAA-8CAC 8CB4-8CB4 8CB7-8CB7 8CBB-8CBC 8CC0-8CC0 8CC7-8CC8 8CD3-8CD3 "
+        "8CDC-8CDC 8CDE-8CDE 8CE2-8CE4 8CE6-8CE6 8CEA-8CEA 8CED-8CED 8CF4-8CF4 "
+        "8CFA-8CFA 8CFC-8CFD 8D08-8D08 8D0A-8D0A 8D0F-8D0F 8D64-8D64 8D6B-8D6B "
+        "8D70-8D70 8D77-8D77 8D85-8D85 8D8A-8D8A 8D95-8D95 8D99-8D99 8DA3-8DA3 "
+        "8DA8-8DA8 8DB3-8DB3 8DCC-8DCC 8DCE-8DCE 8DD1-8DD1 8DDD-8DDD 8DDF-8DDF "
+        "8DE1-8DE1 8DEF-8DEF 8DF3-8DF3 8E0F-8E0F 8E22-8E22 8E5F-8E5F 8E64-8E64 "
+        "8E8D-8E8D 8EAB-8EAB 8EB2-8EB2 8ECA-8ECA 8ECC-8ECD 8ED2-8ED2 8EDF-8EDF "
+        "8F03-8F03 8F09-8F09 8F14-8F15 8F1B-8F1B 8F1D-8F1D 8F29-8F2A 8F2F-8F2F "
+        "8F38-8F38 8F49-8F49 8F5F-8F5F 8F9B-8F9B 8FA6-8FA6 8FA8-8FA8 8FAD-8FAD "
+        "8FAF-8FB2 8FC5-8FC5 8FCE-8FCE 8FD1-8FD1 8FD4-8FD4 8FE6-8FE6 8FEA-8FEB "
+        "8FF0-8FF0 8FF4-8FF4 8FF7-8FF7 8FFD-8FFD 9000-9001 9003-9003 9006-9006 "
+        "900F-9010 9014-9014 9019-901B 901D-901D 901F-9020 9022-9023 9031-9032 "
+        "9038-9038 903C-903C 9047-9047 904A-904B 904D-904E 9053-9055 9059-9059 "
+        "905C-905C 9060-9060 9069-9069 906D-906E 9072-9072 9077-9078 907A-907A "
+        "907F-9081 9084-9084 908A-908A 908F-908F 90A3-90A3 90A6-90A6 90AA-90AA "
+        "90B1-90B1 90CE-90CE 90E8-90E8 90ED-90ED 90F5-90F5 90FD-90FD 9102-9102 "
+        "9109-9109 912D-912D 9130-9130 9149-9149 914D-914D 9152-9152 9177-9178 "
+        "9189-9189 9192-9192 919C-919C 91AB-91AB 91C7-91C7 91CB-91CF 91D1-91D1 "
+        "91DD-91DD 91E3-91E3 9234-9234 9262-9262 9280-9280 9285-9285 9296-9296 "
+        "9298-9298 92B3-92B3 92B7-92B7 92D2-92D2 92FC-92FC 9304-9304 9322-9322 "
+        "9326-9326 932B-932B 932F-932F 934B-934B 9375-9375 937E-937E 938A-938A "
+        "9396-9396 93AE-93AE 93E1-93E1 9418-9418 9435-9435 9451-9451 9577-9577 "
+        "9580-9580 9583-9583 9589-9589 958B-958B 958F-958F 9592-9593 95A3-95A3 "
+        "95B1-95B1 95C6-95C6 95CA-95CA 95CD-95CD 95D0-95D0 95DC-95DC 95E1-95E1 "
+        "9632-9632 963B-963B 963F-9640 9644-9644 964D-964D 9650-9650 9662-9664 "
+        "966A-966A 9670-9670 9673-9673 9675-9678 967D-967D 9686-9686 968A-968A "
+        "968E-968E 9694-9694 969B-969C 96A8-96A8 96AA-96AA 96B1-96B1 96BB-96BB "
+        "96C4-96C6 96C9-96C9 96D6-96D6 96D9-96D9 96DC-96DC 96DE-96DE 96E2-96E3 "
+        "96E8-96E8 96EA-96EA 96F2-96F2 96F6-96F7 96FB-96FB 9700-9700 9707-9707 "
+        "970D-970D 9727-9727 9732-9732 9738-9739 9742-9742 9748-9748 9752-9752 "
+        "9756-9756 975C-975C 975E-975E 9760-9760 9762-9762 9769-9769 977C-977C "
+        "978B-978B 97C3-97C3 97CB-97CB 97D3-97D3 97F3-97F3 97FB-97FB 97FF-97FF "
+        "9801-9802 9805-9806 9808-9808 9810-9811 9813-9813 9817-9818 981E-981E "
+        "982D-982D 983B-983B 9846-9846 984C-984D 984F-984F 9858-9858 985E-985E "
+        "9867-9867 986F-986F 98A8-98A8 98C4-98C4 98DB-98DB 98DF-98DF 98EF-98EF "
+        "98F2-98F2 98FD-98FE 9905-9905 990A-990A 9910-9910 9918-9918 9928-9928 "
+        "9996-9996 9999-9999 99AC-99AC 99D0-99D0 99D5-99D5 99DB-99DB 9A0E-9A0E "
+        "9A19-9A19 9A37-9A37 9A45-9A45 9A57-9A57 9A5A-9A5A 9AA8-9AA8 9AD4-9AD4 "
+        "9AD8-9AD8 9AEE-9AEE 9B06-9B06 9B25-9B25 9B27-9B27 9B31-9B31 9B3C-9B3C "
+        "9B41-9B42 9B45-9B45 9B54-9B54 9B5A-9B5A 9B6F-9B6F 9BAE-9BAE 9CE5-9CE5 "
+        "9CF3-9CF4 9D3B-9D3B 9D5D-9D5D 9DF9-9DF9 9E7F-9E7F 9E97-9E97 9EA5-9EA5 "
+        "9EB5-9EB5 9EBB-9EBC 9EC3-9EC3 9ECE-9ECE 9ED1-9ED1 9ED8-9ED8 9EDE-9EDE "
+        "9EE8-9EE8 9F13-9F13 9F20-9F20 9F3B-9F3B 9F4A-9F4B 9F52-9F52 9F61-9F61 "
+        "9F8D-9F8D 9F9C-9F9C"
+    ),
+}
+
+candidates = {
+    "af": (
+        "ascii cp1252 cp437 cp850 cp857 cp858 cp861 cp865 cp1254 cp1258 latin_1 "
+        "iso8859_3 iso8859_9 iso8859_14 iso8859_15 iso8859_16 utf_32 utf_32_be "
+        "utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "ar": (
+        "ascii cp720 cp1256 iso8859_6 utf_32 utf_32_be utf_32_le utf_16 "
+        "utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "bg": (
+        "ascii cp855 cp866 cp1125 cp1251 iso8859_5 koi8_r koi8_u ptcp154 utf_32 "
+        "utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "bn": (
+        "ascii utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 "
+        "utf_8 utf_8_sig"
+    ),
+    "ca": (
+        "ascii cp1252 cp437 cp850 cp857 cp858 cp860 cp865 cp1254 latin_1 "
+        "iso8859_3 iso8859_9 iso8859_14 iso8859_15 iso8859_16 utf_32 utf_32_be "
+        "utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "cs": (
+        "ascii cp852 cp1250 iso8859_2 utf_32 utf_32_be utf_32_le utf_16 "
+        "utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "cy": (
+        "ascii iso8859_14 utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le "
+        "utf_7 utf_8 utf_8_sig"
+    ),
+    "da": (
+        "ascii cp1252 cp775 cp850 cp857 cp858 cp861 cp865 cp1254 cp1257 cp1258 "
+        "latin_1 iso8859_4 iso8859_9 iso8859_10 iso8859_13 iso8859_14 "
+        "iso8859_15 utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 "
+        "utf_8 utf_8_sig"
+    ),
+    "de": (
+        "ascii cp1252 cp437 cp775 cp850 cp852 cp857 cp858 cp861 cp865 cp1250 "
+        "cp1254 cp1257 cp1258 latin_1 iso8859_2 iso8859_3 iso8859_4 iso8859_9 "
+        "iso8859_10 iso8859_13 iso8859_14 iso8859_15 iso8859_16 utf_32 "
+        "utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "el": (
+        "ascii cp737 cp869 iso8859_7 utf_32 utf_32_be utf_32_le utf_16 "
+        "utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "en": (
+        "ascii cp1252 cp437 cp720 cp737 cp775 cp850 cp852 cp855 cp856 cp857 "
+        "cp858 cp860 cp861 cp862 cp863 cp865 cp866 cp869 cp1006 cp1125 cp1250 "
+        "cp1251 cp1254 cp1255 cp1256 cp1257 cp1258 latin_1 iso8859_2 iso8859_3 "
+        "iso8859_4 iso8859_5 iso8859_6 iso8859_7 iso8859_8 iso8859_9 iso8859_10 "
+        "iso8859_13 iso8859_14 iso8859_15 iso8859_16 koi8_r koi8_u ptcp154 "
+        "utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 "
+        "utf_8_sig"
+    ),
+    "es": (
+        "ascii cp1252 cp437 cp850 cp857 cp858 cp860 cp865 cp1254 cp1258 latin_1 "
+        "iso8859_3 iso8859_9 iso8859_14 iso8859_15 utf_32 utf_32_be utf_32_le "
+        "utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "et": (
+        "ascii cp1252 cp775 cp850 cp857 cp858 cp1254 cp1257 latin_1 iso8859_4 "
+        "iso8859_9 iso8859_10 iso8859_13 iso8859_14 iso8859_15 utf_32 utf_32_be "
+        "utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "fa": (
+        "ascii cp1256 utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le "
+        "utf_7 utf_8 utf_8_sig"
+    ),
+    "fi": (
+        "ascii cp1252 cp437 cp775 cp850 cp852 cp857 cp858 cp861 cp865 cp1250 "
+        "cp1254 cp1257 cp1258 latin_1 iso8859_2 iso8859_3 iso8859_4 iso8859_9 "
+        "iso8859_10 iso8859_13 iso8859_14 iso8859_15 iso8859_16 utf_32 "
+        "utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "fr": (
+        "ascii cp1252 cp437 cp720 cp850 cp857 cp858 cp860 cp861 cp863 cp865 "
+        "cp1254 cp1256 cp1258 latin_1 iso8859_3 iso8859_9 iso8859_14 iso8859_15 "
+        "iso8859_16 utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 "
+        "utf_8 utf_8_sig"
+    ),
+    "gu": (
+        "ascii utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 "
+        "utf_8 utf_8_sig"
+    ),
+    "he": (
+        "ascii cp856 cp862 cp1255 iso8859_8 utf_32 utf_32_be utf_32_le utf_16 "
+        "utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "hi": (
+        "ascii utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 "
+        "utf_8 utf_8_sig"
+    ),
+    "hr": (
+        "ascii cp852 cp1250 iso8859_2 iso8859_16 utf_32 utf_32_be utf_32_le "
+        "utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "hu": (
+        "ascii cp852 cp1250 iso8859_2 iso8859_16 utf_32 utf_32_be utf_32_le "
+        "utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "id": (
+        "ascii cp1252 cp437 cp720 cp737 cp775 cp850 cp852 cp855 cp856 cp857 "
+        "cp858 cp860 cp861 cp862 cp863 cp865 cp866 cp869 cp1006 cp1125 cp1250 "
+        "cp1251 cp1254 cp1255 cp1256 cp1257 cp1258 latin_1 iso8859_2 iso8859_3 "
+        "iso8859_4 iso8859_5 iso8859_6 iso8859_7 iso8859_8 iso8859_9 iso8859_10 "
+        "iso8859_13 iso8859_14 iso8859_15 iso8859_16 koi8_r koi8_u ptcp154 "
+        "utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 "
+        "utf_8_sig"
+    ),
+    "it": (
+        "ascii cp1252 cp437 cp850 cp857 cp858 cp860 cp865 cp1254 latin_1 "
+        "iso8859_3 iso8859_9 iso8859_14 iso8859_15 iso8859_16 utf_32 utf_32_be "
+        "utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "ja": (
+        "ascii cp932 euc_jp euc_jis_2004 euc_jisx0213 iso2022_jp iso2022_jp_1 "
+        "iso2022_jp_2 iso2022_jp_2004 iso2022_jp_3 iso2022_jp_ext shift_jis "
+        "utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 "
+        "utf_8_sig"
+    ),
+    "kn": (
+        "ascii utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 "
+        "utf_8 utf_8_sig"
+    ),
+    "ko": (
+        "ascii cp949 euc_kr iso2022_jp_2 johab utf_32 utf_32_be utf_32_le "
+        "utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "lt": (
+        "ascii cp775 cp1257 iso8859_4 iso8859_10 iso8859_13 utf_32 utf_32_be "
+        "utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "lv": (
+        "ascii cp775 cp1257 iso8859_4 iso8859_10 iso8859_13 utf_32 utf_32_be "
+        "utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "mk": (
+        "ascii cp855 cp866 cp1125 cp1251 iso8859_5 koi8_r koi8_u ptcp154 utf_32 "
+        "utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "ml": (
+        "ascii utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 "
+        "utf_8 utf_8_sig"
+    ),
+    "mr": (
+        "ascii utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 "
+        "utf_8 utf_8_sig"
+    ),
+    "ne": (
+        "ascii utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 "
+        "utf_8 utf_8_sig"
+    ),
+    "nl": (
+        "ascii cp1252 cp437 cp850 cp852 cp857 cp858 cp861 cp865 cp1250 cp1254 "
+        "cp1258 latin_1 iso8859_2 iso8859_3 iso8859_9 iso8859_10 iso8859_14 "
+        "iso8859_15 iso8859_16 utf_32 utf_32_be utf_32_le utf_16 utf_16_be "
+        "utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "no": (
+        "ascii cp1252 cp775 cp850 cp857 cp858 cp861 cp865 cp1254 cp1257 cp1258 "
+        "latin_1 iso8859_4 iso8859_9 iso8859_10 iso8859_13 iso8859_14 "
+        "iso8859_15 utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 "
+        "utf_8 utf_8_sig"
+    ),
+    "pa": (
+        "ascii utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 "
+        "utf_8 utf_8_sig"
+    ),
+    "pl": (
+        "ascii cp775 cp852 cp1250 cp1257 iso8859_2 iso8859_13 iso8859_16 utf_32 "
+        "utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "pt": (
+        "ascii cp1252 cp850 cp857 cp858 cp860 cp1254 latin_1 iso8859_9 "
+        "iso8859_14 iso8859_15 utf_32 utf_32_be utf_32_le utf_16 utf_16_be "
+        "utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "ro": (
+        "ascii cp852 cp1250 cp1258 iso8859_2 iso8859_16 utf_32 utf_32_be "
+        "utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "ru": (
+        "ascii cp855 cp866 cp1125 cp1251 iso8859_5 koi8_r koi8_u ptcp154 utf_32 "
+        "utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "sk": (
+        "ascii cp852 cp1250 iso8859_2 utf_32 utf_32_be utf_32_le utf_16 "
+        "utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "sl": (
+        "ascii cp775 cp852 cp1250 cp1257 iso8859_2 iso8859_4 iso8859_10 "
+        "iso8859_13 iso8859_16 utf_32 utf_32_be utf_32_le utf_16 utf_16_be "
+        "utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "so": (
+        "ascii cp1252 cp437 cp720 cp737 cp775 cp850 cp852 cp855 cp856 cp857 "
+        "cp858 cp860 cp861 cp862 cp863 cp865 cp866 cp869 cp1006 cp1125 cp1250 "
+        "cp1251 cp1254 cp1255 cp1256 cp1257 cp1258 latin_1 iso8859_2 iso8859_3 "
+        "iso8859_4 iso8859_5 iso8859_6 iso8859_7 iso8859_8 iso8859_9 iso8859_10 "
+        "iso8859_13 iso8859_14 iso8859_15 iso8859_16 koi8_r koi8_u ptcp154 "
+        "utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 "
+        "utf_8_sig"
+    ),
+    "sq": (
+        "ascii cp1252 cp437 cp720 cp850 cp852 cp857 cp858 cp861 cp863 cp865 "
+        "cp1250 cp1254 cp1256 cp1258 latin_1 iso8859_2 iso8859_3 iso8859_4 "
+        "iso8859_9 iso8859_10 iso8859_14 iso8859_15 iso8859_16 utf_32 utf_32_be "
+        "utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "sv": (
+        "ascii cp1252 cp437 cp775 cp850 cp857 cp858 cp861 cp865 cp1254 cp1257 "
+        "cp1258 latin_1 iso8859_4 iso8859_9 iso8859_10 iso8859_13 iso8859_14 "
+        "iso8859_15 utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 "
+        "utf_8 utf_8_sig"
+    ),
+    "sw": (
+        "ascii cp1252 cp437 cp720 cp737 cp775 cp850 cp852 cp855 cp856 cp857 "
+        "cp858 cp860 cp861 cp862 cp863 cp865 cp866 cp869 cp1006 cp1125 cp1250 "
+        "cp1251 cp1254 cp1255 cp1256 cp1257 cp1258 latin_1 iso8859_2 iso8859_3 "
+        "iso8859_4 iso8859_5 iso8859_6 iso8859_7 iso8859_8 iso8859_9 iso8859_10 "
+        "iso8859_13 iso8859_14 iso8859_15 iso8859_16 koi8_r koi8_u ptcp154 "
+        "utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 "
+        "utf_8_sig"
+    ),
+    "ta": (
+        "ascii utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 "
+        "utf_8 utf_8_sig"
+    ),
+    "te": (
+        "ascii utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 "
+        "utf_8 utf_8_sig"
+    ),
+    "th": (
+        "ascii utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 "
+        "utf_8 utf_8_sig"
+    ),
+    "tl": (
+        "ascii cp1252 cp437 cp850 cp857 cp858 cp860 cp862 cp865 cp1254 cp1258 "
+        "latin_1 iso8859_3 iso8859_9 iso8859_14 iso8859_15 utf_32 utf_32_be "
+        "utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "tr": (
+        "ascii cp857 cp1254 iso8859_3 iso8859_9 utf_32 utf_32_be utf_32_le "
+        "utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "uk": (
+        "ascii cp855 cp1125 cp1251 iso8859_5 koi8_u ptcp154 utf_32 utf_32_be "
+        "utf_32_le utf_16 utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "ur": (
+        "ascii cp1256 utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le "
+        "utf_7 utf_8 utf_8_sig"
+    ),
+    "vi": (
+        "ascii utf_32 utf_32_be utf_32_le utf_16 utf_16_be utf_16_le utf_7 "
+        "utf_8 utf_8_sig"
+    ),
+    "zh-cn": (
+        "ascii iso2022_jp_2 utf_32 utf_32_be utf_32_le utf_16 utf_16_be "
+        "utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+    "zh-tw": (
+        "ascii cp932 cp949 cp950 euc_jp euc_jis_2004 euc_jisx0213 euc_kr "
+        "iso2022_jp iso2022_jp_1 iso2022_jp_2 iso2022_jp_2004 iso2022_jp_3 "
+        "iso2022_jp_ext johab shift_jis utf_32 utf_32_be utf_32_le utf_16 "
+        "utf_16_be utf_16_le utf_7 utf_8 utf_8_sig"
+    ),
+}
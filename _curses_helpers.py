@@ -1,11 +1,42 @@
 import curses
+import functools
 import re
 
 re_nonascii = re.compile("[^a-zA-Z0-9#:~,._ -\[\]]")
 KEY_SPACEBAR = 32
+KEY_ENTER = 10
+KEY_ESCAPE = 27
+KEYS_BACKSPACE = (curses.KEY_BACKSPACE, 8, 127)
+
+
+@functools.lru_cache(maxsize=4096)
+def get_spans(line):
+    """Start and length of each run of non-ascii characters in line"""
+    spans = []
+    for m in re_nonascii.finditer(line):
+        if spans and spans[-1][0] + spans[-1][1] == m.start():
+            spans[-1][1] += 1
+        else:
+            spans.append([m.start(), 1])
+    return tuple((x, length) for x, length in spans)
+
+
+@functools.lru_cache(maxsize=64)
+def layout(text, width, rows):
+    """The first rows lines of text, cut and padded to width, with their spans"""
+    lines = text.splitlines()[:rows]
+    lines += [""] * (rows - len(lines))
+    return tuple((l[:width].ljust(width), get_spans(l[:width])) for l in lines)
 
 
 class Window:
+    """
+    A bordered window showing a title and some text, non-ascii characters are
+    highlighted. Only lines, which changed since the last refresh, are drawn.
+    refresh() updates the screen at once, noutrefresh() leaves that to a
+    single curses.doupdate() after all windows are drawn.
+    """
+
     def __init__(self, y, height, x, width, title="", text=""):
         self.y = y
         self.height = height
@@ -14,28 +45,55 @@ class Window:
         self.win = curses.newwin(self.height, self.width, self.y, self.x)
         self.title = title
         self.text = text
+        # line shown in reverse video, if any
+        self.highlight = None
+        # what is on screen: title and (line, spans, highlighted) for each row
+        self.shown_title = None
+        self.shown = None
+
+    @property
+    def rows(self):
+        return self.height - 4
 
     def set_title(self, title):
         self.title = title
-        self.refresh()
 
     def set_text(self, text):
         self.text = text
-        self.refresh()
 
-    def refresh(self):
-        self.win.clear()
+    def invalidate(self):
+        """Draw everything on the next refresh, e.g. after the screen was cleared"""
+        self.shown_title = None
+        self.shown = None
+
+    def draw_title(self):
         self.win.border()
-        self.win.addstr(0, 1, self.title)
-
-        y = 2
-        for line in self.text.splitlines():
-            line = line[: self.width - 3]
-            self.win.addstr(y, 2, line)
-            for x in (m.start() for m in re_nonascii.finditer(line)):
-                self.win.chgat(y, 2 + x, 1, curses.color_pair(3))
-            y += 1
-            if y > self.height - 3:
-                break
-
-        self.win.refresh()
+        self.win.addstr(0, 1, self.title[: self.width - 2])
+        self.shown_title = self.title
+
+    def draw_line(self, row, line, spans, highlighted):
+        attr = curses.A_REVERSE if highlighted else curses.A_NORMAL
+        self.win.addstr(2 + row, 2, line, attr)
+        for x, length in spans:
+            self.win.chgat(2 + row, 2 + x, length, curses.color_pair(3) | attr)
+
+    def noutrefresh(self):
+        lines = layout(self.text, self.width - 3, self.rows)
+
+        if self.shown is None:
+            self.win.erase()
+            self.shown = [None] * self.rows
+        if self.title != self.shown_title:
+            self.draw_title()
+
+        for row, (line, spans) in enumerate(lines):
+            state = (line, spans, row == self.highlight)
+            if self.shown[row] != state:
+                self.draw_line(row, *state)
+                self.shown[row] = state
+
+        self.win.noutrefresh()
+
+    def refresh(self):
+        self.noutrefresh()
+        curses.doupdate()
@@ -0,0 +1,106 @@
+"""
+Statistical encoding classifier. Knows how often each pair of bytes, of which at
+least one is non-ascii, appears in songs of each language encoded with each
+encoding. Trained by train_encoding_model.py, used by recode_language.py.
+"""
+
+from collections import defaultdict
+
+import numpy as np
+
+# added to every count, so unseen byte pairs are unlikely, but not impossible
+SMOOTHING = 0.5
+# labels with less byte pairs than this are not worth keeping
+MIN_PAIRS = 50
+# log likelihood ratio, below which guesses are left to trial decoding
+MIN_CONFIDENCE = 10.0
+
+
+def byte_pairs(content):
+    """Codes of all byte pairs in content with at least one non-ascii byte"""
+    data = np.frombuffer(content, dtype=np.uint8)
+    first, second = data[:-1], data[1:]
+    non_ascii = (first >= 0x80) | (second >= 0x80)
+    return first[non_ascii].astype(np.int32) << 8 | second[non_ascii]
+
+
+class Trainer:
+    def __init__(self):
+        self.counts = defaultdict(lambda: np.zeros(1 << 16, dtype=np.int32))
+
+    def add(self, encoding, language, content):
+        pairs, counts = np.unique(byte_pairs(content), return_counts=True)
+        self.counts[encoding, language][pairs] += counts
+
+    def save(self, path):
+        labels = [l for l, c in self.counts.items() if c.sum() >= MIN_PAIRS]
+        counts = np.array([self.counts[l] for l in labels], dtype=np.float64)
+
+        vocabulary = np.flatnonzero(counts.sum(axis=0))
+        # the last column stands for all byte pairs never seen in training
+        counts = np.hstack((counts[:, vocabulary], np.zeros((len(labels), 1))))
+        counts += SMOOTHING
+        log_probabilities = np.log(counts / counts.sum(axis=1, keepdims=True))
+
+        np.savez_compressed(
+            path,
+            vocabulary=vocabulary.astype(np.uint16),
+            log_probabilities=log_probabilities.astype(np.float16),
+            labels=np.array([f"{e}/{l}" for e, l in labels]),
+        )
+
+
+class EncodingModel:
+    def __init__(self, path, min_confidence=MIN_CONFIDENCE):
+        self.min_confidence = min_confidence
+
+        with np.load(path) as data:
+            vocabulary = data["vocabulary"]
+            self.log_probabilities = data["log_probabilities"].astype(np.float32)
+            self.labels = [tuple(l.split("/", 1)) for l in data["labels"]]
+
+        self.columns = np.full(1 << 16, len(vocabulary), dtype=np.int32)
+        self.columns[vocabulary] = np.arange(len(vocabulary))
+
+    def scores(self, content):
+        """Log likelihood of content for each (encoding, language) label"""
+        columns = self.columns[byte_pairs(content)]
+        counts = np.bincount(columns, minlength=self.log_probabilities.shape[1])
+        return self.log_probabilities @ counts.astype(np.float32)
+
+    def guess(self, content):
+        """
+        Return the most likely encoding, its language and the confidence, i.e.
+        how much more likely it is than the best encoding producing a different
+        text, as a log likelihood ratio. Encodings, that fail to decode the
+        content, are skipped. Returns None, if none of them works.
+        """
+        scores = self.scores(content)
+        texts = {}
+        best = None
+
+        for n in np.argsort(-scores):
+            encoding, language = self.labels[n]
+            if encoding not in texts:
+                try:
+                    texts[encoding] = content.decode(encoding)
+                except ValueError:
+                    texts[encoding] = None
+
+            text = texts[encoding]
+            if text is None:
+                continue
+
+            if best is None:
+                best = encoding, language, text, scores[n]
+            elif text != best[2]:
+                return best[0], best[1], float(best[3] - scores[n])
+
+        if best:
+            return best[0], best[1], float("inf")
+
+    def classify(self, content):
+        """Return encoding and language, None if the model is not confident"""
+        guess = self.guess(content)
+        if guess and guess[2] >= self.min_confidence:
+            return guess[:2]
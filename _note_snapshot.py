@@ -0,0 +1,188 @@
+"""
+Columnar snapshot of the notes of a whole library in a single file. Written by
+export_notes.py, read by NoteSnapshot, which maps the file into memory, so the
+arrays are views of the file and nothing is parsed or copied while loading.
+
+The file starts with MAGIC, the size of a JSON directory and the directory. The
+directory names the dtype, offset and length of each array. The arrays follow,
+each aligned to ALIGNMENT bytes:
+
+  kinds, starts, lengths,     one entry per note: type as ascii code, start
+  pitches, singers, syllables beat counted from the start of the song, length,
+                              pitch, number of the P section, 0 for none, and
+                              the syllable as string id
+  note_offsets                the notes of song n are note_offsets[n] to
+                              note_offsets[n + 1]
+  paths                       string id of the path of each song
+  header_values               string id of the value of each of the directory's
+                              fields for each song, 0, i.e. "", if missing
+  strings, string_offsets     the utf-8 encoded strings, string i is
+                              strings[string_offsets[i]:string_offsets[i + 1]]
+"""
+
+import json
+import mmap
+import os
+import struct
+
+import numpy as np
+
+MAGIC = b"USNOTES\0"
+VERSION = 1
+ALIGNMENT = 64
+PREAMBLE = struct.Struct("<8sQ")
+
+NOTE_DTYPES = {
+    "kinds": np.uint8,
+    "starts": np.int32,
+    "lengths": np.int32,
+    "pitches": np.int16,
+    "singers": np.uint8,
+    "syllables": np.uint32,
+}
+
+
+def align(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+class SnapshotWriter:
+    """Collects songs and writes them as a snapshot"""
+
+    def __init__(self):
+        self.ids = {"": 0}
+        self.notes = {name: [] for name in NOTE_DTYPES}
+        self.counts = []
+        self.paths = []
+        self.headers = []
+        self.fields = {}
+
+    def intern(self, string):
+        return self.ids.setdefault(string, len(self.ids))
+
+    def add(self, path, header, notes, syllables):
+        """
+        Add a song. notes maps the names in NOTE_DTYPES but syllables to
+        arrays, syllables holds the distinct syllables of the song and notes
+        ["syllables"] indexes them.
+        """
+        ids = np.array([self.intern(s) for s in syllables], dtype=np.uint32)
+
+        for name, dtype in NOTE_DTYPES.items():
+            column = ids[notes[name]] if name == "syllables" else notes[name]
+            self.notes[name].append(np.asarray(column, dtype=dtype))
+
+        self.counts.append(len(notes["starts"]))
+        self.paths.append(self.intern(path))
+        self.headers.append(
+            {
+                self.fields.setdefault(name, len(self.fields)): self.intern(value)
+                for name, value in header.items()
+            }
+        )
+
+    def get_arrays(self):
+        arrays = {
+            name: np.concatenate(columns) if columns else np.zeros(0, dtype)
+            for (name, columns), dtype in zip(self.notes.items(), NOTE_DTYPES.values())
+        }
+
+        arrays["note_offsets"] = np.concatenate(([0], np.cumsum(self.counts)))
+        arrays["note_offsets"] = arrays["note_offsets"].astype(np.uint64)
+        arrays["paths"] = np.array(self.paths, dtype=np.uint32)
+
+        header_values = np.zeros((len(self.headers), len(self.fields)), np.uint32)
+        for n, header in enumerate(self.headers):
+            header_values[n, list(header)] = list(header.values())
+        arrays["header_values"] = header_values.ravel()
+
+        encoded = [s.encode("utf-8") for s in self.ids]
+        arrays["strings"] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        lengths = np.fromiter((len(e) for e in encoded), np.uint64, len(encoded))
+        arrays["string_offsets"] = np.concatenate(([0], np.cumsum(lengths)))
+        arrays["string_offsets"] = arrays["string_offsets"].astype(np.uint64)
+
+        return arrays
+
+    def write(self, path):
+        """Write the snapshot to a temporary file, which then replaces path"""
+        arrays = self.get_arrays()
+        directory = {
+            "version": VERSION,
+            "songs": len(self.counts),
+            "fields": list(self.fields),
+            "arrays": {},
+        }
+
+        offset = 0
+        for name, array in arrays.items():
+            directory["arrays"][name] = [array.dtype.str, offset, len(array)]
+            offset = align(offset + array.nbytes)
+        encoded = json.dumps(directory).encode()
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(PREAMBLE.pack(MAGIC, len(encoded)))
+            f.write(encoded)
+            start = align(f.tell())
+
+            for name, array in arrays.items():
+                f.seek(start + directory["arrays"][name][1])
+                f.write(array.tobytes())
+
+        os.replace(tmp_path, path)
+
+
+class NoteSnapshot:
+    """
+    A snapshot written by SnapshotWriter. The arrays named in the module's
+    docstring are attributes, header_values has a column per field.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, size = PREAMBLE.unpack_from(self.mmap)
+        if magic != MAGIC:
+            raise ValueError(f"not a note snapshot: {path}")
+
+        directory = json.loads(self.mmap[PREAMBLE.size : PREAMBLE.size + size])
+        if directory["version"] != VERSION:
+            raise ValueError(f"unsupported note snapshot version: {path}")
+
+        self.fields = directory["fields"]
+        start = align(PREAMBLE.size + size)
+
+        for name, (dtype, offset, length) in directory["arrays"].items():
+            array = np.frombuffer(self.mmap, dtype, length, start + offset)
+            setattr(self, name, array)
+
+        shape = (len(self.paths), len(self.fields))
+        self.header_values = self.header_values.reshape(shape)
+
+    def __len__(self):
+        return len(self.paths)
+
+    def string(self, n):
+        start, end = self.string_offsets[n : n + 2]
+        return self.strings[start:end].tobytes().decode("utf-8")
+
+    def notes(self, n):
+        """The slice of the note arrays holding the notes of song n"""
+        return slice(int(self.note_offsets[n]), int(self.note_offsets[n + 1]))
+
+    def path(self, n):
+        return self.string(self.paths[n])
+
+    def header(self, n):
+        """The attributes of song n"""
+        return {
+            field: self.string(value)
+            for field, value in zip(self.fields, self.header_values[n])
+            if value
+        }
+
+    def lyrics(self, n):
+        """The syllables of song n"""
+        return [self.string(s) for s in self.syllables[self.notes(n)]]
@@ -0,0 +1,112 @@
+"""
+Run statistics for the --stats and --profile options of the tools. Counters and
+stage timers are cheap enough to be used unconditionally. Everything that needs
+a system call is only done, when statistics have been requested.
+"""
+
+import cProfile
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+counters = Counter()
+stages = Counter()
+caches = {}
+enabled = False
+# counters and stages are updated by several threads, e.g. in _where.select
+lock = threading.Lock()
+
+
+def count(name, n=1):
+    with lock:
+        counters[name] += n
+
+
+@contextmanager
+def stage(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        with lock:
+            stages[name] += seconds
+
+
+def read(path):
+    count("files_read")
+    if enabled:
+        count("bytes_read", os.path.getsize(path))
+
+
+def written(path):
+    count("files_written")
+    if enabled:
+        count("bytes_written", os.path.getsize(path))
+
+
+def register_cache(name, func):
+    """Report hits and misses of a functools.lru_cache'd function"""
+    caches[name] = func
+
+
+def add_arguments(parser):
+    parser.add_argument(
+        "--stats",
+        metavar="FILE",
+        help="write run statistics as JSON to FILE, - for stderr",
+    )
+    parser.add_argument(
+        "--profile", metavar="FILE", help="write a cProfile dump to FILE"
+    )
+
+
+def get_stats(tool, seconds):
+    cache_counters = Counter()
+
+    for name, func in caches.items():
+        info = func.cache_info()
+        cache_counters[f"{name}_cache_hits"] += info.hits
+        cache_counters[f"{name}_cache_misses"] += info.misses
+
+    return {
+        "tool": tool,
+        "seconds": seconds,
+        "peak_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        "counters": dict(counters + cache_counters),
+        "stages": dict(stages),
+    }
+
+
+@contextmanager
+def collect(args):
+    """Collect statistics while running the tool, if requested by args"""
+    global enabled
+
+    tool = os.path.basename(sys.argv[0])
+    enabled = bool(args.stats)
+    profiler = cProfile.Profile() if args.profile else None
+    start = time.perf_counter()
+
+    if profiler:
+        profiler.enable()
+
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+
+        if args.stats == "-":
+            print(json.dumps(get_stats(tool, seconds)), file=sys.stderr)
+        elif args.stats:
+            with open(args.stats, "w") as f:
+                json.dump(get_stats(tool, seconds), f)
@@ -1,25 +1,40 @@
+import codecs
+import os
 import re
+import shutil
+import tempfile
 
+import _stats
 from _builtinencodings import encodings
 
+# headers are short, they are read in chunks of this size until their end
+HEADER_CHUNK = 4096
+
+line_ending = re.compile(rb"\r\n|\r|\n")
+
 box_char = re.compile(
     "[─━│┃┄┅┆┇┈┉┊┋┌┍┎┏┐┑┒┓└┕┖┗┘┙┚┛├┝┞┟┠┡┢┣┤┥┦┧┨┩┪┫┬┭┮┯┰┱┲┳┴┵┶┷┸┹┺┻┼┽┾┿╀╁╂╃╄╅╆╇╈╉╊╋╌╍╎╏═║╒╓╔╕╖╗╘╙╚╛╜╝╞╟╠╡╢╣╤╥╦╧╨╩╪╫╬╭╮╯╰╱╲╳╴╵╶╷╸╹╺╻╼╽╾╿]"
 )
 
 
-def find_decodings(content):
+def find_decodings(content, candidates=encodings):
     seen = set()
     unlikely_encodings = []
 
-    for encoding in encodings:
+    for encoding in candidates:
+        _stats.count("codecs_tried")
+
         try:
             text = content.decode(encoding)
         except ValueError:
+            _stats.count("codecs_rejected")
             continue
 
         if text in seen:
+            _stats.count("codecs_rejected")
             continue
         if "\n#" not in text:  # some encodings produce complete gibberish - skip them
+            _stats.count("codecs_rejected")
             continue
 
         if box_char.findall(text):
@@ -42,6 +57,16 @@ def get_attribute(text, attribute):
         raise KeyError(attribute)
 
 
+def get_attributes(header):
+    """The attributes in the header of a song as dict, names in upper case"""
+    attributes = {}
+    for line in header.lstrip("\ufeff").splitlines():
+        if line.startswith("#"):
+            name, _, value = line[1:].partition(":")
+            attributes.setdefault(name.strip().upper(), value.strip())
+    return attributes
+
+
 def set_attribute(lines, attr, value):
     found = False
     for line in lines:
@@ -57,6 +82,134 @@ def set_attribute(lines, attr, value):
             yield f"{line}\n"
 
 
+def _read_header_bytes(f):
+    """
+    The header of the song in the binary file f, as bytes. Blank lines between
+    attributes belong to it, those after the last one don't.
+    """
+    data = f.read(HEADER_CHUNK)
+    end = len(codecs.BOM_UTF8) if data.startswith(codecs.BOM_UTF8) else 0
+    header_end = end
+
+    while True:
+        # a whole line, the byte after a "\r" tells, whether it ends with it
+        line_end = line_ending.search(data, end)
+        while not line_end or line_end.end() == len(data):
+            chunk = f.read(HEADER_CHUNK)
+            if not chunk:
+                break
+            data += chunk
+            line_end = line_ending.search(data, end)
+
+        line = data[end : line_end.start() if line_end else len(data)]
+        if line.startswith(b"#"):
+            header_end = line_end.end() if line_end else len(data)
+        elif line.strip():
+            return data[:header_end]
+
+        if not line_end:
+            return data[:header_end]
+        end = line_end.end()
+
+
+def read_header(path, errors="strict"):
+    """
+    Return the header of the song at path, i.e. the lines starting with "#" at
+    its start, as text with "\n" line endings, like a file opened in text mode,
+    and the size of the header in bytes, i.e. where the body starts. The body
+    is neither read nor decoded. errors is passed to bytes.decode.
+    """
+    with open(path, "rb") as f:
+        header = _read_header_bytes(f)
+
+    _stats.count("files_read")
+    _stats.count("bytes_read", len(header))
+    text = header.decode("utf-8", errors).replace("\r\n", "\n").replace("\r", "\n")
+    return text, len(header)
+
+
+def copy_range(src, dst, offset, count):
+    """
+    Copy count bytes at offset of the file descriptor src to the position of
+    dst, by the kernel if possible
+    """
+    while count > 0:
+        try:
+            copied = os.copy_file_range(src, dst, count, offset)
+        except (AttributeError, OSError):
+            try:
+                copied = os.sendfile(dst, src, offset, count)
+            except (AttributeError, OSError):
+                data = os.pread(src, min(count, 1 << 20), offset)
+                copied = os.write(dst, data) if data else 0
+
+        if not copied:
+            raise EOFError("file was truncated while copying")
+        offset += copied
+        count -= copied
+
+
+def edit_header(path, changes):
+    """
+    Set the attributes of the song at path to the values of the dict changes,
+    remove those set to None. Missing attributes are added to the end of the
+    header. The new header is written to a temporary file, followed by a copy
+    of the unchanged body, which then replaces the song. Return whether the
+    song changed.
+    """
+    with open(path, "rb") as f:
+        header = _read_header_bytes(f)
+        bom = codecs.BOM_UTF8 if header.startswith(codecs.BOM_UTF8) else b""
+
+        lines = header[len(bom) :].decode("utf-8").splitlines(True)
+        # new lines end like the first one
+        newline = lines[0][len(lines[0].rstrip("\r\n")) :] if lines else ""
+        newline = newline or "\n"
+        if lines and not lines[-1].endswith(("\r", "\n")):
+            lines[-1] += newline
+
+        new_lines = []
+        done = set()
+        for line in lines:
+            attr = line[1:].partition(":")[0]
+            if attr not in changes:
+                new_lines.append(line)
+            elif attr not in done and changes[attr] is not None:
+                ending = line[len(line.rstrip("\r\n")) :]
+                new_lines.append(f"#{attr}:{changes[attr]}{ending}")
+            done.add(attr)
+
+        for attr, value in changes.items():
+            if attr not in done and value is not None:
+                new_lines.append(f"#{attr}:{value}{newline}")
+
+        new_header = bom + "".join(new_lines).encode("utf-8")
+        _stats.count("files_read")
+        _stats.count("bytes_read", len(header))
+        if new_header == header:
+            return False
+
+        body = os.fstat(f.fileno()).st_size - len(header)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=".", suffix=".tmp", dir=os.path.dirname(path) or "."
+        )
+        try:
+            with open(fd, "wb") as tmp:
+                tmp.write(new_header)
+                tmp.flush()
+                copy_range(f.fileno(), tmp.fileno(), len(header), body)
+            shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    _stats.count("files_written")
+    _stats.count("bytes_written", len(new_header))
+    _stats.count("bytes_copied", body)
+    return True
+
+
 def get_artisttitle(text):
     artist = get_attribute(text, "ARTIST")
     title = get_attribute(text, "TITLE")
@@ -64,8 +217,75 @@ def get_artisttitle(text):
 
 
 def get_number_of_singers(text):
-    singers = len(re.findall("^P[0-9]+$", text))
-    return singers - 1 if singers > 1 else singers
+    """The number of distinct P sections, 1 for songs without them"""
+    singers = set(re.findall(r"^P[ \t]*([0-9]+)\s*$", text, re.MULTILINE))
+    return max(len(singers), 1)
+
+
+NOTE_TYPES = (":", "*", "F", "R", "G")
+
+
+def parse_note_line(line):
+    """
+    Split a line of the song body into its type and fields:
+
+      notes        (type, start, length, pitch, syllable)
+      line breaks  ("-", beat, second beat or None)
+      singers      ("P", number)
+      tempo        ("B", beat, bpm), the bpm from this beat on
+      the end      ("E",)
+
+    Raises ValueError for anything else.
+    """
+    # notes are by far the most common, split them before anything else
+    fields = line.split(" ", 4)
+    kind = fields[0]
+
+    if kind in NOTE_TYPES and len(fields) >= 4:
+        syllable = fields[4].rstrip("\r\n") if len(fields) == 5 else ""
+        return kind, int(fields[1]), int(fields[2]), int(fields[3]), syllable
+
+    line = line.rstrip("\r\n")
+    kind = line[:1]
+
+    if kind == "-":
+        beats = [int(b) for b in line[1:].split()]
+        if not 1 <= len(beats) <= 2:
+            raise ValueError(f"malformed line break: {line}")
+        return "-", beats[0], beats[1] if len(beats) == 2 else None
+
+    if kind == "P":
+        return "P", int(line[1:])
+
+    if kind == "B":
+        fields = line[1:].split()
+        if len(fields) != 2:
+            raise ValueError(f"malformed tempo change: {line}")
+        return "B", int(fields[0]), float(fields[1].replace(",", "."))
+
+    if line.strip() == "E":
+        return ("E",)
+
+    raise ValueError(f"malformed line: {line}")
+
+
+def iter_notes(lines):
+    """
+    Parse the song body, see parse_note_line, up to the E line. Header, blank
+    and malformed lines are skipped.
+    """
+    for line in lines:
+        if line.startswith("#") or not line.strip():
+            continue
+
+        try:
+            item = parse_note_line(line)
+        except ValueError:
+            continue
+
+        if item[0] == "E":
+            return
+        yield item
 
 
 def get_lyrics(text):
@@ -0,0 +1,228 @@
+"""
+Filter expressions for the --where option of the tools, evaluated against the
+header of a song, e.g.
+
+  LANGUAGE=English and YEAR<1990 and has(VIDEO)
+
+A comparison is an attribute, one of the operators below and a value, which
+must be quoted, if it contains spaces or operator characters:
+
+  =  !=          equal, not equal, ignoring case
+  <  <=  >  >=   compared as numbers, if both sides are numbers like 1990 or
+                 225,55, else as text, ignoring case
+  ~              contains, ignoring case
+
+Comparisons with attributes, which the song doesn't have, are false. has(ATTR)
+is true, if the attribute is set and not empty. Comparisons are combined with
+not, and, or, in this order of precedence, and parentheses.
+"""
+
+import argparse
+import operator
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import _stats
+from _utils import get_attributes, read_header
+
+token = re.compile(
+    r"""\s*(?:(?P<string>"[^"]*"|'[^']*')|(?P<symbol>!=|<=|>=|[=<>~()])|(?P<word>[^\s"'!=<>~()]+))"""
+)
+
+OPERATORS = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "~": operator.contains,
+}
+
+KEYWORDS = ("and", "or", "not")
+
+
+def to_number(value):
+    try:
+        return float(value.replace(",", "."))
+    except ValueError:
+        return None
+
+
+def tokenize(expression):
+    """Yield the tokens of expression as (kind, text)"""
+    expression = expression.rstrip()
+    position = 0
+
+    while position < len(expression):
+        match = token.match(expression, position)
+        if not match:
+            raise ValueError(f"unexpected {expression[position:]!r}")
+
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == "string":
+            text = text[1:-1]
+        elif kind == "word" and text.lower() in KEYWORDS:
+            kind = text = text.lower()
+
+        yield kind, text
+        position = match.end()
+
+
+def comparison(attribute, symbol, value):
+    compare = OPERATORS[symbol]
+    number = to_number(value) if symbol != "~" else None
+    value = value.casefold()
+
+    def predicate(attributes):
+        actual = attributes.get(attribute)
+        if actual is None:
+            return False
+
+        if number is not None:
+            actual_number = to_number(actual)
+            if actual_number is not None:
+                return compare(actual_number, number)
+
+        return compare(actual.casefold(), value)
+
+    return predicate
+
+
+class Parser:
+    def __init__(self, expression):
+        self.tokens = list(tokenize(expression))
+        self.position = 0
+
+    def peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None, None
+
+    def take(self, *kinds):
+        kind, text = self.peek()
+        if kind not in kinds and text not in kinds:
+            found = repr(text) if kind else "end of expression"
+            raise ValueError(f"expected {' or '.join(kinds)}, found {found}")
+
+        self.position += 1
+        return text
+
+    def parse(self):
+        predicate = self.parse_or()
+        kind, text = self.peek()
+        if kind:
+            raise ValueError(f"unexpected {text!r}")
+        return predicate
+
+    def parse_or(self):
+        terms = [self.parse_and()]
+        while self.peek()[0] == "or":
+            self.take("or")
+            terms.append(self.parse_and())
+
+        if len(terms) == 1:
+            return terms[0]
+        return lambda attributes: any(term(attributes) for term in terms)
+
+    def parse_and(self):
+        terms = [self.parse_not()]
+        while self.peek()[0] == "and":
+            self.take("and")
+            terms.append(self.parse_not())
+
+        if len(terms) == 1:
+            return terms[0]
+        return lambda attributes: all(term(attributes) for term in terms)
+
+    def parse_not(self):
+        if self.peek()[0] == "not":
+            self.take("not")
+            term = self.parse_not()
+            return lambda attributes: not term(attributes)
+
+        return self.parse_term()
+
+    def parse_term(self):
+        if self.peek()[1] == "(":
+            self.take("(")
+            predicate = self.parse_or()
+            self.take(")")
+            return predicate
+
+        attribute = self.take("word", "string").upper()
+
+        if attribute == "HAS" and self.peek()[1] == "(":
+            self.take("(")
+            attribute = self.take("word", "string").upper()
+            self.take(")")
+            return lambda attributes: bool(attributes.get(attribute))
+
+        symbol = self.take(*OPERATORS)
+        value = self.take("word", "string")
+        return comparison(attribute, symbol, value)
+
+
+def parse(expression):
+    """
+    Return a predicate, which tells whether the attributes of a song, as
+    returned by _utils.get_attributes, match the expression
+    """
+    return Parser(expression).parse()
+
+
+def parse_argument(expression):
+    try:
+        return parse(expression)
+    except ValueError as ex:
+        raise argparse.ArgumentTypeError(f"invalid expression: {ex}")
+
+
+def add_argument(parser, help="only process songs, whose header matches EXPR"):
+    parser.add_argument(
+        "--where",
+        metavar="EXPR",
+        type=parse_argument,
+        help=help
+        + ', e.g. "LANGUAGE=English and YEAR<1990 and has(VIDEO)". Operators: = != < <= > >= ~ (contains), has(ATTR), not, and, or, parentheses.',
+    )
+
+
+def select(paths, where, jobs=None, errors="strict", keep_undecodable=False):
+    """
+    Yield the paths of the songs matching the predicate where, in order. Only
+    the headers are read, by jobs threads, and decoded as UTF-8 with the given
+    errors handling, like the tool reads the songs. Songs, whose header can't
+    be decoded, are yielded with keep_undecodable, for tools reporting them
+    themselves. Other songs, whose header can't be read, can't match and are
+    reported on stderr like
+
+      ERROR <TAB> reason <TAB> path
+    """
+    if where is None:
+        yield from paths
+        return
+
+    def matches(path):
+        try:
+            header, _ = read_header(path, errors)
+        except UnicodeDecodeError as ex:
+            return True if keep_undecodable else ex
+        except OSError as ex:
+            return ex
+
+        return where(get_attributes(header))
+
+    paths = list(paths)
+
+    with ThreadPoolExecutor(jobs) as executor:
+        for path, selected in zip(paths, executor.map(matches, paths)):
+            if isinstance(selected, Exception):
+                _stats.count("where_unreadable")
+                print(f"ERROR\t{selected}\t{path}", file=sys.stderr)
+            elif selected:
+                yield path
+            else:
+                _stats.count("where_rejected")
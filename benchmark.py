@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from _utils import find_decodings, get_lyrics
+from check_health import check_health
+from integrate_collection import SongCollection
+
+HELP = """
+For maintainer use only. Time the hot paths of the tools and some complete tool
+runs on synthetic libraries created by generate_library.py. Reports throughput
+and peak memory for each benchmark and library size. Each benchmark runs in its
+own process, so memory usage of one does not affect the others.
+
+Results can be saved and used as a baseline for later runs. When comparing
+against a baseline, the script exits with 1 if the throughput of any benchmark
+dropped by more than the given tolerance.
+"""
+
+benchmarks = []
+script_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+def benchmark(name):
+    def inner(func):
+        benchmarks.append((name, func))
+
+    return inner
+
+
+def song_files(library):
+    return sorted(glob.glob(os.path.join(library, "*", "*", "*.txt")))
+
+
+@benchmark("find_decodings")
+def bench_find_decodings(library):
+    paths = song_files(library)
+
+    for path in paths:
+        with open(path, "rb") as f:
+            for _ in find_decodings(f.read()):
+                pass
+
+    return len(paths)
+
+
+@benchmark("get_lyrics")
+def bench_get_lyrics(library):
+    paths = song_files(library)
+
+    for path in paths:
+        with open(path, errors="ignore") as f:
+            for _ in get_lyrics(f.read()):
+                pass
+
+    return len(paths)
+
+
+@benchmark("check_health")
+def bench_check_health(library):
+    paths = song_files(library)
+
+    for path in paths:
+        check_health(path, None)
+
+    return len(paths)
+
+
+@benchmark("SongCollection.load")
+def bench_load(library):
+    collection = SongCollection(library)
+    collection.load()
+    return len(collection.songs)
+
+
+@benchmark("SongCollection.find_matches")
+def bench_find_matches(library, needles=200):
+    collection = SongCollection(library)
+    collection.load()
+
+    step = max(len(collection.songs) // needles, 1)
+    needles = collection.songs[::step]
+    for needle in needles:
+        collection.find_matches(needle, 3)
+
+    return len(needles)
+
+
+def tool(script, *args):
+    def run(library):
+        script_path = os.path.join(script_dir, script)
+        subprocess.run(
+            [sys.executable, script_path] + [a.format(library=library) for a in args],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        return len(song_files(library))
+
+    return run
+
+
+benchmark("find_unused_files.py")(tool("find_unused_files.py", "{library}"))
+benchmark("find_duplicate_media.py")(tool("find_duplicate_media.py", "{library}"))
+benchmark("integrate_collection.py")(
+    tool(
+        "integrate_collection.py",
+        "{library}/collection_00",
+        "{library}/collection_01",
+        "80-100",
+        "{library}/duplicates",
+        "--dry-run",
+    )
+)
+benchmark("cluster_collections.py")(
+    tool("cluster_collections.py", "{library}", "--plan", os.devnull)
+)
+
+
+def measure(func, library):
+    """
+    Run func in a child process, return the number of processed items, the
+    time it took and the peak resident memory of the child.
+    """
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+
+    if pid == 0:
+        os.close(read_end)
+        status = 1
+        try:
+            start = time.perf_counter()
+            items = func(library)
+            result = [items, time.perf_counter() - start]
+            os.write(write_end, json.dumps(result).encode())
+            status = 0
+        finally:
+            os._exit(status)
+
+    os.close(write_end)
+    with os.fdopen(read_end) as f:
+        output = f.read()
+
+    _, status, rusage = os.wait4(pid, 0)
+    if status:
+        raise Exception("benchmark failed")
+
+    items, seconds = json.loads(output)
+    return items, seconds, rusage.ru_maxrss * 1024
+
+
+def get_library(workdir, size):
+    library = os.path.join(workdir, str(size))
+    marker = os.path.join(library, ".complete")
+
+    if not os.path.exists(marker):
+        print(f"generating library of {size} songs in {library}", file=sys.stderr)
+        script_path = os.path.join(script_dir, "generate_library.py")
+        subprocess.run(
+            [sys.executable, script_path, library, "--songs", str(size), "--force"],
+            check=True,
+        )
+        open(marker, "w").close()
+
+    return library
+
+
+def compare(result, baseline, tolerance):
+    for old in baseline:
+        if (old["name"], old["size"]) == (result["name"], result["size"]):
+            change = result["throughput"] / old["throughput"] - 1
+            regression = change < -tolerance
+            return f"{change:+.0%}" + (" REGRESSION" if regression else ""), regression
+
+    return "", False
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=HELP)
+    parser.add_argument(
+        "--sizes",
+        default="1000,10000,100000",
+        help="comma separated list of library sizes, default: 1000,10000,100000",
+    )
+    parser.add_argument(
+        "--workdir",
+        default=os.path.join(tempfile.gettempdir(), "usdx-benchmark"),
+        help="directory to keep the generated libraries in",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        help="run only the given benchmarks, may be given multiple times",
+    )
+    parser.add_argument("--baseline", help="compare the results to this file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="allowed drop in throughput compared to the baseline, default: 0.2",
+    )
+    parser.add_argument("--save", help="write the results to this file")
+    args = parser.parse_args(argv)
+
+    baseline = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = []
+    found_regression = False
+
+    for size in (int(s) for s in args.sizes.split(",")):
+        library = get_library(args.workdir, size)
+
+        for name, func in benchmarks:
+            if args.only and name not in args.only:
+                continue
+
+            items, seconds, peak_memory = measure(func, library)
+            result = {
+                "name": name,
+                "size": size,
+                "items": items,
+                "seconds": seconds,
+                "throughput": items / seconds,
+                "peak_memory": peak_memory,
+            }
+            results.append(result)
+
+            change, regression = compare(result, baseline, args.tolerance)
+            found_regression |= regression
+
+            line = (
+                f"{name:30} {size:>7} {items:>7} items {seconds:8.2f} s "
+                f"{result['throughput']:10.1f}/s {peak_memory / 2**20:8.1f} MiB "
+                f"{change}"
+            )
+            print(line.rstrip())
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    return 1 if found_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+import argparse
+import functools
+import json
+import sys
+import time
+from collections import Counter, defaultdict
+
+import recode_asktheweb
+import recode_language
+from _builtinencodings import encodings
+from _utils import find_decodings, get_attribute
+
+HELP = """
+For maintainer use only. Measure speed and accuracy of the different ways to
+guess the encoding of a file. Takes known-good UTF-8 encoded ultrastar files,
+encodes each of them in every supported encoding, that can represent it and
+lets each strategy guess the encoding. A guess is correct, if decoding with the
+guessed encoding results in the original text. Prints the throughput, the
+accuracy per #LANGUAGE and the most common confusions of each strategy.
+
+recode_asktheweb queries an online service for each guess and must be enabled
+explicitly with --strategy. The classifier strategies need a model from
+train_encoding_model.py, which should not be trained on the measured files:
+"classifier" is the model's best guess, "classifier+fallback" is what
+recode_language.py --model does.
+"""
+
+
+def guess_find_decodings(content):
+    return next(find_decodings(content))[0]
+
+
+def guess_recode_language(content):
+    text = next(find_decodings(content))[1]
+    language = recode_language.guess_lyric_language(text)
+    anti_alphabet = recode_language.get_anti_alphabet(language)
+    candidates = recode_language.get_candidates(language)
+    return recode_language.guess_encoding(content, anti_alphabet, False, candidates)
+
+
+def guess_classifier(model, content):
+    return model.guess(content)[0]
+
+
+def guess_classifier_fallback(model, content):
+    guess = model.classify(content)
+    return guess[0] if guess else guess_recode_language(content)
+
+
+strategies = {
+    "find_decodings": guess_find_decodings,
+    "recode_language": guess_recode_language,
+    "recode_asktheweb": recode_asktheweb.guess_encoding,
+    "classifier": guess_classifier,
+    "classifier+fallback": guess_classifier_fallback,
+}
+model_strategies = ["classifier", "classifier+fallback"]
+default_strategies = ["find_decodings", "recode_language"]
+
+
+def labeled_samples(paths):
+    """Yield (path, language, encoding, text, content) for each encoding of a file"""
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+        except UnicodeDecodeError:
+            print(f"WARNING not utf-8, skipped: {path}", file=sys.stderr)
+            continue
+
+        if text.isascii():
+            continue  # all encodings produce the same result
+
+        try:
+            language = get_attribute(text, "LANGUAGE").strip()
+        except KeyError:
+            language = "unknown"
+
+        for encoding in encodings:
+            try:
+                yield path, language, encoding, text, text.encode(encoding)
+            except UnicodeEncodeError:
+                continue
+
+
+def run_strategy(guess, samples):
+    stats = defaultdict(Counter)
+    confusions = Counter()
+    seconds = 0
+
+    for path, language, encoding, text, content in samples:
+        start = time.perf_counter()
+        try:
+            guessed = guess(content)
+        except Exception:
+            guessed = None
+        seconds += time.perf_counter() - start
+
+        try:
+            correct = guessed is not None and content.decode(guessed) == text
+        except ValueError:
+            correct = False
+
+        stats[language]["samples"] += 1
+        stats[language]["correct"] += correct
+
+        if not correct:
+            confusions[language, encoding, guessed or "error"] += 1
+
+    return stats, confusions, seconds
+
+
+def report(name, stats, confusions, seconds, max_confusions):
+    samples = sum(s["samples"] for s in stats.values())
+    correct = sum(s["correct"] for s in stats.values())
+
+    print(f"{name}: {samples} files, {samples / seconds:.1f} files/s, ", end="")
+    print(f"{correct / samples:.1%} correct")
+
+    for language, s in sorted(stats.items()):
+        print(f"  {language:20} {s['correct'] / s['samples']:7.1%} of {s['samples']}")
+
+    print("  most common confusions (language, true encoding, guessed encoding):")
+    for (language, encoding, guessed), count in confusions.most_common(max_confusions):
+        print(f"    {language:20} {encoding:16} {guessed:16} {count}")
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=HELP)
+    parser.add_argument("files", nargs="+")
+    parser.add_argument(
+        "--strategy",
+        action="append",
+        choices=list(strategies),
+        help=f"strategies to measure, default: {', '.join(default_strategies)}",
+    )
+    parser.add_argument(
+        "--confusions",
+        type=int,
+        default=20,
+        help="number of confusions to print per strategy",
+    )
+    parser.add_argument("--json", help="also write all results to this file")
+    parser.add_argument(
+        "--model", help="model for the classifier strategies, measures them as well"
+    )
+    args = parser.parse_args(argv)
+
+    selected = list(args.strategy or default_strategies)
+    if args.model:
+        from _encoding_model import EncodingModel
+
+        model = EncodingModel(args.model)
+        selected += [s for s in model_strategies if s not in selected]
+    elif any(s in model_strategies for s in selected):
+        parser.error("the classifier strategies need --model")
+
+    samples = list(labeled_samples(args.files))
+    if not samples:
+        print("no non-ascii UTF-8 files given")
+        return 1
+
+    results = {}
+
+    for name in selected:
+        guess = strategies[name]
+        if name in model_strategies:
+            guess = functools.partial(guess, model)
+
+        stats, confusions, seconds = run_strategy(guess, samples)
+        report(name, stats, confusions, seconds, args.confusions)
+
+        results[name] = {
+            "seconds": seconds,
+            "languages": stats,
+            "confusions": [[*k, v] for k, v in confusions.items()],
+        }
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+
+import argparse
+import http.client
+import json
+import random
+import sys
+import threading
+import time
+from urllib.parse import quote, urlsplit
+
+from _utils import get_attributes, read_header
+from search_server import get_song_paths
+
+HELP = """
+For maintainer use only. Measure the latency of a running search_server.py
+under concurrent queries. Queries are made up from artist and title of random
+songs of the given libraries, which should be the ones the server was started
+with. They are shortened or contain a typo now and then, like queries typed by
+a user. Reports the latency percentiles, throughput and how often the song a
+query was made up from was among the results.
+
+The clients run in this process, on a machine with few cores they compete with
+the server for the CPU, which makes latencies look worse.
+"""
+
+
+def make_query(artist, title, rng):
+    query = rng.choice((f"{artist} {title}", title, f"{title} {artist}", artist))
+
+    if rng.random() < 0.3:
+        query = query[: rng.randint(min(len(query), 5), len(query))]
+    if rng.random() < 0.3 and len(query) > 5:
+        n = rng.randrange(len(query))
+        query = query[:n] + rng.choice("aeiourst") + query[n + 1 :]
+
+    return query
+
+
+def get_queries(libraries, count, seed):
+    rng = random.Random(seed)
+    songs = []
+
+    for path in get_song_paths(libraries):
+        try:
+            attributes = get_attributes(read_header(path, errors="ignore")[0])
+        except OSError:
+            continue
+
+        if attributes.get("ARTIST") and attributes.get("TITLE"):
+            songs.append((attributes["ARTIST"], attributes["TITLE"], path))
+
+    if not songs:
+        raise ValueError("no songs with artist and title found")
+
+    return [
+        (make_query(artist, title, rng), path)
+        for artist, title, path in rng.choices(songs, k=count)
+    ]
+
+
+def run_client(url, queries, k, latencies, found):
+    connection = http.client.HTTPConnection(url.hostname, url.port)
+
+    for query, path in queries:
+        start = time.perf_counter()
+        connection.request("GET", f"/search?q={quote(query)}&k={k}")
+        response = json.loads(connection.getresponse().read())
+        latencies.append(time.perf_counter() - start)
+
+        found.append(any(r["path"] == path for r in response["results"]))
+
+    connection.close()
+
+
+def percentile(values, p):
+    return values[min(int(len(values) * p / 100), len(values) - 1)]
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=HELP)
+    parser.add_argument("libraries", nargs="+")
+    parser.add_argument(
+        "--url",
+        default="http://127.0.0.1:8765",
+        help="address of the server, default: http://127.0.0.1:8765",
+    )
+    parser.add_argument("--requests", type=int, default=10000, help="default: 10000")
+    parser.add_argument(
+        "--clients",
+        type=int,
+        default=8,
+        help="number of concurrent clients, default: 8",
+    )
+    parser.add_argument(
+        "--k", type=int, default=10, help="results per query, default: 10"
+    )
+    parser.add_argument(
+        "--max-p99",
+        type=float,
+        help="exit with 1, if the 99th percentile exceeds this many milliseconds",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    url = urlsplit(args.url)
+    queries = get_queries(args.libraries, args.requests, args.seed)
+    latencies = []
+    found = []
+
+    threads = [
+        threading.Thread(
+            target=run_client,
+            args=(url, queries[n :: args.clients], args.k, latencies, found),
+        )
+        for n in range(args.clients)
+    ]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+
+    latencies.sort()
+    p99 = percentile(latencies, 99) * 1000
+
+    print(f"requests   {len(latencies)}")
+    print(f"clients    {args.clients}")
+    print(f"throughput {len(latencies) / seconds:.0f}/s")
+    for p in (50, 90, 99):
+        print(f"p{p:<9} {percentile(latencies, p) * 1000:.2f} ms")
+    print(f"max        {latencies[-1] * 1000:.2f} ms")
+    print(f"found      {sum(found) / len(found):.1%}")
+
+    if args.max_p99 is not None and p99 > args.max_p99:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
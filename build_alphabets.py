@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+
+import argparse
+import codecs
+import json
+import os
+import re
+import sys
+
+import _multibytecodec
+import icu
+import langdetect
+
+import _stats
+from _builtinencodings import encodings
+
+HELP = """
+For maintainer use only. Export the ICU exemplar characters of every language
+langdetect knows to _alphabets.py, so that recode_language.py can check
+alphabets without ICU. Upper and lower case variants are included. Each
+alphabet is stored as sorted, inclusive codepoint ranges in hex.
+
+Also exports the encodings worth trying for each language: those which can
+encode at least --min-coverage of the language's non-ascii letters, weighted by
+their frequency in langdetect's profile. Encodings, which don't keep ascii as it
+is, are left out. So are the multi-byte east asian ones, if a single-byte
+encoding covers the language. ascii and the unicode encodings are always worth
+trying. Run it again after upgrading ICU or langdetect or changing the list of
+encodings.
+"""
+
+HEADER = """\
+# generated by build_alphabets.py from ICU {version}, do not edit
+
+"""
+
+ALL_CHARS = "".join(
+    chr(c) for c in range(sys.maxunicode + 1) if not 0xD800 <= c <= 0xDFFF
+)
+
+PROFILES = os.path.join(os.path.dirname(langdetect.__file__), "profiles")
+
+# keeps the lines of the generated file short enough for black
+LINE_LENGTH = 70
+
+
+def get_languages():
+    return sorted(os.listdir(PROFILES))
+
+
+def get_alphabet(language):
+    """
+    Exemplar characters as a set of codepoints. Includes all characters, which
+    a case insensitive regex of the exemplar characters matches.
+    """
+    # exemplar sets contain sequences like "ch", their characters are enough
+    exemplars = "".join(icu.LocaleData(language).getExemplarSet())
+    alphabet = re.compile("[" + re.escape(exemplars) + "]", re.IGNORECASE)
+    return {ord(c) for c in alphabet.findall(ALL_CHARS)}
+
+
+def get_ranges(codepoints):
+    ranges = []
+    for codepoint in sorted(codepoints):
+        if ranges and ranges[-1][1] == codepoint - 1:
+            ranges[-1][1] = codepoint
+        else:
+            ranges.append([codepoint, codepoint])
+    return ranges
+
+
+def get_letter_frequencies(language):
+    """The language's non-ascii exemplar letters and how common they are"""
+    with open(os.path.join(PROFILES, language)) as f:
+        frequencies = json.load(f)["freq"]
+
+    letters = "".join(icu.LocaleData(language).getExemplarSet())
+    # letters missing from the profile still count a little
+    return {c: frequencies.get(c, 0) + 1 for c in set(letters) if not c.isascii()}
+
+
+def get_coverage(encoding, frequencies):
+    covered = 0
+    for letter, frequency in frequencies.items():
+        try:
+            letter.encode(encoding)
+            covered += frequency
+        except UnicodeEncodeError:
+            pass
+    return covered / sum(frequencies.values()) if frequencies else 1
+
+
+def is_universal(encoding):
+    return encoding == "ascii" or encoding.startswith("utf_")
+
+
+def keeps_ascii(encoding):
+    ascii = bytes(range(128))
+    try:
+        return ascii.decode(encoding) == ascii.decode("ascii")
+    except UnicodeDecodeError:
+        return False
+
+
+def is_multi_byte(encoding):
+    decoder = codecs.getincrementaldecoder(encoding)
+    return issubclass(decoder, _multibytecodec.MultibyteIncrementalDecoder)
+
+
+def get_candidates(language, min_coverage):
+    """The encodings worth trying for the language, in the order of encodings"""
+    frequencies = get_letter_frequencies(language)
+    plausible = [
+        e
+        for e in encodings
+        if keeps_ascii(e) and get_coverage(e, frequencies) >= min_coverage
+    ]
+
+    if any(not is_universal(e) and not is_multi_byte(e) for e in plausible):
+        plausible = [e for e in plausible if not is_multi_byte(e)]
+
+    return [e for e in encodings if is_universal(e) or e in plausible]
+
+
+def format_words(words):
+    """Words separated by spaces, split into lines of about LINE_LENGTH"""
+    lines = [""]
+    for word in words:
+        if lines[-1] and len(lines[-1]) + len(word) > LINE_LENGTH:
+            lines.append("")
+        lines[-1] += word + " "
+    # all but the last line end with a space to separate them when concatenated
+    lines[-1] = lines[-1].rstrip()
+    return lines
+
+
+def write_table(f, name, table):
+    f.write(f"{name} = {{\n")
+
+    for language, words in table.items():
+        lines = format_words(words)
+
+        if len(lines) == 1:
+            f.write(f'    "{language}": "{lines[0]}",\n')
+            continue
+
+        f.write(f'    "{language}": (\n')
+        for line in lines:
+            f.write(f'        "{line}"\n')
+        f.write("    ),\n")
+
+    f.write("}\n")
+
+
+def write_alphabets(f, languages, min_coverage):
+    alphabets = {}
+    candidates = {}
+
+    for language in languages:
+        ranges = get_ranges(get_alphabet(language))
+        alphabets[language] = [f"{start:04X}-{end:04X}" for start, end in ranges]
+        candidates[language] = get_candidates(language, min_coverage)
+
+    f.write(HEADER.format(version=icu.ICU_VERSION))
+    write_table(f, "alphabets", alphabets)
+    f.write("\n")
+    write_table(f, "candidates", candidates)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=HELP)
+    parser.add_argument(
+        "--output",
+        default=os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "_alphabets.py"
+        ),
+        help="file to write the alphabets to, default: _alphabets.py",
+    )
+    parser.add_argument(
+        "--min-coverage",
+        type=float,
+        default=0.95,
+        help="share of a language's letters an encoding must cover, default: 0.95",
+    )
+    _stats.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with _stats.collect(args):
+        languages = get_languages()
+        with open(args.output, "w") as f:
+            write_alphabets(f, languages, args.min_coverage)
+        _stats.written(args.output)
+
+        print(f"SUCCESS\t{len(languages)} languages\t{args.output}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
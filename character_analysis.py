@@ -3,26 +3,93 @@
 import argparse
 import re
 import sys
-from collections import Counter
+import unicodedata
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
-from _utils import get_artisttitle, get_lyrics
+from langdetect import detect
+
+import _stats
+from _utils import get_artisttitle, get_attribute, get_lyrics
 
 HELP = """
 For a list of files, collect all characters in artist, title and lyrics. Print
 the count of each character, the filename as well as the artist/title. This can
 be helpful to determine, if a file has been recoded correctly. For example,
 seeing ³, 文 or ╣ in a polish song suggests a problem.
+
+With --library, all files are analysed together instead. Character counts are
+merged per #LANGUAGE (or the detected language, if the attribute is missing)
+and each file is rated by the number of characters, which are rare in songs of
+its language or suspicious in any song, like box drawing characters, Hangul or
+control characters. Prints a ranked list of suspects:
+
+  score <TAB> language <TAB> path <TAB> offending characters
 """
 
+# characters, which hint at a wrong encoding in songs of any language
+SUSPICIOUS_RANGES = (
+    (0x0080, 0x009F),  # C1 control characters
+    (0x1100, 0x11FF),  # Hangul Jamo
+    (0x2500, 0x259F),  # box drawing and block elements
+    (0x3130, 0x318F),  # Hangul compatibility Jamo
+    (0xAC00, 0xD7AF),  # Hangul syllables
+    (0xE000, 0xF8FF),  # private use area
+    (0xFFFD, 0xFFFD),  # replacement character
+)
+# never suspicious, so they are not kept per file
+COMMON_CHARS = re.compile("[a-zA-Z0-9 \\t]")
+
 
 def count_characters(text):
     artisttitle = get_artisttitle(text)
     lyrics = get_lyrics(text)
-    return Counter(f"{artisttitle}{lyrics}")
+    return Counter(artisttitle + "".join(lyrics))
+
+
+def is_suspicious(char):
+    code = ord(char)
+    if unicodedata.category(char) == "Cc":
+        return True
+    return any(start <= code <= end for start, end in SUSPICIOUS_RANGES)
+
+
+def get_language(text):
+    try:
+        return get_attribute(text, "LANGUAGE").strip()
+    except KeyError:
+        pass
+
+    try:
+        return detect(" ".join(get_lyrics(text)))
+    except Exception:
+        return "unknown"
+
+
+def census_file(path):
+    """Return the language and all interesting character counts of a file"""
+    try:
+        with open(path) as f:
+            text = f.read()
+    except UnicodeDecodeError:
+        return path, "not utf-8 encoded", None
+    except OSError as ex:
+        return path, str(ex), None
+
+    try:
+        frequencies = count_characters(text)
+    except KeyError:
+        return path, "missing artist or title", None
+    for char in list(frequencies):
+        if COMMON_CHARS.match(char):
+            del frequencies[char]
+
+    return path, get_language(text), frequencies
 
 
 def print_character_frequencies(path, ignore_chars):
     try:
+        _stats.read(path)
         with open(path) as f:
             text = f.read()
 
@@ -44,6 +111,70 @@ def print_character_frequencies(path, ignore_chars):
     print(artisttitle)
 
 
+def census(paths, ignore_chars, jobs=None):
+    """Yield (path, language, frequencies) of all utf-8 encoded files"""
+    with ProcessPoolExecutor(jobs) as executor:
+        for path, language, frequencies in executor.map(
+            census_file, paths, chunksize=64
+        ):
+            if frequencies is None:
+                print(f"ERROR\t{language}\t{path}")
+                continue
+
+            _stats.read(path)
+
+            for char in list(frequencies):
+                if ignore_chars.match(char):
+                    del frequencies[char]
+
+            yield path, language, frequencies
+
+
+def find_suspects(files, rare):
+    """
+    Rate files by their characters. A character is rare for a language, if it
+    appears in less than the given fraction of the files of that language.
+    """
+    songs = Counter()
+    document_frequency = defaultdict(Counter)
+
+    for _, language, frequencies in files:
+        songs[language] += 1
+        document_frequency[language].update(frequencies.keys())
+
+    suspects = []
+
+    for path, language, frequencies in files:
+        min_songs = rare * songs[language]
+        offending = {
+            char: count
+            for char, count in frequencies.items()
+            if is_suspicious(char) or document_frequency[language][char] < min_songs
+        }
+        if offending:
+            suspects.append((sum(offending.values()), language, path, offending))
+
+    suspects.sort(key=lambda s: (-s[0], s[2]))
+    return suspects
+
+
+def print_suspects(paths, ignore_chars, rare, min_score, jobs):
+    files = list(census(paths, ignore_chars, jobs))
+
+    with _stats.stage("rate"):
+        suspects = find_suspects(files, rare)
+
+    for score, language, path, offending in suspects:
+        if score < min_score:
+            break
+
+        chars = " ".join(
+            f"{char!r}x{count}"
+            for char, count in sorted(offending.items(), key=lambda x: -x[1])
+        )
+        print(f"{score}\t{language}\t{path}\t{chars}")
+
+
 def main(argv):
     parser = argparse.ArgumentParser(description=HELP)
     parser.add_argument("files", nargs="+")
@@ -52,15 +183,41 @@ def main(argv):
         default="",
         help='letters or symbols to skip during analysis, as a regex character class. passing "qwerty" ignores q, w, e, ...',
     )
+    parser.add_argument(
+        "--library",
+        action="store_true",
+        help="analyse all files together and print a ranked list of suspects",
+    )
+    parser.add_argument(
+        "--rare",
+        type=float,
+        default=0.01,
+        help="characters in less than this fraction of the songs of a language are rare, default: 0.01",
+    )
+    parser.add_argument(
+        "--min-score",
+        type=int,
+        default=1,
+        help="only print suspects with at least this many offending characters",
+    )
+    parser.add_argument("--jobs", type=int, help="number of processes to use")
+    _stats.add_arguments(parser)
     args = parser.parse_args(argv)
 
-    if args.ignore_chars:
-        ignore_chars = re.compile(f"^[{args.ignore_chars}]$")
-    else:
-        ignore_chars = re.compile(f"^$")
+    with _stats.collect(args):
+        if args.ignore_chars:
+            ignore_chars = re.compile(f"^[{args.ignore_chars}]$")
+        else:
+            ignore_chars = re.compile(f"^$")
+
+        if args.library:
+            print_suspects(
+                args.files, ignore_chars, args.rare, args.min_score, args.jobs
+            )
+            return
 
-    for path in args.files:
-        print_character_frequencies(path, ignore_chars)
+        for path in args.files:
+            print_character_frequencies(path, ignore_chars)
 
 
 if __name__ == "__main__":
@@ -1,68 +1,151 @@
 #!/usr/bin/env python3
 
 import argparse
+import json
 import os
-import re
 import sys
 
 from PIL import Image
 
-from _utils import get_attribut_names, get_attribute
+import _stats
+import _where
+from _utils import NOTE_TYPES, parse_note_line
 
 HELP = """
 For each given file, check the following conditions. Exit with exit-code 1, if at least one is not met.
+
+The file is read once. Checks of the header run, as soon as the header is read,
+checks of the notes while reading them and checks of the referenced files last.
+If a fatal check fails, the checks after it are skipped: a malformed line of
+notes stops reading, the notes after it and the referenced files aren't checked.
 """
 
+# costs, cheaper checks run first
+HEADER = 0  # looks at the header only
+NOTES = 1  # looks at each line of the notes
+FILES = 2  # looks at referenced files
+CONTENT = 3  # reads referenced files
+
+# types of the items, which note checks are given besides parse_note_line's
+MALFORMED = "?"  # (MALFORMED, line)
+AFTER_END = "after E"  # (AFTER_END, line) for every non-blank line after E
+END_OF_FILE = ""  # (END_OF_FILE,) once, after the last line
+
+# pseudo check, failing for songs, which are not utf-8/ascii
+ENCODING = "File is utf-8/ascii"
+NOT_UTF8 = "not utf-8/ascii encoded."
+
+# version of the cache file format
+CACHE_VERSION = 1
 
 checks = []
 
 
-def check(description):
+class Check:
+    def __init__(self, description, cost, fatal, kinds, media, version, func):
+        self.description = description
+        self.cost = cost
+        self.fatal = fatal
+        self.kinds = kinds
+        self.media = media
+        self.version = version
+        self.func = func
+
+
+def check(description, cost=HEADER, fatal=False, kinds=(), media=None, version=1):
+    """
+    Register a check of the song. With cost NOTES, the check is called with the
+    song and each item of the notes of the given kinds and returns a problem or
+    None, see MALFORMED. Otherwise it is called with the song and the path once
+    and yields problems.
+
+    media is the attribute referencing the file the check looks at, if any.
+    Increase the version, when the check changes, to invalidate cached results.
+    """
+
     def inner(func):
-        checks.append((description, func))
+        checks.append(Check(description, cost, fatal, kinds, media, version, func))
+        return func
 
     return inner
 
 
+class Song:
+    """What is known about a song, while it is read line by line"""
+
+    def __init__(self):
+        # attributes by name, first value wins
+        self.header = {}
+        self.relative = False
+        self.line_number = 0
+        # singers seen so far, by P lines
+        self.singers = []
+        self.notes_before_singer = False
+        # start and end beat of the previous note of the current singer
+        self.previous = None
+        # beat, which relative beats are counted from
+        self.offset = 0
+        self.ended = False
+
+    def add_header_line(self, line):
+        name, _, value = line[1:].rstrip("\r\n").partition(":")
+        self.header.setdefault(name, value)
+
+    def end_header(self):
+        self.relative = self.header.get("RELATIVE", "").strip().lower() == "yes"
+
+    def advance(self, item):
+        """Update the state after the checks looked at item"""
+        kind = item[0]
+
+        if kind in NOTE_TYPES:
+            start = self.offset + item[1]
+            self.previous = (start, start + item[2])
+            if not self.singers:
+                self.notes_before_singer = True
+        elif kind == "-" and self.relative:
+            self.offset += item[1] if item[2] is None else item[2]
+        elif kind == "P":
+            self.singers.append(item[1])
+            self.previous = None
+            self.offset = 0
+        elif kind == "E":
+            self.ended = True
+
+
 def required_attribute(attr):
     @check(f"Attribute {attr} must be present")
-    def has_attr(text, path):
-        try:
-            if not get_attribute(text, attr):
-                yield f"attribute {attr} empty"
-        except KeyError:
+    def has_attr(song, path):
+        if attr not in song.header:
             yield f"attribute {attr} missing"
+        elif not song.header[attr]:
+            yield f"attribute {attr} empty"
 
 
-def _get_attr_path(text, path, attr):
-    attr_path = get_attribute(text, attr)
+def _get_attr_path(song, path, attr):
     songdir = os.path.dirname(path)
-    attr_path = os.path.join(songdir, attr_path)
-    return attr_path
+    return os.path.join(songdir, song.header[attr])
 
 
 def file_exists(attr):
-    @check(f"File referenced in {attr} must exist, if present")
-    def file_exists(text, path):
-        try:
-            attr_path = _get_attr_path(text, path, attr)
-        except KeyError:
+    @check(f"File referenced in {attr} must exist, if present", FILES, media=attr)
+    def file_exists(song, path):
+        if attr not in song.header:
             return
 
+        attr_path = _get_attr_path(song, path, attr)
         if not os.path.isfile(attr_path):
             yield f"file referenced in attribute {attr} not found: {attr_path}"
 
 
 def is_image_file(attr):
-    @check(f"{attr} is an image file")
-    def is_image_file(text, path):
-        try:
-            attr_path = _get_attr_path(text, path, attr)
-        except KeyError:
+    @check(f"{attr} is an image file", CONTENT, media=attr)
+    def is_image_file(song, path):
+        if attr not in song.header:
             return
 
         try:
-            Image.open(attr_path)
+            Image.open(_get_attr_path(song, path, attr))
         except Exception as ex:
             if "cannot identify" in str(ex):
                 yield f"file referenced in attribute {attr} is not an image"
@@ -83,50 +166,384 @@ is_image_file("BACKGROUND")
 
 
 @check(f"Must have BACKGROUND or VIDEO")
-def has_background_or_video(text, path):
-    attrs = get_attribut_names(text)
-
-    if "BACKGROUND" not in attrs and "VIDEO" not in attrs:
+def has_background_or_video(song, path):
+    if "BACKGROUND" not in song.header and "VIDEO" not in song.header:
         yield f"has neither BACKGROUND nor VIDEO"
 
 
 @check("All attribute names must be UPPERCASE")
-def lower_case_attribute(text, path):
-    for attr in get_attribut_names(text):
+def lower_case_attribute(song, path):
+    for attr in song.header:
         if any(c.islower() for c in attr):
             yield f"attribute {attr} is lower case"
 
 
-@check("There is an E line")
-def lower_case_attribute(text, path):
-    if not re.search("\nE\s*\n", text):
-        yield "there is no E line"
+@check(
+    "Lines of notes must be well formed",
+    NOTES,
+    fatal=True,
+    kinds=[MALFORMED],
+    version=3,
+)
+def well_formed(song, item):
+    return f"line {song.line_number} is malformed: {item[1]}"
+
+
+@check("There is an E line", NOTES, kinds=[END_OF_FILE])
+def has_end(song, item):
+    if not song.ended:
+        return "there is no E line"
+
+
+@check("Nothing follows the E line", NOTES, kinds=[AFTER_END])
+def nothing_after_end(song, item):
+    return f"line {song.line_number} follows the E line"
+
+
+@check("Notes must have a positive length", NOTES, kinds=NOTE_TYPES)
+def positive_length(song, item):
+    if item[2] <= 0:
+        return f"line {song.line_number}: note length {item[2]} is not positive"
+
+
+@check("Beats must not go back", NOTES, kinds=NOTE_TYPES + ("-",))
+def monotonic(song, item):
+    if song.previous is None:
+        return
+
+    beat = song.offset + item[1]
+    if beat < song.previous[0]:
+        return f"line {song.line_number}: beat {beat} is before the previous note"
+
+
+@check("Notes must not overlap", NOTES, kinds=NOTE_TYPES)
+def no_overlap(song, item):
+    if song.previous is None:
+        return
+
+    start, end = song.previous
+    if start <= song.offset + item[1] < end:
+        return f"line {song.line_number}: note overlaps the previous note"
+
+
+@check(
+    "Duets must have P1 before any notes and P2 after P1",
+    NOTES,
+    kinds=["P", END_OF_FILE],
+)
+def duet_sections(song, item):
+    kind = item[0]
+
+    if kind == "P":
+        singer, expected = item[1], len(song.singers) + 1
+        if not song.singers and song.notes_before_singer:
+            return f"line {song.line_number}: P{singer} follows notes without singer"
+        if singer != expected:
+            return f"line {song.line_number}: P{singer} instead of P{expected}"
+
+    elif kind == END_OF_FILE and len(song.singers) == 1:
+        return "P1 without P2"
+
+
+def get_plan(only_check):
+    """The checks to run, cheaper ones first"""
+    plan = [c for c in checks if not only_check or c.description in only_check]
+    return sorted(plan, key=lambda c: c.cost)
+
+
+def run_checks(plan, song, path, found):
+    """Run the checks of the plan, return False, if a fatal one failed"""
+    for c in plan:
+        with _stats.stage(c.description):
+            problems = list(c.func(song, path))
+        found[c.description] = problems
+        if problems and c.fatal:
+            return False
+    return True
+
+
+def compile_note_checks(plan):
+    """The note checks of the plan by the kinds of items they look at"""
+    compiled = {}
+    for c in plan:
+        if c.cost == NOTES:
+            for kind in c.kinds:
+                compiled.setdefault(kind, []).append(c)
+    return compiled
+
+
+def check_notes(compiled, song, item, found):
+    """Give item to the note checks, return False, if a fatal one failed"""
+    ok = True
+    for c in compiled.get(item[0], ()):
+        problem = c.func(song, item)
+        if problem:
+            found[c.description].append(problem)
+            ok = ok and not c.fatal
+    return ok
+
+
+def read_song(f, path, plan, found):
+    """
+    Read the song line by line, running the checks of the plan, as soon as
+    what they look at is read. Reading stops, if a fatal check failed.
+    """
+    header_checks = [c for c in plan if c.cost < NOTES]
+    note_checks = compile_note_checks(plan)
+    for c in plan:
+        if c.cost == NOTES:
+            found[c.description] = []
+
+    song = Song()
+    in_header = True
+
+    for line in f:
+        song.line_number += 1
+        if song.line_number == 1:
+            line = line.lstrip("\ufeff")
+
+        if in_header and line.startswith("#"):
+            song.add_header_line(line)
+            continue
+        # blank lines may separate attributes, the first note ends the header
+        if in_header and not line.strip():
+            continue
+        if in_header:
+            in_header = False
+            song.end_header()
+            if not run_checks(header_checks, song, path, found):
+                return song
+            if not note_checks:
+                return song
+
+        if not line.strip():
+            continue
+
+        if song.ended:
+            item = (AFTER_END, line.rstrip("\r\n"))
+        else:
+            try:
+                item = parse_note_line(line)
+            except ValueError:
+                item = (MALFORMED, line.rstrip("\r\n"))
+
+        if not check_notes(note_checks, song, item, found):
+            return song
+        song.advance(item)
+
+    if in_header:
+        song.end_header()
+        if not run_checks(header_checks, song, path, found):
+            return song
+
+    check_notes(note_checks, song, (END_OF_FILE,), found)
+    return song
+
+
+def get_failed_fatal(plan, found):
+    """The first fatal check of the plan, which found problems, if any"""
+    for c in plan:
+        if c.fatal and found.get(c.description):
+            return c
+
+
+def run_plan(path, plan, header=None):
+    """
+    Run the checks of the plan on the song at path. Return the song and the
+    problems found by each check, which ran. The song is only read, if a check
+    of the plan looks at it or its header isn't given. Raises
+    UnicodeDecodeError, if the song is not utf-8/ascii.
+    """
+    found = {}
+
+    if header is None or any(c.cost <= NOTES for c in plan):
+        _stats.read(path)
+        with open(path) as f, _stats.stage("Reading"):
+            song = read_song(f, path, plan, found)
+    else:
+        song = Song()
+        song.header = header
+
+    if not get_failed_fatal(plan, found):
+        run_checks([c for c in plan if c.cost > NOTES], song, path, found)
+
+    return song, found
+
+
+def get_problems(plan, found):
+    """The problems in the order of the plan, up to the first failed fatal check"""
+    problems = []
+    for c in plan:
+        problems.extend(found.get(c.description, []))
+        if c.fatal and found.get(c.description):
+            break
+    return problems
+
 
+def file_state(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
 
-def check_health(path, only_check):
 
+def media_states(header, path):
+    """Name and state of the files referenced by the checks in the header"""
+    songdir = os.path.dirname(path)
+    return {
+        c.media: [header[c.media], file_state(os.path.join(songdir, header[c.media]))]
+        for c in checks
+        if c.media in header
+    }
+
+
+def load_cache(path):
+    """
+    The cached problems of each song. Each song's problems are a list with an
+    entry for each check in cache["checks"], None for checks not run.
+    """
     try:
         with open(path) as f:
-            text = f.read()
-    except UnicodeDecodeError:
-        return ["not utf-8/ascii encoded."]
+            cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        cache = {}
 
-    problems = []
+    if cache.get("version") != CACHE_VERSION:
+        return {"version": CACHE_VERSION, "checks": [], "songs": {}}
 
-    for description, check in checks:
-        if only_check and description not in only_check:
+    versions = {c.description: c.version for c in checks}
+    for column, (description, version) in enumerate(cache["checks"]):
+        if versions.get(description, version) == version:
             continue
-        problems.extend(check(text, path))
 
-    return problems
+        # the check changed, none of its results can be used anymore
+        cache["checks"][column][1] = versions[description]
+        for entry in cache["songs"].values():
+            if column < len(entry["problems"]):
+                entry["problems"][column] = None
+
+    return cache
+
+
+def save_cache(path, cache):
+    tmp_path = f"{path}.tmp"
+
+    with open(tmp_path, "w") as f:
+        json.dump(cache, f)
+
+    os.replace(tmp_path, path)
+
+
+def get_columns(cache):
+    """The column of each check in the cached problems, adding missing checks"""
+    columns = {d: n for n, (d, _) in enumerate(cache["checks"])}
+    if len(columns) < len(checks):
+        for c in checks:
+            if c.description not in columns:
+                columns[c.description] = len(cache["checks"])
+                cache["checks"].append([c.description, c.version])
+    return columns
+
+
+def check_health_cached(path, plan, cache):
+    """
+    Like check_health, but take the problems found by a check from the cache,
+    if neither the song, the file the check looks at nor the check itself
+    changed since. Only the other checks are run and added to the cache.
+    """
+    key = os.path.abspath(path)
+    columns = get_columns(cache)
+    entry = cache["songs"].get(key)
+    state = file_state(path)
+
+    if not entry or entry["state"] != state:
+        # media is None, until the song was read
+        entry = {"state": state, "media": None, "fatal": None, "problems": []}
+        cache["songs"][key] = entry
+    elif entry["fatal"] == ENCODING:
+        _stats.count("cache_hits")
+        return [NOT_UTF8]
+
+    problems = entry["problems"]
+    problems += [None] * (len(columns) - len(problems))
+
+    # checks of referenced files, which changed since, must run again
+    songdir = os.path.dirname(path)
+    for attr, (name, media_state) in (entry["media"] or {}).items():
+        if file_state(os.path.join(songdir, name)) != media_state:
+            for c in checks:
+                if c.media == attr:
+                    problems[columns[c.description]] = None
+
+    found = {}
+    for c in plan:
+        if problems[columns[c.description]] is not None:
+            found[c.description] = problems[columns[c.description]]
+    stale = [c for c in plan if c.description not in found]
+
+    # the checks after a fatal one, which still fails, are not run at all
+    fatal = get_failed_fatal(plan, found)
+    if fatal:
+        stale = [c for c in stale if plan.index(c) < plan.index(fatal)]
+
+    _stats.count("cache_hits", len(plan) - len(stale))
+    _stats.count("cache_misses", len(stale))
+    if not stale:
+        return get_problems(plan, found)
+
+    header = None
+    if entry["media"] is not None:
+        header = {attr: name for attr, (name, _) in entry["media"].items()}
+
+    try:
+        song, found_now = run_plan(path, stale, header)
+    except UnicodeDecodeError:
+        entry.update(media=None, fatal=ENCODING, problems=[])
+        return [NOT_UTF8]
+
+    entry["media"] = media_states(song.header, path)
+    for description, problems_now in found_now.items():
+        problems[columns[description]] = problems_now
+    found.update(found_now)
+
+    fatal = get_failed_fatal(plan, found)
+    entry["fatal"] = fatal and fatal.description
+    if fatal:
+        # reading stopped at the fatal check, the other results are incomplete
+        after = False
+        for c in get_plan(None):
+            if after:
+                problems[columns[c.description]] = None
+            after = after or c is fatal
+
+    return get_problems(plan, found)
+
+
+def check_health(path, only_check, cache=None):
+    """
+    Return the problems of the song at path. If a cache is given, as returned
+    by load_cache, only checks, whose inputs changed, are run.
+    """
+    plan = get_plan(only_check)
+
+    if cache is not None:
+        return check_health_cached(path, plan, cache)
+
+    try:
+        _, found = run_plan(path, plan)
+    except UnicodeDecodeError:
+        return [NOT_UTF8]
+
+    return get_problems(plan, found)
 
 
 def main(argv):
     found_problems = False
 
     description = HELP.strip() + "\n\n"
-    description += " File is utf-8/ascii"
-    description += "\n" + "\n".join(" " + c[0] for c in checks)
+    description += " " + ENCODING
+    description += "\n" + "\n".join(" " + c.description for c in get_plan(None))
 
     parser = argparse.ArgumentParser(
         description=description, formatter_class=argparse.RawTextHelpFormatter
@@ -136,18 +553,31 @@ def main(argv):
         action="append",
         help="restrict checking to the given ones. encoding is always checked.",
     )
+    parser.add_argument(
+        "--cache",
+        metavar="FILE",
+        help="save the problems found by each check to FILE and only run the checks, whose inputs changed, in later runs",
+    )
     parser.add_argument("files", nargs="+")
+    _where.add_argument(parser)
 
+    _stats.add_arguments(parser)
     args = parser.parse_args(argv)
 
-    for path in args.files:
-        problems = check_health(path, args.only_check)
-        if problems:
-            print(path)
-            print("\n".join("  " + p for p in problems))
-            found_problems = True
+    with _stats.collect(args):
+        cache = load_cache(args.cache) if args.cache else None
+
+        for path in _where.select(args.files, args.where, keep_undecodable=True):
+            problems = check_health(path, args.only_check, cache)
+            if problems:
+                print(path)
+                print("\n".join("  " + p for p in problems))
+                found_problems = True
+
+        if args.cache:
+            save_cache(args.cache, cache)
 
-    return 0 if not found_problems else 1
+        return 0 if not found_problems else 1
 
 
 if __name__ == "__main__":
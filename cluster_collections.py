@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+from collections import defaultdict
+from contextlib import suppress
+
+from PIL import Image
+
+import _stats
+from check_health import check_health
+from integrate_collection import SongCollection, TrigramIndex, normalize, trigrams
+
+HELP = """
+Merge any number of collections. All songs of all given collections are scored
+against each other like integrate_collection.py does and grouped into clusters
+of duplicates. A pair of songs with a score of at least --min-score ends up in
+the same cluster. From each cluster the version with the best quality is picked,
+preferring songs with a video, a high resolution cover, few problems found by
+check_health.py and no missing files.
+
+Writes a merge plan with one line per song, clusters are separated by an empty
+line:
+
+  keep <TAB> quality <TAB> path of the preferred song
+  drop <TAB> quality <TAB> path of a duplicate
+
+Only songs with matching artists can score above 50, so --min-score must be
+higher than that. This way only songs with similar artists need to be compared.
+"""
+
+MEDIA_ATTRIBUTES = ("MP3", "COVER", "VIDEO", "BACKGROUND")
+
+
+class UnionFind:
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, n):
+        while self.parent[n] != n:
+            self.parent[n] = self.parent[self.parent[n]]
+            n = self.parent[n]
+        return n
+
+    def union(self, a, b):
+        a, b = self.find(a), self.find(b)
+        if a != b:
+            self.parent[max(a, b)] = min(a, b)
+
+    def groups(self):
+        groups = defaultdict(list)
+        for n in range(len(self.parent)):
+            groups[self.find(n)].append(n)
+        return list(groups.values())
+
+
+def min_shared_trigrams(key):
+    """
+    Minimum number of trigrams, which another artist needs to share with the
+    given normalized key to score above 90. Such a score allows for an edit
+    distance of about a fifth of the key's length and each edit can destroy up
+    to three trigrams.
+    """
+    max_distance = int(0.18 * len(key) / 0.91)
+    return max(len(trigrams(key)) - 3 * max_distance, 1)
+
+
+def is_matchable(song):
+    # names of undecodable files may end up empty, which would match each other
+    return bool(
+        song.ARTIST and song.TITLE and normalize(song.ARTIST) and normalize(song.TITLE)
+    )
+
+
+def cluster(songs, min_score):
+    clusters = UnionFind(len(songs))
+    by_text = {}
+    artists = TrigramIndex()
+
+    for n, song in enumerate(songs):
+        clusters.union(by_text.setdefault(song.digest, n), n)
+
+        if is_matchable(song):
+            artists.add(n, song.ARTIST)
+
+    for n, song in enumerate(songs):
+        if not is_matchable(song):
+            continue
+
+        min_shared = min_shared_trigrams(normalize(song.ARTIST))
+
+        for m in artists.candidates(song.ARTIST, min_shared):
+            if m <= n or clusters.find(m) == clusters.find(n):
+                continue
+
+            candidate = songs[m]
+            if candidate.match_bound(song) < min_score:
+                _stats.count("pairs_pruned")
+                continue
+
+            _stats.count("pairs_scored")
+            score, _ = candidate.match(song)
+            if score >= min_score:
+                clusters.union(n, m)
+
+    return clusters.groups()
+
+
+def linked_file(song, attr):
+    if song.attributes.get(attr):
+        path = song.path.parent / song.attributes[attr]
+        if path.is_file():
+            return path
+
+
+def quality(song):
+    """
+    Rate a version of a song. A video is worth the most, followed by the cover
+    resolution, followed by missing files and problems found by check_health.
+    """
+    score = 0
+
+    if linked_file(song, "VIDEO"):
+        score += 100
+
+    cover = linked_file(song, "COVER")
+    if cover:
+        with suppress(Exception):
+            with Image.open(cover) as im:
+                score += min(min(im.size), 1000) / 20
+
+    for attr in MEDIA_ATTRIBUTES:
+        if attr in song.attributes and not linked_file(song, attr):
+            score -= 20
+
+    score -= 10 * len(check_health(str(song.path), None))
+
+    return score
+
+
+def write_plan(f, songs, clusters):
+    for members in clusters:
+        if len(members) == 1:
+            f.write(f"keep\t-\t{songs[members[0]].path}\n\n")
+            continue
+
+        ranked = [(quality(songs[n]), songs[n]) for n in members]
+        ranked.sort(key=lambda r: r[0], reverse=True)
+
+        for n, (score, song) in enumerate(ranked):
+            action = "keep" if n == 0 else "drop"
+            f.write(f"{action}\t{score:g}\t{song.path}\n")
+        f.write("\n")
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(
+        description=HELP, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("collections", nargs="+")
+    parser.add_argument(
+        "--min-score",
+        type=int,
+        default=80,
+        help="songs scoring at least this high are considered duplicates",
+    )
+    parser.add_argument(
+        "--plan", default="-", help="file to write the merge plan to, default: stdout"
+    )
+    parser.add_argument(
+        "--duplicates-only",
+        action="store_true",
+        help="leave songs without duplicates out of the merge plan",
+    )
+    _stats.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with _stats.collect(args):
+        if args.min_score <= 50:
+            parser.error("--min-score must be higher than 50")
+
+        songs = []
+        for root in args.collections:
+            collection = SongCollection(root)
+            collection.load()
+            songs.extend(collection.songs)
+
+        with _stats.stage("cluster"):
+            clusters = cluster(songs, args.min_score)
+        if args.duplicates_only:
+            clusters = [c for c in clusters if len(c) > 1]
+
+        with _stats.stage("plan"):
+            if args.plan == "-":
+                write_plan(sys.stdout, songs, clusters)
+            else:
+                with open(args.plan, "w") as f:
+                    write_plan(f, songs, clusters)
+
+        print(
+            f"{len(songs)} songs, {len(clusters)} clusters, "
+            f"{sum(len(c) - 1 for c in clusters)} duplicates",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
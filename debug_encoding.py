@@ -2,11 +2,14 @@
 
 import argparse
 import curses
+import functools
 import re
 import sys
+import threading
 
+import _stats
 from _builtinencodings import encodings
-from _curses_helpers import KEY_SPACEBAR, Window, re_nonascii
+from _curses_helpers import KEY_ENTER, KEY_SPACEBAR, Window, re_nonascii
 
 HELP = """
 View the given file in all encodings supported by python, while highlighting all
@@ -16,101 +19,219 @@ been touched by recode_language.py and friends.
 
 Displays 3 encodings side-by-side. If two encodings produce the same output,
 only the first one is shown. Navigate with LEFT/RIGHT, remove the middle
-candidate using SPACE.
+candidate using SPACE. By default, all lines with non-ascii characters are
+shown. Press 'd' to toggle showing only the lines, which differ between the
+displayed encodings.
 
-Quit by pressing 'q'.
+Press ENTER to quit and print the encoding of the middle candidate. Quit without
+printing by pressing 'q'.
 """
 
 
+# codecs, which keep state across the ascii bytes between non-ascii spans
+STATEFUL_ENCODINGS = ("utf_7", "utf_8_sig")
+ASCII = bytes(range(128))
+re_nonascii_bytes = re.compile(b"[\x80-\xff]+")
+
+
+@functools.cache
+def is_span_safe(encoding):
+    """
+    Whether decoding only the non-ascii spans of a file is enough to tell it
+    apart from other decodings. True for codecs, in which ascii bytes always
+    decode to themselves, even directly after a non-ascii byte.
+    """
+    if encoding.startswith("iso2022") or encoding in STATEFUL_ENCODINGS:
+        return False
+
+    try:
+        if ASCII.decode(encoding) != ASCII.decode("ascii"):
+            return False
+    except ValueError:
+        return False
+
+    for high in range(0x80, 0x100):
+        alone = bytes((high,)).decode(encoding, "replace")
+        pairs = b"".join(bytes((high, low)) for low in range(0x80))
+        if pairs.decode(encoding, "replace") != "".join(
+            alone + chr(low) for low in range(0x80)
+        ):
+            return False
+
+    return True
+
+
+class Variants:
+    """
+    All different decodings of a file, found lazily. A background thread
+    decodes ahead of the user, who pages through the list.
+    """
+
+    def __init__(self, content):
+        self.content = content
+        self.spans = b"\n".join(re_nonascii_bytes.findall(self.content))
+        self.candidates = iter(encodings)
+        self.seen_spans = set()
+        self.seen_texts = set()
+        self.items = []
+        self.exhausted = False
+        self.lock = threading.Lock()
+
+        threading.Thread(target=self.find_all, daemon=True).start()
+
+    def is_new(self, encoding):
+        """Whether the codec works and produces a decoding not seen before"""
+        try:
+            if is_span_safe(encoding):
+                # ascii bytes decode to themselves, so only the spans can differ
+                spans = self.spans.decode(encoding)
+                if b"#" not in self.content or spans in self.seen_spans:
+                    return False
+                self.seen_spans.add(spans)
+
+                if all(is_span_safe(item[0]) for item in self.items):
+                    return True
+
+            text = self.content.decode(encoding)
+        except ValueError:
+            return False
+
+        if "#" not in text:
+            return False
+
+        # compare to the full text of all decodings found so far
+        for item in self.items:
+            self.decode(item)
+        return text not in self.seen_texts
+
+    def find_next(self):
+        """Find the next decoding, return None if there is none"""
+        with self.lock:
+            for encoding in self.candidates:
+                if self.is_new(encoding):
+                    self.items.append([encoding, None])
+                    return self.items[-1]
+
+            self.exhausted = True
+
+    def find_all(self):
+        while item := self.find_next():
+            self.decode(item)
+
+    def decode(self, item):
+        if item[1] is None:
+            text = self.content.decode(item[0])
+            self.seen_texts.add(text)
+            item[1] = text.replace("\0", "").splitlines()  # null bytes confuse ncurses
+        return item[1]
+
+    def __len__(self):
+        return len(self.items)
+
+    def has(self, n):
+        while len(self.items) <= n and not self.exhausted:
+            self.find_next()
+        return 0 <= n < len(self.items)
+
+    def encoding(self, n):
+        return self.items[n][0]
+
+    def lines(self, n):
+        return self.decode(self.items[n])
+
+    def remove(self, n):
+        with self.lock:
+            del self.items[n]
+
+
 class Navigator:
-    def __init__(self, items):
+    def __init__(self, variants):
         self.last = Window(1, 15, 1, 55)
         self.now = Window(1, 15, 1 + self.last.width + 2, 55)
         self.next = Window(1, 15, 1 + self.last.width + self.now.width + 4, 55)
 
         self.pointer = 0
-        self.items = [[i[0], i[1]] for i in items]
+        self.variants = variants
+        self.diff_only = False
 
     def go_left(self):
         self.pointer -= 1
         self.pointer = max(self.pointer, 0)
-        self.refresh()
 
     def go_right(self):
-        self.pointer += 1
-        self.pointer = min(self.pointer, len(self.items) - 1)
-        self.refresh()
+        if self.variants.has(self.pointer + 1):
+            self.pointer += 1
 
     def remove(self):
-        if len(self.items) > 1:
-            del self.items[self.pointer]
-            self.pointer = min(self.pointer, len(self.items) - 1)
+        if self.variants.has(1):
+            self.variants.remove(self.pointer)
+            if not self.variants.has(self.pointer):
+                self.pointer -= 1
 
-    @property
-    def item_last(self):
-        if self.pointer == 0:
-            return "", "", None
-
-        return self.items[self.pointer - 1]
+    def toggle_diff_only(self):
+        self.diff_only = not self.diff_only
 
     @property
-    def item_now(self):
-        return self.items[self.pointer]
-
-    @property
-    def item_next(self):
-        if self.pointer == len(self.items) - 1:
-            return "", "", None
-
-        return self.items[self.pointer + 1]
+    def encoding(self):
+        return self.variants.encoding(self.pointer)
+
+    def neighbours(self):
+        for n in (self.pointer - 1, self.pointer, self.pointer + 1):
+            if n >= 0 and self.variants.has(n):
+                yield self.variants.encoding(n), self.variants.lines(n)
+            else:
+                yield "", None
+
+    def visible_lines(self, neighbours):
+        """Indexes of the lines to show, the same ones in all windows"""
+        present = [lines for _, lines in neighbours if lines is not None]
+        length = max(len(lines) for lines in present)
+
+        def line(lines, n):
+            return lines[n] if n < len(lines) else ""
+
+        for n in range(length):
+            if self.diff_only:
+                if len({line(lines, n) for lines in present}) > 1:
+                    yield n
+            elif any(re_nonascii.search(line(lines, n)) for lines in present):
+                yield n
 
     def refresh(self):
-        self.last.set_title(self.item_last[0])
-        self.last.set_text(self.item_last[1])
-        self.last.refresh()
+        neighbours = list(self.neighbours())
+        visible = list(self.visible_lines(neighbours))
 
-        self.now.set_title(self.item_now[0])
-        self.now.set_text(self.item_now[1])
-        self.now.refresh()
+        for window, (title, lines) in zip((self.last, self.now, self.next), neighbours):
+            if lines is None:
+                text = ""
+            else:
+                text = "\n".join(lines[n] if n < len(lines) else "" for n in visible)
 
-        self.next.set_title(self.item_next[0])
-        self.next.set_text(self.item_next[1])
-        self.next.refresh()
+            window.set_title(title)
+            window.set_text(text)
+            window.noutrefresh()
 
+        curses.doupdate()
 
-def variants(content):
-    seen = set()
 
-    for enc in encodings:
-        try:
-            text = content.decode(enc)
-        except:
-            continue
-
-        if text in seen:
-            continue
-        if "#" not in text:
-            continue
-
-        seen.add(text)
-
-        text = text.replace("\0", "")  # null bytes confuse ncurses
-        demo_lines = [l for l in text.splitlines() if re_nonascii.search(l)]
-
-        yield enc, "\n".join(demo_lines)
-
-
-def run(stdscr, path):
+def init_screen(stdscr):
     curses.start_color()
     curses.use_default_colors()
     curses.init_pair(3, curses.COLOR_BLUE, -1)  # non-ascii char
     curses.curs_set(0)
     stdscr.refresh()
 
-    with open(path, "rb") as f:
-        content = f.read()
 
-    n = Navigator(list(variants(content)))
+def choose(stdscr, content, status=""):
+    """
+    Let the user choose a decoding of content with ENTER and return its encoding.
+    Returns None, if the user quit with 'q'. The status is shown above.
+    """
+    stdscr.erase()
+    stdscr.addstr(0, 1, status[: curses.COLS - 2])
+    stdscr.refresh()
+
+    n = Navigator(Variants(content))
     n.refresh()
 
     while True:
@@ -122,17 +243,37 @@ def run(stdscr, path):
             n.go_right()
         elif c == KEY_SPACEBAR:
             n.remove()
+        elif c == ord("d"):
+            n.toggle_diff_only()
+        elif c == KEY_ENTER:
+            return n.encoding
         elif c == ord("q"):
-            break
+            return None
 
         n.refresh()
 
 
+def run(stdscr, path):
+    init_screen(stdscr)
+
+    _stats.read(path)
+    with open(path, "rb") as f:
+        content = f.read()
+
+    return choose(stdscr, content)
+
+
 def main(argv):
     parser = argparse.ArgumentParser(description=HELP)
     parser.add_argument("file")
+    _stats.add_arguments(parser)
     args = parser.parse_args(argv)
-    curses.wrapper(run, args.file)
+
+    with _stats.collect(args):
+        encoding = curses.wrapper(run, args.file)
+
+    if encoding:
+        print(encoding)
 
 
 if __name__ == "__main__":
@@ -10,13 +10,14 @@ from contextlib import suppress
 import requests
 from PIL import Image
 
-from _utils import get_artisttitle, get_attribute, set_attribute
+import _stats
+from _utils import edit_header, get_artisttitle, get_attribute, read_header
 
 HELP = """
 Try to find a cover image for given ultrastar text files online, download them,
-set the #COVER attribute and rewrite the file. Does nothing, if there already
-is a cover file. Prints the paths of all changed files. Only accepts UTF-8
-encoded files.
+set the #COVER attribute and rewrite the header of the file. Does nothing, if
+there already is a cover file. Prints the paths of all changed files. Only
+accepts files with UTF-8 encoded headers.
 """
 
 
@@ -57,8 +58,7 @@ def has_working_cover(songdir, text):
 def add_cover_to_song(path, force, service):
     songdir = os.path.dirname(path)
 
-    with open(path) as f:
-        text = f.read()
+    text, _ = read_header(path)
 
     if not force and has_working_cover(songdir, text):
         return
@@ -80,9 +80,9 @@ def add_cover_to_song(path, force, service):
 
     with open(coverpath, "wb") as f:
         f.write(cover_content)
+    _stats.written(coverpath)
 
-    with open(path, "w") as f:
-        f.writelines(set_attribute(text.splitlines(), "COVER", coverfile))
+    edit_header(path, {"COVER": coverfile})
 
     print(path)
 
@@ -99,13 +99,15 @@ def main(argv):
         action="store_true",
         help="download a new cover regardless of an existing one; do not remove the old one.",
     )
+    _stats.add_arguments(parser)
     args = parser.parse_args(argv)
 
-    for path in args.files:
-        try:
-            add_cover_to_song(path, args.force, args.service)
-        except Exception as ex:
-            traceback.print_exc()
+    with _stats.collect(args):
+        for path in args.files:
+            try:
+                add_cover_to_song(path, args.force, args.service)
+            except Exception as ex:
+                traceback.print_exc()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import _stats
+from _note_snapshot import SnapshotWriter
+from _utils import NOTE_TYPES, get_attributes, iter_notes, read_header
+
+HELP = """
+Export the notes and attributes of all songs in the given libraries to a single
+snapshot file. Analyses can load it with _note_snapshot.NoteSnapshot, which maps
+the file into memory instead of parsing the songs:
+
+  snapshot = NoteSnapshot("notes.snapshot")
+  for n in range(len(snapshot)):
+      pitches = snapshot.pitches[snapshot.notes(n)]
+
+Beats are counted from the start of the song, also for #RELATIVE songs. Songs
+are decoded as UTF-8 ignoring invalid bytes, like integrate_collection.py does,
+so the syllables and attributes of songs in other encodings lack their non-ascii
+characters, recode them first. The songs are parsed by --jobs processes. Songs,
+which can't be read, are reported and counted as unreadable:
+
+  ERROR <TAB> reason <TAB> path
+"""
+
+
+def parse_song(path):
+    """
+    Return the path, attributes, note columns and distinct syllables of a
+    song, see SnapshotWriter.add, or the path and why it can't be read
+    """
+    try:
+        header, size = read_header(path, errors="ignore")
+        with open(path, "rb") as f:
+            f.seek(size)
+            body = f.read().decode("utf-8", errors="ignore")
+    except OSError as ex:
+        return path, str(ex)
+
+    attributes = get_attributes(header)
+    relative = attributes.get("RELATIVE", "").lower() == "yes"
+    offset = 0
+    singer = 0
+    notes = []
+    syllables = {}
+
+    for item in iter_notes(body.splitlines()):
+        kind = item[0]
+
+        if kind in NOTE_TYPES:
+            syllable = syllables.setdefault(item[4], len(syllables))
+            notes.append(
+                (ord(kind), offset + item[1], item[2], item[3], singer, syllable)
+            )
+        elif kind == "-" and relative:
+            offset += item[1] if item[2] is None else item[2]
+        elif kind == "P":
+            singer = item[1]
+            offset = 0
+
+    columns = np.array(notes, dtype=np.int64).reshape(-1, 6).T
+    names = ("kinds", "starts", "lengths", "pitches", "singers", "syllables")
+    return path, attributes, dict(zip(names, columns)), list(syllables)
+
+
+def get_song_paths(libraries):
+    for library in libraries:
+        if not os.path.isdir(library):
+            raise FileNotFoundError(library)
+
+        for root, _, files in os.walk(library):
+            for name in sorted(files):
+                if name.lower().endswith(".txt"):
+                    yield os.path.join(root, name)
+
+
+def export(libraries, output, jobs=None):
+    writer = SnapshotWriter()
+    unreadable = 0
+
+    with ProcessPoolExecutor(jobs) as executor:
+        paths = get_song_paths(libraries)
+        for result in executor.map(parse_song, paths, chunksize=64):
+            if len(result) == 2:
+                path, reason = result
+                print(f"ERROR\t{reason}\t{path}")
+                unreadable += 1
+                continue
+
+            _stats.read(result[0])
+            with _stats.stage("intern"):
+                writer.add(*result)
+
+    with _stats.stage("write"):
+        writer.write(output)
+    _stats.written(output)
+
+    return len(writer.counts), sum(writer.counts), unreadable
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(
+        description=HELP, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("libraries", nargs="+")
+    parser.add_argument(
+        "--output",
+        default="notes.snapshot",
+        help="file to write the snapshot to, default: notes.snapshot",
+    )
+    parser.add_argument("--jobs", type=int, help="number of processes to use")
+    _stats.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with _stats.collect(args):
+        songs, notes, unreadable = export(args.libraries, args.output, args.jobs)
+        print(
+            f"SUCCESS\t{songs} songs, {notes} notes, {unreadable} unreadable\t{args.output}"
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
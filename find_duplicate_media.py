@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+
+import argparse
+import hashlib
+import mmap
+import os
+import stat
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import _stats
+from find_unused_files import list_files
+
+HELP = """
+Given one or more directories, find media files like MP3s, videos or backgrounds
+with identical content, even if they are named differently or live in different
+song directories. Files are grouped by size first, then by a hash of their first
+and last chunk. Only files that still collide are hashed completely. Prints all
+groups of duplicates and the number of bytes that could be reclaimed. Ultrastar
+text files are ignored. Exits with 1, if duplicates were found.
+"""
+
+CHUNK_SIZE = 64 * 1024
+BLOCK_SIZE = 8 * 1024 * 1024
+
+
+def hash_edges(path, size):
+    h = hashlib.blake2b()
+    # empty files can't be mapped
+    if not size:
+        return h.digest()
+
+    with open(path, "rb") as f:
+        if size <= 2 * CHUNK_SIZE:
+            h.update(f.read())
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                h.update(m[:CHUNK_SIZE])
+                h.update(m[-CHUNK_SIZE:])
+
+    return h.digest()
+
+
+def hash_full(path, size):
+    h = hashlib.blake2b()
+    # empty files can't be mapped
+    if not size:
+        return h.digest()
+
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            with memoryview(m) as view:
+                # hashlib releases the GIL for large buffers, so the thread pool
+                # hashes several files in parallel
+                for start in range(0, size, BLOCK_SIZE):
+                    h.update(view[start : start + BLOCK_SIZE])
+
+    return h.digest()
+
+
+def group_by_size(paths, min_size):
+    by_size = defaultdict(dict)
+
+    for path in paths:
+        if path.lower().endswith(".txt"):
+            continue
+
+        try:
+            st = os.stat(path, follow_symlinks=False)
+        except OSError:
+            continue
+
+        if not stat.S_ISREG(st.st_mode):
+            continue
+        if st.st_size < min_size:
+            continue
+
+        # files that are hard links of each other already share their bytes
+        by_size[st.st_size].setdefault((st.st_dev, st.st_ino), path)
+
+    return [
+        (size, sorted(inodes.values()))
+        for size, inodes in by_size.items()
+        if len(inodes) > 1
+    ]
+
+
+def refine(groups, hash_func, executor, max_read=None):
+    refined = []
+
+    for size, paths in groups:
+        _stats.count("files_read", len(paths))
+        _stats.count("bytes_read", min(size, max_read or size) * len(paths))
+
+        by_hash = defaultdict(list)
+        digests = executor.map(lambda p: hash_func(p, size), paths)
+
+        for path, digest in zip(paths, digests):
+            by_hash[digest].append(path)
+
+        refined.extend((size, p) for p in by_hash.values() if len(p) > 1)
+
+    return refined
+
+
+def find_duplicates(directories, min_size=1, jobs=None):
+    paths = (p for d in directories for p in list_files(d))
+    groups = group_by_size(paths, min_size)
+
+    with ThreadPoolExecutor(jobs) as executor:
+        with _stats.stage("hash_edges"):
+            groups = refine(groups, hash_edges, executor, 2 * CHUNK_SIZE)
+        with _stats.stage("hash_full"):
+            groups = refine(groups, hash_full, executor)
+
+    groups.sort(key=lambda g: g[0] * (len(g[1]) - 1), reverse=True)
+    return groups
+
+
+def replace_with_hardlink(original, duplicate):
+    tmp_path = duplicate + ".hardlink-tmp"
+    os.link(original, tmp_path)
+
+    try:
+        os.replace(tmp_path, duplicate)
+    except OSError:
+        os.unlink(tmp_path)
+        raise
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=HELP)
+    parser.add_argument("directories", nargs="+")
+    parser.add_argument(
+        "--hardlink",
+        action="store_true",
+        help="replace all duplicates with hard links to the first file of their group",
+    )
+    parser.add_argument(
+        "--min-size",
+        type=int,
+        default=1,
+        help="ignore files smaller than the given number of bytes",
+    )
+    parser.add_argument("--jobs", type=int, help="number of files to hash in parallel")
+    parser.add_argument("--dry-run", action="store_true")
+    _stats.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with _stats.collect(args):
+        groups = find_duplicates(args.directories, args.min_size, args.jobs)
+        reclaimable = 0
+
+        for size, paths in groups:
+            reclaimable += size * (len(paths) - 1)
+
+            print(f"{size}\t{paths[0]}")
+            for path in paths[1:]:
+                print(f"{size}\t{path}")
+
+                if args.hardlink and not args.dry_run:
+                    try:
+                        replace_with_hardlink(paths[0], path)
+                    except OSError as ex:
+                        print(f"WARNING could not link {path}: {ex}")
+            print()
+
+        print(f"{len(groups)} groups of duplicates, {reclaimable} bytes reclaimable")
+
+        return 1 if groups else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
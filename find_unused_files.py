@@ -6,6 +6,7 @@ import os
 import sys
 from contextlib import suppress
 
+import _stats
 from _utils import get_attribute
 
 HELP = """
@@ -34,6 +35,7 @@ def get_linked_files(txt_path):
     songdir = os.path.dirname(txt_path)
 
     try:
+        _stats.read(txt_path)
         with open(txt_path) as f:
             text = f.read()
     except UnicodeDecodeError:
@@ -56,12 +58,14 @@ def get_all_linked_files(paths):
 def main(argv):
     parser = argparse.ArgumentParser(description=HELP)
     parser.add_argument("directory")
+    _stats.add_arguments(parser)
     args = parser.parse_args(argv)
 
-    all_files = set(list_files(args.directory))
-    linked_files = set(get_all_linked_files(all_files))
+    with _stats.collect(args):
+        all_files = set(list_files(args.directory))
+        linked_files = set(get_all_linked_files(all_files))
 
-    print("\n".join(all_files - linked_files))
+        print("\n".join(all_files - linked_files))
 
 
 if __name__ == "__main__":
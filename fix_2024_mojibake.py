@@ -5,6 +5,8 @@ import re
 import sys
 import traceback
 
+import _stats
+
 HELP = """
 Try to fix the mojibake found in the 2024 CAMP23 collection. It contains many
 'Korean' characters like 큄 which are actually Czech characters like š. This
@@ -97,6 +99,7 @@ RE_KOREAN_CHARACTER = re.compile(r"[가-힣]")
 
 
 def fix_2024_mojibake(path, dry_run):
+    _stats.read(path)
     with open(path, "r", encoding="utf-8") as f:
         text = f.read()
         text = text.translate(char_map)
@@ -105,6 +108,7 @@ def fix_2024_mojibake(path, dry_run):
     if not dry_run:
         with open(path, "w") as f:
             f.write(text)
+        _stats.written(path)
 
     return unknown_chars
 
@@ -113,16 +117,19 @@ def main(argv):
     parser = argparse.ArgumentParser(description=HELP)
     parser.add_argument("files", nargs="+")
     parser.add_argument("--dry-run", action="store_true")
+    _stats.add_arguments(parser)
     args = parser.parse_args(argv)
-    unknown_chars = []
 
-    for path in args.files:
-        try:
-            unknown_chars += fix_2024_mojibake(path, args.dry_run)
-        except Exception as ex:
-            traceback.print_exc()
+    with _stats.collect(args):
+        unknown_chars = []
+
+        for path in args.files:
+            try:
+                unknown_chars += fix_2024_mojibake(path, args.dry_run)
+            except Exception as ex:
+                traceback.print_exc()
 
-    print("unknown characters: " + " ".join(set(unknown_chars)))
+        print("unknown characters: " + " ".join(set(unknown_chars)))
 
 
 if __name__ == "__main__":
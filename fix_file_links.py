@@ -7,16 +7,17 @@ import sys
 import traceback
 import unicodedata
 
-from _utils import get_artisttitle, get_attribute, set_attribute
+import _stats
+from _utils import edit_header, get_artisttitle, get_attribute, read_header
 
 HELP = """
 Try to fix file links in #COVER, #MP3, #VIDEO and #BACKGROUND, which do not
 resolve correctly, due to differing encodings of filenames on the disk and in
 the attributes. Once the correct files have been found, rename them to
-"<artist> - <song>.<extension>", update the attributes and rewrite the file
-in-place. Remove any attributes, which cannot be resolved. Expects the text
-files to be in the same directory as the media files. Only accepts UTF-8 encoded
-text files.
+"<artist> - <song>.<extension>", update the attributes and rewrite the header
+of the file in-place. Remove any attributes, which cannot be resolved. Expects
+the text files to be in the same directory as the media files. Only accepts
+text files with UTF-8 encoded headers.
 """
 
 
@@ -34,8 +35,7 @@ def fix_file_links(path, keep_missing_files, dry_run=False, verbose=False):
 
     renamed = {}
 
-    with open(path) as f:
-        text = f.read()
+    text, _ = read_header(path)
 
     try:
         artisttitle = get_artisttitle(text)
@@ -50,7 +50,7 @@ def fix_file_links(path, keep_missing_files, dry_run=False, verbose=False):
         if not dry_run:
             os.rename(path, new_path)
 
-    lines = text.splitlines(True)
+    changes = {}
 
     for attr in ("MP3", "VIDEO", "COVER", "BACKGROUND"):
         try:
@@ -74,7 +74,7 @@ def fix_file_links(path, keep_missing_files, dry_run=False, verbose=False):
                 print(f"keep {attr}, no file found")
             else:
                 print(f"remove {attr}, no file found")
-                lines = set_attribute(lines, attr, None)
+                changes[attr] = None
             continue
 
         if attr_path == attr_path_ascii:
@@ -100,11 +100,10 @@ def fix_file_links(path, keep_missing_files, dry_run=False, verbose=False):
             new_attr_name = renamed[old_attr_name]
             print(f"rewrite {attr} (double-ref): {old_attr_name} => {new_attr_name}")
 
-        lines = set_attribute(lines, attr, new_attr_name)
+        changes[attr] = new_attr_name
 
-    if not dry_run:
-        with open(new_path, "w") as f:
-            f.writelines(lines)
+    if not dry_run and changes:
+        edit_header(new_path, changes)
 
 
 def main(argv):
@@ -117,15 +116,17 @@ def main(argv):
     )
     parser.add_argument("--dry-run", action="store_true")
     parser.add_argument("--verbose", action="store_true")
+    _stats.add_arguments(parser)
     args = parser.parse_args(argv)
 
-    for path in args.files:
-        try:
-            fix_file_links(
-                path, args.keep_nullpointer_lines, args.dry_run, args.verbose
-            )
-        except Exception as ex:
-            traceback.print_exc()
+    with _stats.collect(args):
+        for path in args.files:
+            try:
+                fix_file_links(
+                    path, args.keep_nullpointer_lines, args.dry_run, args.verbose
+                )
+            except Exception as ex:
+                traceback.print_exc()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+
+import argparse
+import io
+import os
+import random
+import shutil
+import sys
+
+from PIL import Image
+
+HELP = """
+For maintainer use only. Create a synthetic library of ultrastar songs for
+benchmarking and testing the other tools. Songs are spread over several
+collections, each of which has a preferred encoding and line ending, just like
+a collection ripped from a single source. The library contains duets, stub media
+files and a controlled amount of duplicates, some of which differ in title,
+encoding or media files.
+"""
+
+LANGUAGES = {
+    "English": (
+        ["cp1252", "utf_8", "ascii"],
+        "love heart night baby dance tonight fire rain dream forever "
+        "you me we never always together light sky stay go",
+    ),
+    "German": (
+        ["cp1252", "latin_1", "cp850", "utf_8"],
+        "liebe herz nacht tanzen für über schön grün müde süß "
+        "straße weiß größer träume hören gefühl",
+    ),
+    "Polish": (
+        ["cp1250", "iso8859_2", "utf_8"],
+        "miłość serce noc taniec zawsze ręka dziś śnieg źródło żółw "
+        "gęś łąka pieśń wiosna księżyc",
+    ),
+    "Czech": (
+        ["cp1250", "iso8859_2", "utf_8"],
+        "láska srdce noc tanec vždy ruka dnes sníh řeka žena "
+        "čas píseň měsíc šťastný",
+    ),
+    "French": (
+        ["cp1252", "latin_1", "iso8859_15", "utf_8"],
+        "amour cœur nuit danser toujours là où été château fenêtre "
+        "rêve garçon élève noël",
+    ),
+    "Spanish": (
+        ["cp1252", "latin_1", "utf_8"],
+        "amor corazón noche bailar siempre mañana niño año canción "
+        "señor aquí también",
+    ),
+    "Russian": (
+        ["cp1251", "koi8_r", "utf_8"],
+        "любовь сердце ночь танец всегда рука сегодня снег река песня луна",
+    ),
+    "Turkish": (
+        ["cp1254", "iso8859_9", "utf_8"],
+        "aşk kalp gece dans her zaman el bugün kar nehir şarkı ay güzel",
+    ),
+}
+
+LINE_ENDINGS = {"lf": "\n", "crlf": "\r\n", "cr": "\r"}
+GENRES = ["Pop", "Rock", "Schlager", "Musical", "Metal", "Disco", "Folk"]
+
+
+def stub_image(width, height):
+    f = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 30, 90)).save(f, "JPEG")
+    return f.getvalue()
+
+
+class LibraryGenerator:
+    def __init__(
+        self,
+        root,
+        seed=0,
+        collections=5,
+        duplicate_rate=0.1,
+        duet_rate=0.1,
+        media_size=4096,
+    ):
+        self.root = root
+        self.random = random.Random(seed)
+        self.duplicate_rate = duplicate_rate
+        self.duet_rate = duet_rate
+        self.media_size = media_size
+        self.collections = [self.random_collection(n) for n in range(collections)]
+        self.songs = []
+        self.covers = [stub_image(300, 300), stub_image(800, 800)]
+
+    def random_collection(self, n):
+        language = self.random.choice(list(LANGUAGES))
+        return {
+            "name": f"collection_{n:02d}",
+            "language": language,
+            "encoding": self.random.choice(LANGUAGES[language][0]),
+            "line_ending": self.random.choice(list(LINE_ENDINGS)),
+        }
+
+    def name(self, language, words):
+        """Made up words, so that names are as diverse as in a real library"""
+        chunks = [w[i : i + 2] for w in LANGUAGES[language][1].split() for i in (0, 2)]
+        chunks = [c for c in chunks if len(c) == 2]
+
+        return " ".join(
+            "".join(self.random.choices(chunks, k=self.random.randint(2, 4)))
+            for _ in range(words)
+        ).title()
+
+    def random_song(self, collection):
+        # songs mostly, but not always, have the collection's language
+        if self.random.random() < 0.8:
+            language = collection["language"]
+        else:
+            language = self.random.choice(list(LANGUAGES))
+
+        return {
+            "artist": self.name(language, self.random.randint(1, 2)),
+            "title": self.name(language, self.random.randint(1, 4)),
+            "language": language,
+            "singers": 2 if self.random.random() < self.duet_rate else 1,
+            "video": self.random.random() < 0.5,
+            "seed": self.random.getrandbits(32),
+        }
+
+    def duplicate_song(self):
+        song = dict(self.random.choice(self.songs))
+        variant = self.random.choice(["exact", "title", "video"])
+
+        if variant == "title":
+            song["title"] += self.random.choice([" [VIDEO]", " (Duett)", "!", "s"])
+        elif variant == "video":
+            song["video"] = not song["video"]
+
+        return song, variant == "exact"
+
+    def notes(self, song):
+        rng = random.Random(song["seed"])
+        lines = []
+
+        for singer in range(1, song["singers"] + 1):
+            if song["singers"] > 1:
+                lines.append(f"P{singer}")
+
+            beat = rng.randint(0, 16)
+            for phrase in range(rng.randint(20, 40)):
+                for syllable in self.words_for(rng, song["language"]):
+                    length = rng.randint(1, 6)
+                    kind = rng.choices(":*F", weights=(90, 8, 2))[0]
+                    lines.append(
+                        f"{kind} {beat} {length} {rng.randint(-5, 20)} {syllable}"
+                    )
+                    beat += length + rng.randint(0, 2)
+                lines.append(f"- {beat + 2}")
+                beat += rng.randint(4, 12)
+            lines.pop()
+
+        return lines
+
+    @staticmethod
+    def words_for(rng, language):
+        vocabulary = LANGUAGES[language][1].split()
+        words = [rng.choice(vocabulary) for _ in range(rng.randint(2, 6))]
+        return [" " + w if n else w for n, w in enumerate(words)]
+
+    def write_song(self, collection, song, exact_copy=False):
+        name = f"{song['artist']} - {song['title']}".replace("/", " ")
+        songdir = os.path.join(self.root, collection["name"], name)
+
+        suffix = 1
+        while os.path.exists(songdir):
+            suffix += 1
+            songdir = os.path.join(self.root, collection["name"], f"{name} ({suffix})")
+        os.makedirs(songdir)
+
+        rng = random.Random(song["seed"])
+        header = [
+            f"#TITLE:{song['title']}",
+            f"#ARTIST:{song['artist']}",
+            f"#LANGUAGE:{song['language']}",
+            f"#GENRE:{rng.choice(GENRES)}",
+            f"#YEAR:{rng.randint(1960, 2024)}",
+            f"#MP3:{name}.mp3",
+            f"#COVER:{name} [CO].jpg",
+            f"#BPM:{rng.randint(150, 400)},{rng.randint(0, 99):02d}",
+            f"#GAP:{rng.randint(0, 30000)}",
+        ]
+        if song["video"]:
+            header.append(f"#VIDEO:{name}.mp4")
+        else:
+            header.append(f"#BACKGROUND:{name} [BG].jpg")
+
+        lines = header + self.notes(song) + ["E"]
+
+        if exact_copy:
+            encoding, line_ending = song["encoding"], song["line_ending"]
+        else:
+            encoding = collection["encoding"]
+            line_ending = LINE_ENDINGS[collection["line_ending"]]
+
+            # a few songs in each collection come from elsewhere
+            if rng.random() < 0.1:
+                encoding = rng.choice(LANGUAGES[song["language"]][0])
+        text = "".join(line + line_ending for line in lines)
+
+        try:
+            content = text.encode(encoding)
+        except UnicodeEncodeError:
+            encoding = "utf_8"
+            content = text.encode(encoding)
+
+        with open(os.path.join(songdir, name + ".txt"), "wb") as f:
+            f.write(content)
+
+        media = {name + ".mp3": rng.randbytes(self.media_size)}
+        media[f"{name} [CO].jpg"] = self.covers[rng.randint(0, 1)]
+        if song["video"]:
+            media[name + ".mp4"] = rng.randbytes(self.media_size * 4)
+        else:
+            media[f"{name} [BG].jpg"] = self.covers[1]
+
+        for filename, data in media.items():
+            with open(os.path.join(songdir, filename), "wb") as f:
+                f.write(data)
+
+        song.update(encoding=encoding, line_ending=line_ending)
+
+    def generate(self, count):
+        for n in range(count):
+            collection = self.random.choice(self.collections)
+
+            if self.songs and self.random.random() < self.duplicate_rate:
+                song, exact_copy = self.duplicate_song()
+            else:
+                song, exact_copy = self.random_song(collection), False
+
+            self.write_song(collection, song, exact_copy)
+            self.songs.append(song)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=HELP)
+    parser.add_argument("target")
+    parser.add_argument("--songs", type=int, default=1000)
+    parser.add_argument("--collections", type=int, default=5)
+    parser.add_argument(
+        "--duplicate-rate",
+        type=float,
+        default=0.1,
+        help="fraction of songs, which are duplicates of another song",
+    )
+    parser.add_argument(
+        "--duet-rate", type=float, default=0.1, help="fraction of duets"
+    )
+    parser.add_argument(
+        "--media-size",
+        type=int,
+        default=4096,
+        help="size of stub audio files in bytes, videos are four times as big",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--force", action="store_true", help="delete the target directory first"
+    )
+    args = parser.parse_args(argv)
+
+    if args.force:
+        shutil.rmtree(args.target, ignore_errors=True)
+    if os.path.exists(args.target):
+        parser.error(f"{args.target} exists, use --force to replace it")
+
+    generator = LibraryGenerator(
+        args.target,
+        args.seed,
+        args.collections,
+        args.duplicate_rate,
+        args.duet_rate,
+        args.media_size,
+    )
+    generator.generate(args.songs)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -3,6 +3,8 @@
 import argparse
 import sys
 
+import _stats
+import _where
 from _utils import get_attribute
 
 HELP = """
@@ -21,19 +23,23 @@ def main(argv):
         action="store_true",
         help="just print the value, not the file path.",
     )
+    _where.add_argument(parser)
+    _stats.add_arguments(parser)
     args = parser.parse_args(argv)
 
-    for path in args.files:
-        with open(path) as f:
-            try:
-                value = get_attribute(f.read(), args.attribute)
-            except KeyError:
-                continue
-
-            if args.no_filename:
-                print(f"{value}")
-            else:
-                print(f"{value}\t{path}")
+    with _stats.collect(args):
+        for path in _where.select(args.files, args.where):
+            _stats.read(path)
+            with open(path) as f:
+                try:
+                    value = get_attribute(f.read(), args.attribute)
+                except KeyError:
+                    continue
+
+                if args.no_filename:
+                    print(f"{value}")
+                else:
+                    print(f"{value}\t{path}")
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@
 import argparse
 import sys
 
+import _stats
 from _utils import get_lyrics
 
 HELP = """
@@ -13,12 +14,15 @@ For a list of ultrastar text files, parse the lyrics and dump them line-by-line.
 def main(argv):
     parser = argparse.ArgumentParser(description=HELP)
     parser.add_argument("files", nargs="+")
+    _stats.add_arguments(parser)
     args = parser.parse_args(argv)
 
-    for path in args.files:
-        with open(path) as f:
-            lyrics = get_lyrics(f.read())
-            print("\n".join(lyrics))
+    with _stats.collect(args):
+        for path in args.files:
+            _stats.read(path)
+            with open(path) as f:
+                lyrics = get_lyrics(f.read())
+                print("\n".join(lyrics))
 
 
 if __name__ == "__main__":
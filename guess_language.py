@@ -6,6 +6,8 @@ import sys
 import traceback
 from pathlib import Path
 
+import _stats
+import _where
 from _utils import get_attribute, set_attribute
 from recode_language import guess_lyric_language
 
@@ -24,11 +26,13 @@ moves to
 
 
 def guess_language(path):
+    _stats.read(path)
     with open(path) as f:
         text = f.read()
 
     try:
-        language = guess_lyric_language(text, remove_non_ascii=False)
+        with _stats.stage("language"):
+            language = guess_lyric_language(text, remove_non_ascii=False)
         try:
             old_language = get_attribute(text, "LANGUAGE")
         except KeyError:
@@ -49,24 +53,28 @@ def main(argv):
         action="store_true",
         help="just find the encoding, do not change the file.",
     )
+    _where.add_argument(parser)
+    _stats.add_arguments(parser)
     args = parser.parse_args(argv)
 
-    for path in args.files:
-        print(path)
-        try:
-            language = guess_language(path)
-
-            song_directory = Path(path).parent
-            new_name = Path(args.target) / language / song_directory.name
-
-            print(f"{song_directory} => {new_name}")
-            if not args.dry_run:
-                if not song_directory.exists():
-                    print(f"WARNING directory vanished: {song_directory}")
-                else:
-                    os.renames(song_directory, new_name)
-        except Exception as ex:
-            traceback.print_exc()
+    with _stats.collect(args):
+        for path in _where.select(args.files, args.where):
+            print(path)
+            try:
+                language = guess_language(path)
+
+                song_directory = Path(path).parent
+                new_name = Path(args.target) / language / song_directory.name
+
+                print(f"{song_directory} => {new_name}")
+                if not args.dry_run:
+                    if not song_directory.exists():
+                        print(f"WARNING directory vanished: {song_directory}")
+                    else:
+                        with _stats.stage("move"):
+                            os.renames(song_directory, new_name)
+            except Exception as ex:
+                traceback.print_exc()
 
 
 if __name__ == "__main__":
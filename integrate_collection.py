@@ -2,12 +2,18 @@
 
 import argparse
 import functools
+import hashlib
+import heapq
+import json
 import os
 import sys
+from collections import Counter, defaultdict
 from pathlib import Path
 
 import Levenshtein
 
+import _stats
+import _where
 from _utils import get_attribut_names, get_attribute, get_number_of_singers
 
 HELP = """
@@ -37,32 +43,48 @@ Scoring cirteria:
 
 
 class Song:
-    path: Path
-    text: str
-    attributes: dict[str, str]
+    """
+    A song as needed for scoring. To keep memory usage low with large
+    collections, only a few attributes and a digest of the text are kept. The
+    full text is read again from disk, when it is accessed.
+    """
+
+    __slots__ = ("_path", "attributes", "singers", "digest")
+
+    kept_attributes = ("ARTIST", "TITLE", "MP3", "COVER", "VIDEO", "BACKGROUND")
 
     def __init__(self, path):
-        self.path = Path(path)
-        self.text = Path(path).read_text("utf-8", errors="ignore").strip()
-        # this is stupidly slow, but we don't have so many files
+        # a Path object takes several times the memory of a str
+        self._path = str(path)
+        text = self.text
+        self.digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        self.singers = get_number_of_singers(text)
         self.attributes = {
-            k: get_attribute(self.text, k).strip()
-            for k in get_attribut_names(self.text)
+            sys.intern(k): get_attribute(text, k).strip()
+            for k in get_attribut_names(text)
+            if k in self.kept_attributes
         }
 
-    @functools.cached_property
-    def singers(self):
-        return get_number_of_singers(self.text)
+    @property
+    def path(self):
+        return Path(self._path)
+
+    @property
+    def text(self):
+        _stats.read(self._path)
+        return self.path.read_text("utf-8", errors="ignore").strip()
 
-    @functools.cache
     def __getattr__(self, attr):
+        if attr in Song.__slots__:
+            raise AttributeError(attr)
+
         return self.attributes.get(attr, None)
 
     def __repr__(self):
         return f"{self.ARTIST} - {self.TITLE}"
 
     def match(self, needle):
-        if self.text == needle.text:
+        if self.digest == needle.digest:
             return 100, ["TEXT"]
 
         lev_artist = lev(self.ARTIST, needle.ARTIST)
@@ -86,12 +108,21 @@ class Song:
 
         return score, matched_matchers
 
+    def match_bound(self, needle):
+        """
+        Upper bound of the score returned by match(), which can be computed
+        without calculating any Levenshtein ratio. A text match is not covered.
+        """
+        bound_artist = lev_bound(self.ARTIST, needle.ARTIST)
+        if bound_artist > 90:
+            return lev_bound(self.TITLE, needle.TITLE) + 10
+
+        return lev_bound(self.TITLE, needle.TITLE) * 0.5
 
-@functools.cache
-def lev(a, b):
-    if a is None or b is None:
-        return 0
 
+# bounded, search_server.py normalizes every query in a long running process
+@functools.lru_cache(maxsize=2**16)
+def normalize(s):
     remove = [
         "[video]",
         "(duett)",
@@ -103,14 +134,88 @@ def lev(a, b):
         "the",
     ]
 
-    a = a.lower()
-    b = b.lower()
+    s = s.lower()
 
     for r in remove:
-        a = a.replace(r, "")
-        b = b.replace(r, "")
+        s = s.replace(r, "")
+
+    return s
+
+
+@functools.cache
+def char_profile(s):
+    """Length and a bitmask of the characters of the normalized string"""
+    s = normalize(s)
+    mask = 0
+
+    for c in set(s):
+        mask |= 1 << (ord(c) & 127)
+
+    return len(s), mask
+
+
+@functools.lru_cache(maxsize=2**16)
+def lev(a, b):
+    if a is None or b is None:
+        return 0
+
+    _stats.count("levenshtein_calls")
+    return int(Levenshtein.ratio(normalize(a), normalize(b)) * 100)
 
-    return int(Levenshtein.ratio(a, b) * 100)
+
+_stats.register_cache("lev", lev)
+_stats.register_cache("normalize", normalize)
+
+
+def lev_bound(a, b):
+    """
+    Cheap upper bound of lev(a, b). The ratio is based on the number of
+    insertions and deletions needed to turn a into b. Characters of one string,
+    which don't occur in the other one, must be deleted and the difference in
+    length must be made up as well.
+    """
+    if a is None or b is None:
+        return 0
+
+    len_a, mask_a = char_profile(a)
+    len_b, mask_b = char_profile(b)
+    total = len_a + len_b
+
+    if not total:
+        return 100
+
+    only_a = (mask_a & ~mask_b).bit_count()
+    only_b = (mask_b & ~mask_a).bit_count()
+    # deletions in a minus deletions in b equal the difference in length
+    deletions_b = max(only_b, only_a - (len_a - len_b))
+    distance = 2 * deletions_b + len_a - len_b
+
+    # round up, so floating point differences can't make the bound too tight
+    return min(int((total - distance) * 100 / total) + 1, 100)
+
+
+def trigrams(key):
+    return {key[i : i + 3] for i in range(len(key) - 2)} or {key}
+
+
+class TrigramIndex:
+    """Inverted index from the trigrams of normalized strings to ids"""
+
+    def __init__(self):
+        self.postings = defaultdict(list)
+
+    def add(self, id, s):
+        for gram in trigrams(normalize(s)):
+            self.postings[gram].append(id)
+
+    def candidates(self, s, min_shared=1):
+        """Ids of all strings sharing at least min_shared trigrams with s"""
+        counts = Counter()
+
+        for gram in trigrams(normalize(s)):
+            counts.update(self.postings.get(gram, ()))
+
+        return [id for id, count in counts.items() if count >= min_shared]
 
 
 class SongCollection:
@@ -118,29 +223,175 @@ class SongCollection:
         self.root = Path(root)
         self.songs = []
 
-    def load(self):
+    def load(self, where=None):
+        """Load the songs, only those matching the --where predicate, if given"""
         if not self.root.exists():
             raise FileNotFoundError(self.root)
 
-        for path in self.root.glob("**/*.txt"):
-            self.songs.append(Song(path))
-
-    def find_matches(self, needle):
+        with _stats.stage("load"):
+            for path in _where.select(
+                self.root.glob("**/*.txt"), where, errors="ignore"
+            ):
+                self.songs.append(Song(path))
+
+    def find_matches(self, needle, k=None, min_score=0, candidates=None):
+        """
+        Score all songs against the needle and return the matching ones as
+        (song, score, matchers), best first. Only the first k matches with a
+        score of at least min_score are returned. Songs whose score can't make
+        it into the result according to Song.match_bound() are not scored.
+        If candidates are given, only the songs with these indices are scored.
+        """
         matched_songs = []
+        # min-heap of the best k matches, ties are won by the earlier song
+        top = []
+
+        if candidates is None:
+            candidates = range(len(self.songs))
+
+        for n in candidates:
+            song = self.songs[n]
+            if song.digest != needle.digest:
+                threshold = top[0][0] if k and len(top) == k else min_score - 1
+                if min(song.match_bound(needle), 100) <= threshold:
+                    continue
 
-        for song in self.songs:
             score, matched_matchers = song.match(needle)
+            if not matched_matchers:
+                continue
 
-            if matched_matchers:
-                matched_songs.append(
-                    (song, int(max(min(score, 100), 0)), matched_matchers)
-                )
+            score = int(max(min(score, 100), 0))
+            if score < min_score:
+                continue
+
+            if not k:
+                matched_songs.append((song, score, matched_matchers))
+            elif len(top) < k:
+                heapq.heappush(top, (score, -n, song, matched_matchers))
+            elif (score, -n) > top[0][:2]:
+                heapq.heapreplace(top, (score, -n, song, matched_matchers))
+
+        if k:
+            top.sort(reverse=True)
+            return [(song, score, m) for score, _, song, m in top]
 
         matched_songs.sort(key=(lambda s: s[1]), reverse=True)
 
         return matched_songs
 
 
+CACHE_VERSION = 1
+TOP_MATCHES = 3
+
+
+def collection_state(root):
+    if not Path(root).exists():
+        raise FileNotFoundError(root)
+
+    state = {}
+
+    for path in Path(root).glob("**/*.txt"):
+        st = path.stat()
+        state[str(path.relative_to(root))] = [st.st_mtime_ns, st.st_size]
+
+    return state
+
+
+def state_digest(state):
+    return hashlib.sha1(json.dumps(state, sort_keys=True).encode()).hexdigest()
+
+
+def load_match_cache(path, main_digest):
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+    if cache.get("version") != CACHE_VERSION or cache.get("main") != main_digest:
+        return {}
+
+    return cache["songs"]
+
+
+def save_match_cache(path, main_digest, songs):
+    tmp_path = f"{path}.tmp"
+
+    with open(tmp_path, "w") as f:
+        json.dump({"version": CACHE_VERSION, "main": main_digest, "songs": songs}, f)
+
+    os.replace(tmp_path, path)
+
+
+def score_cached(col_main, col_new, cache_path, where=None):
+    """
+    Return the NEW songs with their top matches like score(), but take the
+    matches from the cache file, if neither MAIN nor the song itself changed
+    since they were computed. Songs that are missing or outdated are scored
+    and added to the cache. Songs not matching where are neither scored nor
+    returned, but their valid cache entries are kept.
+    """
+    main_digest = state_digest(collection_state(col_main.root))
+    new_state = collection_state(col_new.root)
+    paths = [col_new.root / p for p in new_state]
+    selected = set(_where.select(paths, where, errors="ignore"))
+    cached = load_match_cache(cache_path, main_digest)
+    songs = {}
+    kept = {}
+
+    for relpath, state in new_state.items():
+        entry = cached.get(relpath)
+
+        if col_new.root / relpath not in selected:
+            if entry and entry["state"] == state:
+                kept[relpath] = entry
+            continue
+
+        if entry and entry["state"] == state:
+            _stats.count("cache_hits")
+        else:
+            _stats.count("cache_misses")
+            if not col_main.songs:
+                col_main.load()
+
+            song = Song(col_new.root / relpath)
+            with _stats.stage("score"):
+                matches = col_main.find_matches(song, TOP_MATCHES)
+            entry = {
+                "state": state,
+                "name": str(song),
+                "matches": [[str(m[0]), m[1], m[2]] for m in matches],
+            }
+
+        songs[relpath] = entry
+
+    save_match_cache(cache_path, main_digest, songs | kept)
+
+    return [
+        (col_new.root / relpath, entry["name"], [tuple(m) for m in entry["matches"]])
+        for relpath, entry in songs.items()
+    ]
+
+
+def score(col_main, col_new, name_filter=None, min_score=0):
+    """
+    Yield each song in NEW with its top matches in MAIN like score_cached(), or
+    no matches, if none has a score of at least min_score. Songs not matching
+    the name filter are not scored.
+    """
+    for song in col_new.songs:
+        if name_filter and name_filter.lower() not in str(song).lower():
+            yield song.path, str(song), None
+            continue
+
+        with _stats.stage("score"):
+            matches = col_main.find_matches(song, TOP_MATCHES, min_score)
+            if matches and len(matches) < TOP_MATCHES and min_score > 0:
+                # pruning left out the matches below min_score, which are shown
+                matches = col_main.find_matches(song, TOP_MATCHES)
+        yield song.path, str(song), [(str(m[0]), m[1], m[2]) for m in matches]
+
+
 def main(argv):
     parser = argparse.ArgumentParser(
         description=HELP, formatter_class=argparse.RawTextHelpFormatter
@@ -154,47 +405,63 @@ def main(argv):
         "--filter",
         help="only check songs in NEW that contain the given string in artist or title",
     )
+    _where.add_argument(
+        parser, help="only check songs in NEW, whose header matches EXPR"
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="FILE",
+        help="save the top matches of each song in NEW to FILE and reuse them in later runs with different score ranges or targets. Songs are only rescored, if they or MAIN changed.",
+    )
+    _stats.add_arguments(parser)
     args = parser.parse_args(argv)
 
-    score_min, sep, score_max = args.SCORE_RANGE.partition("-")
-    if sep:
-        score_min = int(score_min if score_min else 0)
-        score_max = int(score_max if score_max else 100)
-    else:
-        score_min = score_max = int(score_min)
-
-    col_main = SongCollection(args.MAIN)
-    col_main.load()
-
-    col_new = SongCollection(args.NEW)
-    col_new.load()
-
-    for n, song in enumerate(col_new.songs):
-        if args.filter and args.filter.lower() not in str(song).lower():
-            continue
-
-        matches = col_main.find_matches(song)
-        max_score = max([m[1] for m in matches] or [0])
-
-        if not (score_min <= max_score <= score_max):
-            continue
-
-        if args.dry_run and matches:
-            print()
-            print(f"{n}/{len(col_new.songs)-1} {song}")
-            for m in matches[:3]:
-                print(f"=> {m}")
-
-        if matches:
-            song_directory = song.path.parent
-            new_name = Path(args.TARGET) / song_directory.name
-
-            print(f"{song_directory} => {new_name}")
-            if not args.dry_run:
-                if not song_directory.exists():
-                    print(f"WARNING directory vanished: {song_directory}")
-                else:
-                    os.renames(song_directory, new_name)
+    with _stats.collect(args):
+        score_min, sep, score_max = args.SCORE_RANGE.partition("-")
+        if sep:
+            score_min = int(score_min if score_min else 0)
+            score_max = int(score_max if score_max else 100)
+        else:
+            score_min = score_max = int(score_min)
+
+        col_main = SongCollection(args.MAIN)
+        col_new = SongCollection(args.NEW)
+
+        if args.cache:
+            songs = score_cached(col_main, col_new, args.cache, args.where)
+            total = len(songs)
+        else:
+            col_main.load()
+            col_new.load(args.where)
+            songs = score(col_main, col_new, args.filter, score_min)
+            total = len(col_new.songs)
+
+        for n, (path, song, matches) in enumerate(songs):
+            if args.filter and args.filter.lower() not in song.lower():
+                continue
+
+            max_score = max([m[1] for m in matches] or [0])
+
+            if not (score_min <= max_score <= score_max):
+                continue
+
+            if args.dry_run and matches:
+                print()
+                print(f"{n}/{total-1} {song}")
+                for m in matches:
+                    print(f"=> {m}")
+
+            if matches:
+                song_directory = path.parent
+                new_name = Path(args.TARGET) / song_directory.name
+
+                print(f"{song_directory} => {new_name}")
+                if not args.dry_run:
+                    if not song_directory.exists():
+                        print(f"WARNING directory vanished: {song_directory}")
+                    else:
+                        with _stats.stage("move"):
+                            os.renames(song_directory, new_name)
 
 
 if __name__ == "__main__":
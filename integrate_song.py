@@ -2,26 +2,141 @@
 
 import argparse
 import curses
-import os
-import re
 import sys
+import threading
 
-from _curses_helpers import KEY_SPACEBAR, Window, re_nonascii
+import _stats
+from _curses_helpers import KEY_ENTER, KEY_ESCAPE, KEYS_BACKSPACE, Window
+from integrate_collection import Song, SongCollection, TrigramIndex, normalize, trigrams
 
 HELP = """
 Integrate new songs into an existing collection. Given a MAIN collection and one
-of NEW songs, for each song in the NEW collection try to determine, if the song
-is missing in the MAIN collection.
+of NEW songs, browse the songs in NEW and see the best matches in MAIN beside
+each of them, scored like integrate_collection.py does, to determine, if the
+song is missing in the MAIN collection.
 
-For each song in NEW, this script offers you to
+Both collections are loaded in the background, browsing starts right away.
 
-A) mark the song as "done" and do nothing
-B) mark the song as "done" and copy it to MAIN
-C) do nothing
-
-Quit by pressing 'q'.
+  UP, DOWN, PAGE UP, PAGE DOWN  select a song in NEW
+  /                             search NEW by artist and title, ENTER or ESC
+                                end the search, the songs stay filtered
+  q                             quit
 """
 
+# milliseconds to wait for a key, before showing the progress of loading
+LOADING_REFRESH = 200
+
+
+class BrowsedCollection(SongCollection):
+    """
+    A collection, which is loaded in a background thread and can be searched by
+    artist and title while loading.
+    """
+
+    def __init__(self, root):
+        super().__init__(root)
+        self.index = TrigramIndex()
+        # normalized artist and title of each song
+        self.keys = []
+        self.lock = threading.Lock()
+        self.loading = True
+
+    def start(self):
+        if not self.root.exists():
+            raise FileNotFoundError(self.root)
+
+        threading.Thread(target=self.load, daemon=True).start()
+
+    def load(self):
+        for path in self.root.glob("**/*.txt"):
+            song = Song(path)
+            key = f"{song.ARTIST or ''} {song.TITLE or ''}"
+
+            with self.lock:
+                self.index.add(len(self.songs), key)
+                self.keys.append(normalize(key))
+                self.songs.append(song)
+
+        self.loading = False
+
+    def search(self, query, among=None):
+        """
+        Indices of the songs, whose normalized artist and title contain the
+        normalized query. If given, only the songs among these are searched.
+        """
+        key = normalize(query)
+
+        with self.lock:
+            if among is None and len(key) >= 3:
+                among = sorted(self.index.candidates(key, len(trigrams(key))))
+            elif among is None:
+                among = range(len(self.songs))
+
+            return [n for n in among if key in self.keys[n]]
+
+    def candidates(self, song):
+        """Indices of the songs sharing a trigram with artist and title of song"""
+        with self.lock:
+            key = f"{song.ARTIST or ''} {song.TITLE or ''}"
+            return sorted(self.index.candidates(key))
+
+
+class Browser:
+    """The songs of NEW matching the search, the selected one and its matches"""
+
+    def __init__(self, new, main):
+        self.new = new
+        self.main = main
+        self.query = ""
+        self.ids = []
+        # query and number of songs, which ids was computed for
+        self.searched = None
+        self.selected = 0
+        self.matches = {}
+
+    def update(self):
+        """Search again, if the query changed or more songs were loaded"""
+        searched = (self.query, len(self.new.songs))
+        if searched == self.searched:
+            return
+
+        among = None
+        if self.searched and self.searched[1] == searched[1]:
+            # a longer query only matches songs the shorter one matched
+            if normalize(self.searched[0]) in normalize(self.query):
+                among = self.ids
+
+        self.ids = self.new.search(self.query, among)
+        self.searched = searched
+        self.selected = max(min(self.selected, len(self.ids) - 1), 0)
+
+    def type(self, char):
+        self.query += char
+
+    def erase(self):
+        self.query = self.query[:-1]
+
+    def move(self, delta):
+        self.selected = max(min(self.selected + delta, len(self.ids) - 1), 0)
+
+    def best_matches(self, k):
+        """The best k matches in MAIN of the selected song"""
+        if not self.ids:
+            return []
+
+        n = self.ids[self.selected]
+        if n in self.matches:
+            return self.matches[n]
+
+        song = self.new.songs[n]
+        matches = self.main.find_matches(song, k, candidates=self.main.candidates(song))
+
+        # matches found while MAIN is loading may not be the best ones
+        if not self.main.loading:
+            self.matches[n] = matches
+
+        return matches
+
 
 class Desktop:
     def __init__(self):
@@ -32,17 +147,72 @@ class Desktop:
 
     def refresh(self):
         for w in self.windows:
-            w.refresh()
+            w.noutrefresh()
+        curses.doupdate()
 
 
 class ListWindow(Window):
+    """Shows only the visible part of a list of items, highlights the selected"""
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.list = []
+        self.items = []
+        self.format = str
+        self.top = 0
+        self.selected = None
 
-    def refresh(self):
-        self.text = "\n".join(self.list) + "\n"
-        return super().refresh()
+    def show(self, items, selected=None):
+        """Show items, scrolled so that the selected item is visible"""
+        self.items = items
+        self.selected = selected
+
+        if selected is not None:
+            self.top = min(self.top, selected)
+            self.top = max(self.top, selected - self.rows + 1)
+        self.top = max(min(self.top, len(items) - self.rows), 0)
+
+    def noutrefresh(self):
+        visible = self.items[self.top : self.top + self.rows]
+        self.text = "\n".join(self.format(item) for item in visible)
+        if self.selected is None or not self.items:
+            self.highlight = None
+        else:
+            self.highlight = self.selected - self.top
+        super().noutrefresh()
+
+
+def get_title(name, collection, shown):
+    title = f"{name} {shown}/{len(collection.songs)}"
+    return title + " loading" if collection.loading else title
+
+
+def draw(desktop, w_new, w_main, browser, searching):
+    new, main = browser.new, browser.main
+
+    w_new.title = get_title("NEW", new, len(browser.ids))
+    if searching or browser.query:
+        w_new.title += f" /{browser.query}"
+    w_new.format = lambda n: repr(new.songs[n])
+    w_new.show(browser.ids, browser.selected)
+
+    matches = browser.best_matches(w_main.rows)
+    w_main.title = get_title("MAIN", main, len(matches))
+    w_main.show([f"{score:3}  {song!r}" for song, score, _ in matches])
+
+    desktop.refresh()
+
+
+def get_key(stdscr):
+    """The pressed key as a curses key code, a character or None on timeout"""
+    try:
+        key = stdscr.get_wch()
+    except curses.error:
+        return None
+
+    # control characters are compared as key codes
+    if isinstance(key, str) and not key.isprintable():
+        return ord(key)
+    return key
 
 
 def run(stdscr, collection_main, collection_new):
@@ -50,39 +220,68 @@ def run(stdscr, collection_main, collection_new):
     curses.use_default_colors()
     curses.init_pair(3, curses.COLOR_BLUE, -1)  # non-ascii char
     curses.curs_set(0)
+    curses.set_escdelay(25)
+    stdscr.timeout(LOADING_REFRESH)
     stdscr.refresh()
 
-    desktop = Desktop()
+    main = BrowsedCollection(collection_main)
+    new = BrowsedCollection(collection_new)
+    main.start()
+    new.start()
+    browser = Browser(new, main)
 
-    files_main = os.listdir(collection_main)
-    print(files_main)
+    desktop = Desktop()
+    height = curses.LINES - 2
+    width = (curses.COLS - 4) // 2
 
-    w_new = ListWindow(1, 20, 1, 30, "NEW")
-    w_new.list = files_main
+    w_new = ListWindow(1, height, 1, width, "NEW")
     desktop.add_window(w_new)
 
-    w_main = ListWindow(1, 20, w_new.x + 2 + w_new.width, 30, "MAIN")
+    w_main = ListWindow(1, height, w_new.x + 2 + w_new.width, width, "MAIN")
     desktop.add_window(w_main)
 
-    desktop.refresh()
+    searching = False
+    changed = True
 
     while True:
-        c = stdscr.getch()
+        if changed or new.loading or main.loading:
+            browser.update()
+            draw(desktop, w_new, w_main, browser, searching)
 
-        if c == KEY_SPACEBAR:
-            pass
-        elif c == ord("q"):
-            break
+        c = get_key(stdscr)
+        changed = c is not None
 
-        desktop.refresh()
+        if c == curses.KEY_UP:
+            browser.move(-1)
+        elif c == curses.KEY_DOWN:
+            browser.move(1)
+        elif c == curses.KEY_PPAGE:
+            browser.move(-w_new.rows)
+        elif c == curses.KEY_NPAGE:
+            browser.move(w_new.rows)
+        elif searching and c in (KEY_ENTER, KEY_ESCAPE):
+            searching = False
+        elif searching and c in KEYS_BACKSPACE:
+            browser.erase()
+        elif searching and isinstance(c, str):
+            browser.type(c)
+        elif c == "/":
+            searching = True
+        elif c == "q":
+            break
 
 
 def main(argv):
-    parser = argparse.ArgumentParser(description=HELP)
+    parser = argparse.ArgumentParser(
+        description=HELP, formatter_class=argparse.RawTextHelpFormatter
+    )
     parser.add_argument("collection_main")
     parser.add_argument("collection_new")
+    _stats.add_arguments(parser)
     args = parser.parse_args(argv)
-    curses.wrapper(run, args.collection_main, args.collection_new)
+
+    with _stats.collect(args):
+        curses.wrapper(run, args.collection_main, args.collection_new)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@
 import argparse
 import sys
 
+import _stats
 from _utils import get_attribut_names
 
 HELP = """
@@ -18,17 +19,20 @@ def main(argv):
         action="store_true",
         help="just print the name, not the file path.",
     )
+    _stats.add_arguments(parser)
     args = parser.parse_args(argv)
 
-    for path in args.files:
-        with open(path) as f:
-            text = f.read()
-            attrs = get_attribut_names(text)
-
-            if args.no_filename:
-                print("\n".join(attrs))
-            else:
-                print("\n".join(f"{attr}\t{path}" for attr in attrs))
+    with _stats.collect(args):
+        for path in args.files:
+            _stats.read(path)
+            with open(path) as f:
+                text = f.read()
+                attrs = get_attribut_names(text)
+
+                if args.no_filename:
+                    print("\n".join(attrs))
+                else:
+                    print("\n".join(f"{attr}\t{path}" for attr in attrs))
 
 
 if __name__ == "__main__":
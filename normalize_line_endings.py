@@ -3,6 +3,8 @@
 import argparse
 import sys
 
+import _stats
+
 HELP = """
 Read files, convert their line to end with just \\n
 (no \\r\\n, \\r, ...) and write them again. Accepts all
@@ -13,19 +15,30 @@ unicode extras.
 
 
 def normalize_line_endings(path):
+    """Return whether the file changed, files already normalized are not written"""
+    _stats.read(path)
     with open(path, "rb") as f:
         content = f.read()
+
+    normalized = b"".join(l + b"\n" for l in content.splitlines())
+    if normalized == content:
+        return False
+
     with open(path, "wb") as f:
-        f.writelines(l + b"\n" for l in content.splitlines())
+        f.write(normalized)
+    _stats.written(path)
+    return True
 
 
 def main(argv):
     parser = argparse.ArgumentParser(description=HELP)
     parser.add_argument("files", nargs="+")
+    _stats.add_arguments(parser)
     args = parser.parse_args(argv)
 
-    for path in args.files:
-        normalize_line_endings(path)
+    with _stats.collect(args):
+        for path in args.files:
+            normalize_line_endings(path)
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ import sys
 
 import requests
 
+import _stats
 from _utils import find_decodings, get_artisttitle, get_lyrics
 
 HELP = """
@@ -20,6 +21,7 @@ non_ascii = re.compile("[^a-zA-Z0-9,. !?-]")
 
 
 def count_results(lyrics):
+    _stats.count("web_queries")
     response = requests.get("https://songsear.ch/api/search", {"q": lyrics})
 
     try:
@@ -67,6 +69,7 @@ def guess_encoding(content):
 
 
 def fix_encoding(path, dry_run=False):
+    _stats.read(path)
     with open(path, "rb") as f:
         content = f.read()
 
@@ -78,6 +81,7 @@ def fix_encoding(path, dry_run=False):
     if not dry_run:
         with open(path, "w") as f:
             f.write(content)
+        _stats.written(path)
 
 
 def main(argv):
@@ -88,10 +92,12 @@ def main(argv):
         action="store_true",
         help="just find the encoding, do not change the file.",
     )
+    _stats.add_arguments(parser)
     args = parser.parse_args(argv)
 
-    for path in args.files:
-        fix_encoding(path)
+    with _stats.collect(args):
+        for path in args.files:
+            fix_encoding(path)
 
 
 if __name__ == "__main__":
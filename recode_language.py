@@ -1,21 +1,34 @@
 #!/usr/bin/env python3
 
 import argparse
+import bisect
+import functools
 import re
 import sys
 import traceback
+from collections import Counter, defaultdict
+from pathlib import Path
 
-from icu import LocaleData
 from langdetect import detect
 
+import _stats
+from _builtinencodings import encodings
 from _utils import find_decodings, get_artisttitle, get_lyrics
 
 HELP = """
 Try to find the correct encoding for a given ultrastar text file. Tries to
 determine which language a song is written in, get the alphabet for that
 language and find the encoding, that produces the fewest non-alphabet
-characters. Does not work well for multi-language songs.
+characters. Only the encodings able to encode the language are tried, the
+others only if none of them fits. Does not work well for multi-language songs.
 Changes the file in place.
+
+Songs from the same source usually share their encoding. With --prior N, only N
+songs of each collection, i.e. the directory containing the song directories,
+are checked like above. If most of them agree on language and encoding, the
+other songs are only checked to decode with that encoding and to produce no
+more non-alphabet characters than the sample did. Songs failing the check are
+checked on their own.
 """
 
 non_ascii = re.compile("[^a-zA-Z0-9\"',. !?~\n\r*: #&_()\\[\\]-]")
@@ -44,64 +57,259 @@ def guess_lyric_language(text, remove_non_ascii=True):
     return detect(lyrics)
 
 
+# guesses with more non-alphabet characters are checked against all encodings
+MAX_CANDIDATE_NON_ALPHABET = 1
+
+# allowed in every language
+COMMON_CHARS = "0123456789\"',. !?&~\n\r*: #_()[]…-"
+
+
+def parse_ranges(ranges):
+    """Ranges like "0041-005A 0061-007A" as a list of (start, end) codepoints"""
+    return [tuple(int(c, 16) for c in r.split("-")) for r in ranges.split()]
+
+
+def merge_ranges(ranges):
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+class AntiAlphabet:
+    """
+    Finds the characters, which are neither in the alphabet of a language nor
+    in COMMON_CHARS. The alphabet is a list of codepoint ranges, see
+    build_alphabets.py.
+    """
+
+    def __init__(self, ranges):
+        ranges = merge_ranges(ranges + [(ord(c), ord(c)) for c in COMMON_CHARS])
+        self.starts = [start for start, _ in ranges]
+        self.ends = [end for _, end in ranges]
+        self.foreign = {}
+
+    def is_foreign(self, char):
+        if char not in self.foreign:
+            codepoint = ord(char)
+            n = bisect.bisect_right(self.starts, codepoint) - 1
+            self.foreign[char] = n < 0 or codepoint > self.ends[n]
+        return self.foreign[char]
+
+    def findall(self, text):
+        """The distinct characters in text, which are not in the alphabet"""
+        return [c for c in set(text) if self.is_foreign(c)]
+
+
+@functools.cache
 def get_anti_alphabet(language):
-    data = LocaleData(language)
-    alphabet = data.getExemplarSet()
-    return re.compile(
-        "[^" + "".join(alphabet) + "0-9\"',. !?&~\n\r*: #_()\\[\\]…-]", re.IGNORECASE
-    )
+    from _alphabets import alphabets
+
+    if language in alphabets:
+        return AntiAlphabet(parse_ranges(alphabets[language]))
+
+    # not exported by build_alphabets.py, needs ICU
+    from build_alphabets import get_alphabet, get_ranges
+
+    return AntiAlphabet(get_ranges(get_alphabet(language)))
+
 
+def get_non_alphabet_chars(text, anti_alphabet):
+    lyrics = " ".join(get_lyrics(text))
+    metadata = get_artisttitle(text)
+    return set(anti_alphabet.findall(lyrics) + anti_alphabet.findall(metadata))
 
-def guess_encoding(content, anti_alphabet, verbose=False):
+
+@functools.cache
+def get_candidates(language):
+    """The encodings worth trying for a language, see build_alphabets.py"""
+    from _alphabets import candidates
+
+    return candidates[language].split() if language in candidates else encodings
+
+
+def find_best_encoding(content, anti_alphabet, candidates, verbose=False):
+    """The candidate with the fewest non-alphabet characters and their number"""
     best = None
     best_count = len(content) * 2
 
-    for encoding, text in find_decodings(content):
-        lyrics = " ".join(get_lyrics(text))
-        metadata = get_artisttitle(text)
-
-        non_alphabet_chars = set(
-            anti_alphabet.findall(lyrics) + anti_alphabet.findall(metadata)
-        )
+    for encoding, text in find_decodings(content, candidates):
+        non_alphabet_chars = get_non_alphabet_chars(text, anti_alphabet)
         non_alphabet_count = len(non_alphabet_chars)
 
         if verbose:
-            print(encoding, non_alphabet_chars, lyrics)
+            print(encoding, non_alphabet_chars, " ".join(get_lyrics(text)))
 
         if non_alphabet_count < best_count:
             best = encoding
             best_count = non_alphabet_count
 
+    return best, best_count
+
+
+def guess_encoding(content, anti_alphabet, verbose=False, candidates=encodings):
+    """
+    Find the encoding with the fewest non-alphabet characters. Only tries the
+    candidates, unless none of them has MAX_CANDIDATE_NON_ALPHABET or less.
+    """
+    best, best_count = find_best_encoding(content, anti_alphabet, candidates, verbose)
+
+    if best_count > MAX_CANDIDATE_NON_ALPHABET and candidates is not encodings:
+        _stats.count("candidate_fallbacks")
+        others = [e for e in encodings if e not in candidates]
+        other, other_count = find_best_encoding(content, anti_alphabet, others, verbose)
+        if other_count < best_count:
+            best = other
+
     if not best:
         raise Exception("could not find encoding")
 
     return best
 
 
-def fix_encoding(path, dry_run=False, verbose=False):
+def classify(model, content):
+    with _stats.stage("model"):
+        guess = model.classify(content)
+
+    _stats.count("model_hits" if guess else "model_misses")
+    return guess
+
+
+def fix_encoding(path, dry_run=False, verbose=False, model=None):
+    """
+    Recode the file, return its language, encoding and the number of distinct
+    non-alphabet characters in the result. Returns None, if nothing decodes.
+    If an EncodingModel is given, its confident guesses are used instead.
+    """
+    _stats.read(path)
     with open(path, "rb") as f:
         content = f.read()
 
-    try:
-        text = next(find_decodings(content))[1]
-    except StopIteration:
-        print(f"ERROR\tcoult not find encoding\t{path}")
-        return
+    guess = model and classify(model, content)
+    if guess:
+        encoding, language = guess
+    else:
+        try:
+            text = next(find_decodings(content))[1]
+        except StopIteration:
+            print(f"ERROR\tcoult not find encoding\t{path}")
+            return
 
     try:
-        language = guess_lyric_language(text)
+        if not guess:
+            with _stats.stage("language"):
+                language = guess_lyric_language(text)
+            with _stats.stage("encoding"):
+                encoding = guess_encoding(
+                    content,
+                    get_anti_alphabet(language),
+                    verbose,
+                    get_candidates(language),
+                )
         anti_alphabet = get_anti_alphabet(language)
-        encoding = guess_encoding(content, anti_alphabet, verbose)
         content = content.decode(encoding)
 
         if encoding not in ("ascii", "utf_8") and not dry_run:
             with open(path, "w") as f:
                 f.write(content)
+            _stats.written(path)
     except Exception as ex:
         print(f"ERROR\t{ex}\t{path}")
         raise
 
     print(f"SUCCESS\t{language}/{encoding}\t{path}")
+    return language, encoding, len(get_non_alphabet_chars(content, anti_alphabet))
+
+
+def fix_encoding_with_prior(path, prior, dry_run=False):
+    """Recode the file with the collection's encoding, if it passes the check"""
+    encoding, anti_alphabets, max_non_alphabet = prior
+
+    _stats.read(path)
+    with open(path, "rb") as f:
+        content = f.read()
+
+    try:
+        text = content.decode(encoding)
+    except ValueError:
+        return False
+
+    for language, anti_alphabet in anti_alphabets.items():
+        if len(get_non_alphabet_chars(text, anti_alphabet)) <= max_non_alphabet:
+            break
+    else:
+        return False
+
+    if encoding not in ("ascii", "utf_8") and not content.isascii() and not dry_run:
+        with open(path, "w") as f:
+            f.write(text)
+        _stats.written(path)
+
+    print(f"SUCCESS\t{language}/{encoding} (prior)\t{path}")
+    return True
+
+
+def find_prior(results):
+    """
+    The encoding most of the sample agrees on, if any, the alphabets of the
+    languages found with it and the most non-alphabet characters of a sample.
+    Pure ascii songs fit any encoding, they don't vote.
+    """
+    results = [r for r in results if r and r[1] != "ascii"]
+    votes = Counter(encoding for _, encoding, _ in results)
+    if not votes:
+        return None
+
+    encoding, count = votes.most_common(1)[0]
+    if count * 2 <= len(results):
+        return None
+
+    agreeing = [r for r in results if r[1] == encoding]
+    anti_alphabets = {
+        language: get_anti_alphabet(language) for language, _, _ in agreeing
+    }
+    max_non_alphabet = max(count for _, _, count in agreeing)
+    return encoding, anti_alphabets, max_non_alphabet
+
+
+def get_collections(paths):
+    """Group song files by the directory containing their song directory"""
+    collections = defaultdict(list)
+    for path in paths:
+        collections[Path(path).parent.parent].append(path)
+    return collections.values()
+
+
+def try_fix_encoding(path, dry_run=False, verbose=False, model=None):
+    try:
+        return fix_encoding(path, dry_run, verbose, model)
+    except Exception:
+        traceback.print_exc()
+
+
+def fix_collection(paths, sample_size, dry_run=False, verbose=False, model=None):
+    sample = paths[:: max(len(paths) // sample_size, 1)][:sample_size]
+
+    with _stats.stage("sample"):
+        prior = find_prior(
+            [try_fix_encoding(p, dry_run, verbose, model) for p in sample]
+        )
+    sampled = set(sample)
+
+    for path in paths:
+        if path in sampled:
+            continue
+
+        if prior:
+            with _stats.stage("prior"):
+                if fix_encoding_with_prior(path, prior, dry_run):
+                    continue
+
+        _stats.count("prior_misses")
+        try_fix_encoding(path, dry_run, verbose, model)
 
 
 def main(argv):
@@ -113,13 +321,44 @@ def main(argv):
         help="just find the encoding, do not change the file.",
     )
     parser.add_argument("--verbose", action="store_true")
+    parser.add_argument(
+        "--prior",
+        metavar="N",
+        type=int,
+        help="check only N songs of each collection on their own, see above",
+    )
+    parser.add_argument(
+        "--model",
+        help="guess with this model from train_encoding_model.py first, fall "
+        "back to the method above if it is not confident",
+    )
+    parser.add_argument(
+        "--min-confidence",
+        type=float,
+        help="log likelihood ratio between the best and second best encoding, "
+        "which the model needs to be confident, default: 10",
+    )
+    _stats.add_arguments(parser)
     args = parser.parse_args(argv)
 
-    for path in args.files:
-        try:
-            fix_encoding(path, args.dry_run, args.verbose)
-        except Exception as ex:
-            traceback.print_exc()
+    with _stats.collect(args):
+        model = None
+        if args.model:
+            # numpy is only needed with a model
+            from _encoding_model import MIN_CONFIDENCE, EncodingModel
+
+            min_confidence = args.min_confidence
+            if min_confidence is None:
+                min_confidence = MIN_CONFIDENCE
+            model = EncodingModel(args.model, min_confidence)
+
+        if args.prior:
+            for paths in get_collections(args.files):
+                fix_collection(paths, args.prior, args.dry_run, args.verbose, model)
+            return
+
+        for path in args.files:
+            try_fix_encoding(path, args.dry_run, args.verbose, model)
 
 
 if __name__ == "__main__":
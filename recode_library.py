@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+
+import argparse
+import curses
+import sys
+import traceback
+from collections import Counter, defaultdict
+
+import _stats
+import recode_language
+from _utils import find_decodings
+from debug_encoding import choose, init_screen
+
+HELP = """
+Like recode_language.py, but decides once for many files. In a mis-encoded
+library, the same few non-ascii bytes repeat across thousands of files. Files
+are grouped by the set of non-ascii bytes they contain. A group, whose bytes are
+a subset of exactly one larger group, is merged into that group, because any
+encoding, that works for the larger group, works for it as well.
+
+The encoding of each group is guessed like recode_language.py does, from a
+sample of its files. With --ask, the sample is shown like debug_encoding.py
+does instead: pick the encoding with ENTER or leave the group untouched with
+'q'. Each file of a group must decode with the chosen encoding, otherwise its
+encoding is guessed on its own. Pure ascii and valid UTF-8 files are skipped.
+Changes the files in place.
+"""
+
+
+def byte_signature(content):
+    """The set of non-ascii bytes in content, as a bit mask"""
+    signature = 0
+    for byte in set(content.translate(None, bytes(range(128)))):
+        signature |= 1 << byte
+    return signature
+
+
+def is_utf8(content):
+    """
+    Whether content is valid UTF-8. A group encoding like cp1252 would decode
+    such a file as well, but turn its multi-byte characters into mojibake.
+    """
+    try:
+        content.decode("utf-8")
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def bits(signature):
+    return [n for n in range(signature.bit_length()) if signature >> n & 1]
+
+
+class SignatureIndex:
+    def __init__(self, signatures):
+        self.containing = defaultdict(list)
+        for signature in signatures:
+            for byte in bits(signature):
+                self.containing[byte].append(signature)
+
+    def supersets(self, signature):
+        """All other signatures, which contain all bytes of the given one"""
+        rarest = min(bits(signature), key=lambda b: len(self.containing[b]))
+        return [
+            other
+            for other in self.containing[rarest]
+            if other != signature and signature & other == signature
+        ]
+
+
+def group_files(paths):
+    """Group the non-ascii files by their byte signatures"""
+    groups = defaultdict(list)
+
+    for path in paths:
+        _stats.read(path)
+        with open(path, "rb") as f:
+            content = f.read()
+
+        signature = byte_signature(content)
+        if signature and not is_utf8(content):
+            groups[signature].append(path)
+
+    index = SignatureIndex(groups)
+    supersets = {s: index.supersets(s) for s in groups}
+    largest = {s for s in groups if not supersets[s]}
+
+    for signature in list(groups):
+        candidates = [s for s in supersets[signature] if s in largest]
+        if len(candidates) == 1:
+            groups[candidates[0]].extend(groups.pop(signature))
+
+    return sorted(groups.values(), key=len, reverse=True)
+
+
+def sample(paths, size):
+    contents = []
+    for path in paths[:size]:
+        with open(path, "rb") as f:
+            contents.append(f.read())
+    return contents
+
+
+def guess_group_encoding(contents):
+    """
+    Like recode_language.guess_encoding, but for several files. Each file is
+    checked against the alphabet of its own language, the encoding with the
+    fewest non-alphabet characters in all files together wins.
+    """
+    non_alphabet = Counter()
+    decodable = Counter()
+    files = 0
+
+    for content in contents:
+        decodings = list(find_decodings(content))
+        try:
+            language = recode_language.guess_lyric_language(decodings[0][1])
+        except Exception:
+            continue  # no decoding or undetectable language, leave it to others
+
+        anti_alphabet = recode_language.get_anti_alphabet(language)
+        files += 1
+
+        for encoding, text in decodings:
+            chars = recode_language.get_non_alphabet_chars(text, anti_alphabet)
+            non_alphabet[encoding] += len(chars)
+            decodable[encoding] += 1
+
+    if not files:
+        raise Exception("could not find the language of any file")
+
+    # encodings, that fail for one of the files, must not win
+    candidates = [e for e in decodable if decodable[e] == files]
+    if not candidates:
+        raise Exception("could not find encoding")
+
+    return min(candidates, key=lambda e: non_alphabet[e])
+
+
+def recode(path, encoding, dry_run):
+    """Decode the file with encoding and write it, return False if that fails"""
+    with open(path, "rb") as f:
+        content = f.read()
+
+    try:
+        text = content.decode(encoding)
+    except ValueError:
+        return False
+
+    if encoding not in ("ascii", "utf_8") and not dry_run:
+        with open(path, "w") as f:
+            f.write(text)
+        _stats.written(path)
+
+    print(f"SUCCESS\tgroup/{encoding}\t{path}")
+    return True
+
+
+def recode_file(path, dry_run):
+    try:
+        recode_language.fix_encoding(path, dry_run)
+    except Exception:
+        traceback.print_exc()
+
+
+def recode_groups(groups, encodings, dry_run, fallback=True):
+    """
+    Recode all files of each group. Files of groups without an encoding are
+    guessed on their own or, without fallback, left untouched.
+    """
+    for members, encoding in zip(groups, encodings):
+        if not encoding and not fallback:
+            continue
+
+        for path in members:
+            with _stats.stage("apply"):
+                if encoding and recode(path, encoding, dry_run):
+                    continue
+
+            _stats.count("files_guessed_alone")
+            with _stats.stage("fallback"):
+                recode_file(path, dry_run)
+
+
+def ask(stdscr, groups, sample_size):
+    init_screen(stdscr)
+    encodings = []
+
+    for n, members in enumerate(groups):
+        status = f"group {n + 1}/{len(groups)}, {len(members)} files: {members[0]}"
+        content = b"\n".join(sample(members, sample_size))
+        encodings.append(choose(stdscr, content, status))
+
+    return encodings
+
+
+def guess(groups, sample_size):
+    for members in groups:
+        try:
+            encoding = guess_group_encoding(sample(members, sample_size))
+        except Exception as ex:
+            print(f"ERROR\t{ex}\tgroup of {members[0]}")
+            encoding = None
+
+        print(f"GROUP\t{encoding}\t{len(members)} files\t{members[0]}")
+        yield encoding
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=HELP)
+    parser.add_argument("files", nargs="+")
+    parser.add_argument(
+        "--ask",
+        action="store_true",
+        help="choose the encoding of each group, instead of guessing it",
+    )
+    parser.add_argument(
+        "--sample",
+        type=int,
+        default=20,
+        help="number of files per group to guess the encoding from, default: 20",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="just find the encodings, do not change the files.",
+    )
+    _stats.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with _stats.collect(args):
+        with _stats.stage("group"):
+            groups = group_files(args.files)
+        _stats.count("groups", len(groups))
+
+        with _stats.stage("resolve"):
+            if args.ask:
+                encodings = curses.wrapper(ask, groups, args.sample)
+            else:
+                encodings = list(guess(groups, args.sample))
+
+        recode_groups(groups, encodings, args.dry_run, fallback=not args.ask)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import signal
+import sys
+import threading
+from array import array
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import Levenshtein
+import numpy as np
+
+import _stats
+from _utils import get_attributes, read_header
+from integrate_collection import TrigramIndex, normalize, trigrams
+
+HELP = """
+Serve a fuzzy search over artist and title of the songs in the given libraries
+via HTTP on localhost, e.g. for a karaoke front end. Songs are ranked by the
+Levenshtein ratio integrate_collection.py uses, between the query and artist
+and title, title or artist, whichever matches best. Only the headers of the
+songs are read and decoded like integrate_collection.py does, as UTF-8 ignoring
+invalid bytes.
+
+  GET /search?q=QUERY&k=10
+
+      {"query": QUERY, "results": [{"score": 0-100, "artist": ..., "title":
+      ..., "path": ...}, ...]}
+
+  POST /songs {"paths": [PATH, ...]}
+
+      add songs or libraries to the index, or update songs, which changed.
+      Returns {"added": number of songs read, "songs": songs in the index}
+
+Songs, which can't be read, are reported on stdout:
+
+  ERROR <TAB> reason <TAB> path
+
+Queries must have at least 3 characters, not counting spaces and the like.
+benchmark_search.py measures the latency of a running server.
+"""
+
+# songs sharing the most trigrams with the query, which are ranked
+CANDIDATES = 100
+
+
+class PostingsIndex(TrigramIndex):
+    """
+    TrigramIndex with postings in arrays, which numpy counts without copying
+    them. Ids must be smaller than 2**31.
+    """
+
+    def __init__(self):
+        self.postings = defaultdict(lambda: array("i"))
+
+    def best_candidates(self, s, n):
+        """Ids of the at most n strings sharing the most trigrams with s"""
+        postings = [
+            np.frombuffer(self.postings[gram], np.int32)
+            for gram in trigrams(normalize(s))
+            if gram in self.postings
+        ]
+        if not postings:
+            return []
+
+        # small counts make the passes below cheap, queries are short
+        counts = np.bincount(np.concatenate(postings)).astype(np.uint16)
+        del postings
+
+        # binary search for the highest number of shared trigrams, that at
+        # least n strings have, which is much cheaper than sorting counts
+        low, high = 1, int(counts.max())
+        while low < high:
+            middle = (low + high + 1) // 2
+            if np.count_nonzero(counts >= middle) >= n:
+                low = middle
+            else:
+                high = middle - 1
+
+        ids = np.flatnonzero(counts >= low)
+        # on a tie, the strings added first win
+        ids = ids[np.argsort(-counts[ids].astype(np.int32), kind="stable")[:n]]
+
+        return ids.tolist()
+
+
+class SearchIndex:
+    """
+    The songs of the libraries with their normalized artist, title and both.
+    Songs, which were updated, keep their id, but their old trigrams stay in
+    the postings, which just makes them a candidate for some more queries.
+    """
+
+    def __init__(self):
+        self.index = PostingsIndex()
+        self.songs = []
+        self.keys = []
+        self.ids = {}
+        # trigrams in the postings of each song, which was updated
+        self.grams = {}
+        self.lock = threading.Lock()
+
+    def add(self, path):
+        """Add or update the song at path"""
+        header, _ = read_header(path, errors="ignore")
+        attributes = get_attributes(header)
+        artist = attributes.get("ARTIST", "")
+        title = attributes.get("TITLE", "")
+        key = f"{artist} {title}"
+        keys = (normalize(key), normalize(title), normalize(artist))
+
+        with self.lock:
+            n = self.ids.setdefault(path, len(self.songs))
+            if n == len(self.songs):
+                self.songs.append(None)
+                self.keys.append(None)
+                self.index.add(n, key)
+            elif self.songs[n] == (artist, title, path):
+                return
+            else:
+                # a song must be in each posting once, or it's counted twice
+                old = self.grams.get(n) or trigrams(self.keys[n][0])
+                new = trigrams(keys[0])
+                for gram in new - old:
+                    self.index.postings[gram].append(n)
+                self.grams[n] = old | new
+
+            self.songs[n] = (artist, title, path)
+            self.keys[n] = keys
+
+    def add_paths(self, paths):
+        """Add the songs and the songs in the libraries, return how many"""
+        added = 0
+
+        for path in get_song_paths(paths):
+            try:
+                self.add(path)
+                added += 1
+            except OSError as ex:
+                print(f"ERROR\t{ex}\t{path}", flush=True)
+
+        return added
+
+    def search(self, query, k):
+        """The best k songs as (score, artist, title, path), best first"""
+        key = normalize(query)
+        if len(key) < 3:
+            return []
+
+        # arrays can't grow while numpy looks at them
+        with self.lock:
+            candidates = self.index.best_candidates(query, CANDIDATES)
+
+        ratio = Levenshtein.ratio
+        ranked = []
+        for n in candidates:
+            both, title, artist = self.keys[n]
+            score = max(ratio(key, both), ratio(key, title), ratio(key, artist))
+            ranked.append((score, n))
+        ranked.sort(key=lambda r: (-r[0], r[1]))
+
+        return [(int(score * 100), *self.songs[n]) for score, n in ranked[:k]]
+
+
+def get_song_paths(paths):
+    for path in paths:
+        if not os.path.isdir(path):
+            yield os.path.abspath(path)
+            continue
+
+        for root, _, files in os.walk(path):
+            for name in sorted(files):
+                if name.lower().endswith(".txt"):
+                    yield os.path.abspath(os.path.join(root, name))
+
+
+class Handler(BaseHTTPRequestHandler):
+    # keep connections open, clients send many short requests, which must not
+    # wait for the acknowledgement of the previous one
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def send_json(self, data, status=200):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path != "/search":
+            self.send_json({"error": "not found"}, 404)
+            return
+
+        params = parse_qs(url.query)
+        query = params.get("q", [""])[0]
+        try:
+            k = int(params.get("k", ["10"])[0])
+        except ValueError:
+            k = 0
+        if k < 1:
+            self.send_json({"error": "k must be a positive number"}, 400)
+            return
+
+        _stats.count("queries")
+        results = self.server.index.search(query, k)
+        self.send_json(
+            {
+                "query": query,
+                "results": [
+                    {"score": score, "artist": artist, "title": title, "path": path}
+                    for score, artist, title, path in results
+                ],
+            }
+        )
+
+    def do_POST(self):
+        if urlsplit(self.path).path != "/songs":
+            self.send_json({"error": "not found"}, 404)
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            paths = json.loads(self.rfile.read(length))["paths"]
+            if not isinstance(paths, list) or not all(
+                isinstance(p, str) for p in paths
+            ):
+                raise TypeError(paths)
+        except (ValueError, KeyError, TypeError):
+            self.send_json({"error": 'expected {"paths": [...]}'}, 400)
+            return
+
+        index = self.server.index
+        added = index.add_paths(paths)
+        self.send_json({"added": added, "songs": len(index.songs)})
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(
+        description=HELP, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("libraries", nargs="*")
+    parser.add_argument(
+        "--port", type=int, default=8765, help="port to listen on, default: 8765"
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="address to listen on, default: 127.0.0.1",
+    )
+    parser.add_argument("--verbose", action="store_true", help="log all requests")
+    _stats.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    # stop like on CTRL-C, so the stats are still written
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    with _stats.collect(args):
+        index = SearchIndex()
+        with _stats.stage("load"):
+            index.add_paths(args.libraries)
+
+        server = ThreadingHTTPServer((args.host, args.port), Handler)
+        server.daemon_threads = True
+        server.index = index
+        server.verbose = args.verbose
+        print(
+            f"SUCCESS\t{len(index.songs)} songs\thttp://{args.host}:{args.port}",
+            flush=True,
+        )
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
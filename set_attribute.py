@@ -2,13 +2,15 @@
 
 import argparse
 import sys
-from contextlib import suppress
 
-from _utils import get_attribute, set_attribute
+import _stats
+import _where
+from _utils import edit_header, get_attribute, read_header
 
 HELP = """
 For a list of ultrastar text files, set an attribute like #VIDEO to the given
-value. Prints the paths of all changed files. Only accepts UTF-8 encoded files.
+value. Prints the paths of all changed files. Only the header is rewritten, it
+must be UTF-8 encoded, the rest of the file is copied unchanged.
 """
 
 
@@ -18,27 +20,27 @@ def main(argv):
     parser.add_argument("value")
     parser.add_argument("files", nargs="+")
     parser.add_argument("--search", help="only replace, if the old value matches")
+    _where.add_argument(parser)
     parser.add_argument("--dry-run", action="store_true")
+    _stats.add_arguments(parser)
     args = parser.parse_args(argv)
 
-    for path in args.files:
-        with open(path) as f:
-            text = f.read()
+    with _stats.collect(args):
+        for path in _where.select(args.files, args.where):
+            header, _ = read_header(path)
             try:
-                value = get_attribute(text, args.attribute)
-            except:
+                value = get_attribute(header, args.attribute)
+            except KeyError:
                 value = None
             if args.search and value != args.search:
                 continue
             if value == args.value:
                 continue
-            lines = set_attribute(text.splitlines(), args.attribute, args.value)
 
-        if not args.dry_run:
-            with open(path, "w") as f:
-                f.writelines(lines)
+            if not args.dry_run and not edit_header(path, {args.attribute: args.value}):
+                continue
 
-        print(path)
+            print(path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+
+import argparse
+import csv
+import itertools
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import _stats
+from _utils import NOTE_TYPES, get_attributes, iter_notes
+
+HELP = """
+Compute metrics of all songs in the given libraries and write them as a CSV
+table, one row per song:
+
+  duration          seconds from the start of the audio to the end of the last
+                    note, using #GAP and #BPM
+  pitch_range       semitones between the lowest and highest sung note, rap and
+                    freestyle notes have no pitch
+  notes_per_second  notes per second between the start of the first and the end
+                    of the last note
+  golden_ratio      share of the notes, which are golden
+  singers           number of P sections, 1 for songs without
+  words             number of words of the lyrics
+
+Unknown values, e.g. the duration of songs without #BPM, are left empty. The
+songs are parsed by --jobs processes, the metrics are computed for all songs at
+once. Songs, which can't be read, are reported on stderr:
+
+  ERROR <TAB> reason <TAB> path
+"""
+
+COLUMNS = (
+    "path",
+    "artist",
+    "title",
+    "language",
+    "duration",
+    "pitch_range",
+    "notes",
+    "notes_per_second",
+    "golden_ratio",
+    "singers",
+    "words",
+)
+
+KINDS = {kind: code for code, kind in enumerate(NOTE_TYPES)}
+GOLDEN = [KINDS["*"], KINDS["G"]]
+PITCHED = [KINDS[":"], KINDS["*"]]
+
+
+class ParsedSong:
+    """Header and notes of a song, the notes as arrays with absolute beats"""
+
+    def __init__(self, path, header, kinds, starts, lengths, pitches, singers, words):
+        self.path = path
+        self.header = header
+        self.kinds = kinds
+        self.starts = starts
+        self.lengths = lengths
+        self.pitches = pitches
+        self.singers = singers
+        self.words = words
+
+
+def parse_number(value):
+    """Numbers like "225,55" or "4318" as float, NaN if not a number"""
+    try:
+        return float(value.replace(",", "."))
+    except (AttributeError, ValueError):
+        return math.nan
+
+
+def parse_song(path):
+    """Read a song, return a ParsedSong or the reason why it can't be read"""
+    try:
+        with open(path, encoding="utf-8-sig") as f:
+            lines = f.readlines()
+    except (OSError, UnicodeDecodeError) as ex:
+        return path, str(ex)
+
+    # blank lines may separate attributes, the first note ends the header
+    header_lines = itertools.takewhile(
+        lambda line: line.startswith("#") or not line.strip(), lines
+    )
+    header = get_attributes("".join(header_lines))
+
+    relative = header.get("RELATIVE", "").lower() == "yes"
+    offset = 0
+    notes = []
+    singers = set()
+    words = 0
+    starts_word = True
+
+    for item in iter_notes(lines):
+        kind = item[0]
+
+        if kind in KINDS:
+            notes.append((KINDS[kind], offset + item[1], item[2], item[3]))
+            # words are separated by spaces before or after their syllables
+            syllable = item[4]
+            if syllable.strip() and (starts_word or syllable[0].isspace()):
+                words += 1
+            starts_word = syllable.endswith(" ")
+        elif kind == "-":
+            starts_word = True
+            if relative:
+                offset += item[1] if item[2] is None else item[2]
+        elif kind == "P":
+            singers.add(item[1])
+            starts_word = True
+            offset = 0
+
+    if not notes:
+        return path, "no notes"
+
+    kinds, starts, lengths, pitches = np.array(notes, dtype=np.int32).T
+    return ParsedSong(
+        path,
+        header,
+        kinds.astype(np.int8),
+        starts,
+        lengths,
+        pitches,
+        max(len(singers), 1),
+        words,
+    )
+
+
+def compute_metrics(songs):
+    """
+    Metrics of all songs at once, as a dict of arrays with one value per song.
+    The notes of all songs are concatenated and reduced per song.
+    """
+    counts = np.array([len(s.starts) for s in songs])
+    # every song has notes, so each one is a non-empty slice starting here
+    offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    kinds = np.concatenate([s.kinds for s in songs])
+    starts = np.concatenate([s.starts for s in songs]).astype(np.int64)
+    ends = starts + np.concatenate([s.lengths for s in songs])
+    pitches = np.concatenate([s.pitches for s in songs])
+
+    first = np.minimum.reduceat(starts, offsets)
+    last = np.maximum.reduceat(ends, offsets)
+
+    pitched = np.isin(kinds, PITCHED)
+    no_pitch = np.iinfo(np.int32)
+    lowest = np.minimum.reduceat(np.where(pitched, pitches, no_pitch.max), offsets)
+    highest = np.maximum.reduceat(np.where(pitched, pitches, no_pitch.min), offsets)
+    has_pitch = np.add.reduceat(pitched, offsets) > 0
+
+    golden = np.add.reduceat(np.isin(kinds, GOLDEN), offsets)
+
+    bpm = np.array([parse_number(s.header.get("BPM")) for s in songs])
+    gap = np.array([parse_number(s.header.get("GAP", "0")) for s in songs])
+    # ultrastar beats are quarters of the #BPM's beats
+    seconds_per_beat = 60 / (4 * bpm)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        notes_per_second = counts / ((last - first) * seconds_per_beat)
+
+    return {
+        "duration": gap / 1000 + last * seconds_per_beat,
+        "pitch_range": np.where(has_pitch, highest - lowest, -1),
+        "notes": counts,
+        "notes_per_second": np.where(last > first, notes_per_second, math.nan),
+        "golden_ratio": golden / counts,
+        "singers": np.array([s.singers for s in songs]),
+        "words": np.array([s.words for s in songs]),
+    }
+
+
+def get_song_paths(libraries):
+    for library in libraries:
+        if not os.path.isdir(library):
+            raise FileNotFoundError(library)
+
+        for root, _, files in os.walk(library):
+            for name in sorted(files):
+                if name.lower().endswith(".txt"):
+                    yield os.path.join(root, name)
+
+
+def parse_songs(paths, jobs=None):
+    """The ParsedSongs of all paths, which could be read"""
+    songs = []
+
+    with ProcessPoolExecutor(jobs) as executor:
+        for result in executor.map(parse_song, paths, chunksize=64):
+            if not isinstance(result, ParsedSong):
+                path, reason = result
+                print(f"ERROR\t{reason}\t{path}", file=sys.stderr)
+                continue
+
+            _stats.read(result.path)
+            songs.append(result)
+
+    return songs
+
+
+def format_value(value):
+    if isinstance(value, (float, np.floating)):
+        return "" if math.isnan(value) else f"{value:.3f}"
+    if isinstance(value, (int, np.integer)) and value < 0:
+        return ""
+    return value
+
+
+def write_metrics(f, songs, metrics):
+    writer = csv.writer(f)
+    writer.writerow(COLUMNS)
+
+    for n, song in enumerate(songs):
+        row = [
+            song.path,
+            song.header.get("ARTIST", ""),
+            song.header.get("TITLE", ""),
+            song.header.get("LANGUAGE", ""),
+        ]
+        row += [format_value(metrics[c][n]) for c in COLUMNS[4:]]
+        writer.writerow(row)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(
+        description=HELP, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("libraries", nargs="+")
+    parser.add_argument(
+        "--output", default="-", help="CSV file to write, default: - for stdout"
+    )
+    parser.add_argument("--jobs", type=int, help="number of processes to use")
+    _stats.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with _stats.collect(args):
+        with _stats.stage("parse"):
+            songs = parse_songs(get_song_paths(args.libraries), args.jobs)
+
+        with _stats.stage("metrics"):
+            metrics = compute_metrics(songs) if songs else None
+
+        with _stats.stage("write"):
+            if args.output == "-":
+                write_metrics(sys.stdout, songs, metrics)
+            else:
+                with open(args.output, "w", newline="") as f:
+                    write_metrics(f, songs, metrics)
+                _stats.written(args.output)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,80 @@
+import os
+
+import _stats
+from check_health import NOT_UTF8, check_health, get_columns, load_cache, main
+
+HEADER = (
+    "#TITLE:T\n#ARTIST:A\n#LANGUAGE:English\n#MP3:A - T.mp3\n"
+    "#VIDEO:A - T.mp4\n#BPM:200\n"
+)
+# after the malformed line: a note of negative length, no E line
+MALFORMED = ": 0 2 5 Hi\nX 1 2\n: 4 -2 5 ho\n"
+
+
+def write_song(tmp_path, notes):
+    path = tmp_path / "A - T.txt"
+    path.write_text(HEADER + notes)
+    (tmp_path / "A - T.mp3").write_bytes(b"")
+    (tmp_path / "A - T.mp4").write_bytes(b"")
+    return str(path)
+
+
+def test_tempo_changes(tmp_path):
+    path = write_song(tmp_path, ": 0 2 5 Hi\nB 4 300.5\n: 4 2 5 ho\nE\n")
+
+    assert check_health(path, None) == []
+
+
+def test_malformed_line_skips_later_checks(tmp_path):
+    path = write_song(tmp_path, MALFORMED)
+    (tmp_path / "A - T.mp4").unlink()
+
+    assert check_health(path, None) == ["line 8 is malformed: X 1 2"]
+
+
+def test_cache_keeps_later_checks_skipped(tmp_path):
+    path = write_song(tmp_path, MALFORMED)
+    (tmp_path / "A - T.mp4").unlink()
+    cache = load_cache(str(tmp_path / "cache.json"))
+
+    assert check_health(path, None, cache) == ["line 8 is malformed: X 1 2"]
+    misses = _stats.counters["cache_misses"]
+    assert check_health(path, None, cache) == ["line 8 is malformed: X 1 2"]
+    assert _stats.counters["cache_misses"] == misses
+
+    entry = cache["songs"][os.path.abspath(path)]
+    columns = get_columns(cache)
+    assert entry["fatal"] == "Lines of notes must be well formed"
+    for description in (
+        "There is an E line",
+        "Notes must have a positive length",
+        "File referenced in VIDEO must exist, if present",
+    ):
+        assert entry["problems"][columns[description]] is None
+
+
+def test_fixed_song_runs_skipped_checks(tmp_path):
+    path = write_song(tmp_path, MALFORMED)
+    cache = load_cache(str(tmp_path / "cache.json"))
+    check_health(path, None, cache)
+
+    with open(path, "w") as f:
+        f.write(HEADER + MALFORMED.replace("X 1 2\n", ""))
+
+    assert check_health(path, None, cache) == [
+        "there is no E line",
+        "line 8: note length -2 is not positive",
+    ]
+
+
+def test_where_keeps_undecodable_songs(tmp_path, capsys):
+    path = write_song(tmp_path, ": 0 2 5 Hi\nE\n")
+    with open(path, "rb+") as f:
+        f.write(b"#TITLE:\xe9")
+    missing = str(tmp_path / "missing.txt")
+
+    assert main([path, missing, "--where", "LANGUAGE=English"]) == 1
+
+    out, err = capsys.readouterr()
+    assert out == f"{path}\n  {NOT_UTF8}\n"
+    assert err.startswith("ERROR\t") and err.endswith(f"\t{missing}\n")
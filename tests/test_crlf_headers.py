@@ -0,0 +1,33 @@
+from fix_file_links import fix_file_links
+from set_attribute import main as set_attribute
+
+SONG = (
+    b"#TITLE:T\r\n#ARTIST:A\r\n#GENRE:Pop\r\n#MP3:A - T.mp3\r\n#BPM:200\r\n"
+    b": 0 2 5 Hi\r\nE\r\n"
+)
+
+
+def write_song(tmp_path, name="song.txt"):
+    path = tmp_path / name
+    path.write_bytes(SONG)
+    (tmp_path / "A - T.mp3").write_bytes(b"")
+    return path
+
+
+def test_fix_file_links_crlf(tmp_path, capsys):
+    path = write_song(tmp_path)
+
+    fix_file_links(str(path), keep_missing_files=False)
+
+    assert "remove MP3" not in capsys.readouterr().out
+    assert [p.name for p in tmp_path.glob("*.txt")] == ["A - T.txt"]
+    assert (tmp_path / "A - T.txt").read_bytes() == SONG
+
+
+def test_set_attribute_search_crlf(tmp_path, capsys):
+    path = write_song(tmp_path)
+
+    set_attribute(["GENRE", "Rock", str(path), "--search", "Pop"])
+
+    assert capsys.readouterr().out == f"{path}\n"
+    assert path.read_bytes() == SONG.replace(b"#GENRE:Pop", b"#GENRE:Rock")
@@ -0,0 +1,30 @@
+import pytest
+
+from _utils import parse_note_line
+
+
+@pytest.mark.parametrize(
+    "line, item",
+    [
+        (": 0 2 5 Hi\n", (":", 0, 2, 5, "Hi")),
+        ("* 2 2 7 ho \n", ("*", 2, 2, 7, "ho ")),
+        ("F 4 1 0 ~\n", ("F", 4, 1, 0, "~")),
+        ("R 5 1 0 la\n", ("R", 5, 1, 0, "la")),
+        ("G 6 1 0 la\n", ("G", 6, 1, 0, "la")),
+        ("- 8\n", ("-", 8, None)),
+        ("- 8 10\n", ("-", 8, 10)),
+        ("P1\n", ("P", 1)),
+        ("P 2\n", ("P", 2)),
+        ("B 120 300.5\n", ("B", 120, 300.5)),
+        ("B 120 300,5\r\n", ("B", 120, 300.5)),
+        ("E\n", ("E",)),
+    ],
+)
+def test_parse_note_line(line, item):
+    assert parse_note_line(line) == item
+
+
+@pytest.mark.parametrize("line", ["B 120\n", "B x 300\n", "X 1 2 3\n", "- \n"])
+def test_parse_note_line_malformed(line):
+    with pytest.raises(ValueError):
+        parse_note_line(line)
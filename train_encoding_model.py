@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+
+import _stats
+from _builtinencodings import encodings
+from _encoding_model import Trainer
+from recode_language import guess_lyric_language
+
+HELP = """
+Train the encoding classifier used by recode_language.py --model. Reads known
+good, UTF-8 encoded ultrastar files, encodes each of them in every supported
+encoding, that can represent it and learns, how often each pair of bytes with
+at least one non-ascii byte appears per encoding and language. The language of
+each file is detected like guess_language.py does. Pure ascii files and files,
+which are not UTF-8 encoded, are skipped.
+
+The more songs of a language the model has seen, the better it recognizes the
+encodings of that language.
+"""
+
+
+def train(trainer, path):
+    _stats.read(path)
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+    except UnicodeDecodeError:
+        print(f"SKIPPED\tnot utf-8\t{path}")
+        return
+
+    if text.isascii():
+        return
+
+    try:
+        language = guess_lyric_language(text, remove_non_ascii=False)
+    except Exception as ex:
+        print(f"SKIPPED\t{ex}\t{path}")
+        return
+
+    for encoding in encodings:
+        try:
+            content = text.encode(encoding)
+        except UnicodeEncodeError:
+            continue
+        trainer.add(encoding, language, content)
+
+    print(f"SUCCESS\t{language}\t{path}")
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=HELP)
+    parser.add_argument("files", nargs="+")
+    parser.add_argument(
+        "--output",
+        default="encoding_model.npz",
+        help="file to write the model to, default: encoding_model.npz",
+    )
+    _stats.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with _stats.collect(args):
+        trainer = Trainer()
+
+        for path in args.files:
+            train(trainer, path)
+
+        trainer.save(args.output)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+
+import argparse
+import ctypes
+import ctypes.util
+import io
+import json
+import os
+import select
+import signal
+import struct
+import sys
+import time
+import traceback
+from contextlib import redirect_stdout
+
+import _stats
+from check_health import check_health
+from fix_file_links import fix_file_links
+from normalize_line_endings import normalize_line_endings
+
+HELP = """
+Keep a library healthy while it changes. Watches the library for changes with
+inotify, or by polling on systems without it, and waits until a song directory
+has not changed for --debounce seconds. Then only that directory goes through
+these stages:
+
+  normalize  line endings of the song text files, see normalize_line_endings.py
+  encoding   song text files must be utf-8, see recode_language.py to fix them
+  links      fix media links of utf-8 songs, see fix_file_links.py
+  health     check utf-8 songs, see check_health.py
+
+The stages normalize and links change files, --check-only leaves them out.
+Changes made by the stages don't trigger the directory again. If inotify drops
+events, because too many arrived at once, all directories are checked again,
+but those unchanged since their last check. The problems of all songs are kept
+in the --report JSON file, which is updated after every checked directory.
+Without --scan only directories changing while watching are checked, problems
+of other songs are taken from an existing report.
+
+Prints one line per checked directory and problem:
+
+  OK <TAB> - <TAB> song directory
+  CHANGED <TAB> stage <TAB> song directory
+  PROBLEM <TAB> problem <TAB> song text file
+"""
+
+# from sys/inotify.h
+IN_MODIFY = 0x002
+IN_ATTRIB = 0x004
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_DELETE_SELF = 0x400
+IN_Q_OVERFLOW = 0x4000
+IN_IGNORED = 0x8000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+
+WATCHED_EVENTS = (
+    IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_ATTRIB
+)
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    """Reports the directories, in which files changed, using Linux inotify"""
+
+    def __init__(self, root):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.add_watch = libc.inotify_add_watch
+        self.add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+
+        self.fd = libc.inotify_init1(IN_NONBLOCK)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.root = root
+        self.directories = {}
+        self.add_tree(root)
+
+    def add_tree(self, root):
+        """Watch root and all directories below, return them"""
+        added = []
+        for directory, _, _ in os.walk(root):
+            wd = self.add_watch(self.fd, os.fsencode(directory), WATCHED_EVENTS)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                raise OSError(errno, f"inotify_add_watch failed: {os.strerror(errno)}")
+            self.directories[wd] = directory
+            added.append(directory)
+        return added
+
+    def changes(self, timeout):
+        """Directories with changes within timeout seconds"""
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return set()
+
+        changed = set()
+        data = os.read(self.fd, 1 << 16)
+        offset = 0
+
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                # events were lost, rescan everything, also new directories,
+                # which aren't watched yet
+                _stats.count("queue_overflows")
+                changed.update(self.directories.values())
+                changed.update(self.add_tree(self.root))
+                continue
+
+            directory = self.directories.get(wd)
+            if mask & IN_IGNORED:
+                self.directories.pop(wd, None)
+            if directory is None:
+                continue
+
+            changed.add(directory)
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                # a new song directory, possibly with files created before it
+                # was watched
+                changed.update(self.add_tree(os.path.join(directory, name)))
+
+        return changed
+
+
+class PollingWatcher:
+    """Reports the directories, in which files changed, by comparing stats"""
+
+    def __init__(self, root, interval):
+        self.root = root
+        self.interval = interval
+        self.snapshots = self.take_snapshots()
+
+    def take_snapshots(self):
+        return {d: snapshot(d) for d, _, _ in os.walk(self.root)}
+
+    def changes(self, timeout):
+        time.sleep(min(timeout, self.interval))
+        snapshots = self.take_snapshots()
+        changed = {
+            d
+            for d in snapshots.keys() | self.snapshots.keys()
+            if snapshots.get(d) != self.snapshots.get(d)
+        }
+        self.snapshots = snapshots
+        return changed
+
+
+def snapshot(directory):
+    """Name, size and modification time of all files in directory"""
+    try:
+        with os.scandir(directory) as entries:
+            return {
+                e.name: (e.stat().st_size, e.stat().st_mtime_ns)
+                for e in entries
+                if e.is_file()
+            }
+    except FileNotFoundError:
+        return None
+
+
+def get_watcher(root, polling_interval, force_polling):
+    if not force_polling:
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError) as ex:
+            # AttributeError: libc without inotify
+            print(f"WARNING\tinotify unavailable, polling: {ex}", file=sys.stderr)
+
+    return PollingWatcher(root, polling_interval)
+
+
+class Debouncer:
+    """Hands out directories, once they didn't change for some time"""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.pending = {}
+
+    def touch(self, directories, now):
+        for directory in directories:
+            self.pending[directory] = now
+
+    def timeout(self, now):
+        """Seconds until the next directory is due, None if none is pending"""
+        if not self.pending:
+            return None
+        return max(min(self.pending.values()) + self.delay - now, 0)
+
+    def due(self, now):
+        due = [d for d, t in self.pending.items() if now - t >= self.delay]
+        for directory in due:
+            del self.pending[directory]
+        return due
+
+
+def get_song_files(directory):
+    """The ultrastar text files in directory"""
+    songs = []
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if not name.lower().endswith(".txt") or not os.path.isfile(path):
+            continue
+
+        _stats.read(path)
+        with open(path, "rb") as f:
+            if b"#TITLE" in f.read():
+                songs.append(path)
+    return songs
+
+
+def is_utf8(path):
+    with open(path, "rb") as f:
+        content = f.read()
+    try:
+        content.decode("utf-8")
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def check_directory(directory, fix):
+    """
+    Run the stages on the songs in directory, return the changing stages, the
+    checked songs and the problems of each song
+    """
+    changed = []
+    problems = {}
+
+    if fix:
+        with _stats.stage("normalize"):
+            if any([normalize_line_endings(p) for p in get_song_files(directory)]):
+                changed.append("normalize")
+
+    with _stats.stage("encoding"):
+        checked = get_song_files(directory)
+        songs = []
+        for path in checked:
+            if is_utf8(path):
+                songs.append(path)
+            else:
+                problems[path] = ["not utf-8 encoded"]
+
+    if fix and songs:
+        before = snapshot(directory)
+        with _stats.stage("links"):
+            for path in songs:
+                # fix_file_links explains each decision on stdout
+                with redirect_stdout(io.StringIO()):
+                    fix_file_links(path, keep_missing_files=True)
+        if snapshot(directory) != before:
+            changed.append("links")
+            # the text files may have been renamed
+            checked = get_song_files(directory)
+            songs = [p for p in checked if p not in problems]
+
+    with _stats.stage("health"):
+        for path in songs:
+            found = check_health(path, None)
+            if found:
+                problems[path] = found
+
+    return changed, checked, problems
+
+
+class Report:
+    """Problems of all songs by song directory, kept in a JSON file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.problems = {}
+
+        if os.path.exists(path):
+            with open(path) as f:
+                self.problems = json.load(f)["problems"]
+
+    def update(self, directory, problems):
+        """Replace the problems of directory, return whether they changed"""
+        problems = {os.path.basename(p): found for p, found in problems.items()}
+        if self.problems.get(directory, {}) == problems:
+            return False
+
+        if problems:
+            self.problems[directory] = problems
+        else:
+            self.problems.pop(directory, None)
+        return True
+
+    def save(self):
+        report = {
+            "updated": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "songs_with_problems": sum(len(p) for p in self.problems.values()),
+            "problems": dict(sorted(self.problems.items())),
+        }
+
+        # never leave a half written report behind
+        temporary = self.path + ".tmp"
+        with open(temporary, "w") as f:
+            json.dump(report, f, indent=2)
+        os.replace(temporary, self.path)
+        _stats.written(self.path)
+
+
+def process(directory, report, fix, checked):
+    """Check directory, unless nothing changed since it was last checked"""
+    before = snapshot(directory)
+    if before is not None and checked.get(directory) == before:
+        return
+
+    if before is None:
+        problems = {}
+        checked.pop(directory, None)
+    else:
+        _stats.count("directories_checked")
+        changes, songs, problems = check_directory(directory, fix)
+        checked[directory] = snapshot(directory)
+
+        for stage in changes:
+            print(f"CHANGED\t{stage}\t{directory}")
+        for path, found in problems.items():
+            for problem in found:
+                print(f"PROBLEM\t{problem}\t{path}")
+        if songs and not problems:
+            print(f"OK\t-\t{directory}")
+
+    if report.update(directory, problems):
+        report.save()
+
+
+def watch(args):
+    report = Report(args.report)
+    watcher = get_watcher(args.library, args.interval, args.poll)
+    debouncer = Debouncer(args.debounce)
+    # snapshot of each directory after its last check
+    checked = {}
+
+    if args.scan:
+        debouncer.touch([d for d, _, _ in os.walk(args.library)], 0)
+
+    while True:
+        timeout = debouncer.timeout(time.monotonic())
+        changed = watcher.changes(args.interval if timeout is None else timeout)
+        now = time.monotonic()
+        debouncer.touch(changed, now)
+
+        for directory in debouncer.due(now):
+            try:
+                process(directory, report, not args.check_only, checked)
+            except Exception:
+                traceback.print_exc()
+            sys.stdout.flush()
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(
+        description=HELP, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("library")
+    parser.add_argument(
+        "--report",
+        default="problems.json",
+        help="JSON file to keep the problems in, default: problems.json",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=2,
+        help="seconds a directory must be unchanged before checking it, default: 2",
+    )
+    parser.add_argument(
+        "--check-only",
+        action="store_true",
+        help="don't normalize line endings or fix links, only report problems",
+    )
+    parser.add_argument(
+        "--scan", action="store_true", help="check all directories once at start"
+    )
+    parser.add_argument(
+        "--poll", action="store_true", help="poll for changes, even if inotify works"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=10,
+        help="seconds between polls, if polling, default: 10",
+    )
+    _stats.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    # stop like on CTRL-C, so the stats are still written
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    with _stats.collect(args):
+        try:
+            watch(args)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])